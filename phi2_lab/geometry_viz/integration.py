@@ -15,6 +15,7 @@ try:  # pragma: no cover - optional dependency guard
 except ModuleNotFoundError:  # pragma: no cover - allow import when torch unavailable
     torch = None  # type: ignore
 
+from ..utils.tracing import span
 from .recorder import GeometryRecorder, NoOpGeometryRecorder, get_recorder
 from .residual_sampling import (
     ResidualSamplingConfig,
@@ -146,10 +147,12 @@ def log_model_geometry(
     """Capture a snapshot of geometry metrics across model layers."""
 
     for layer_idx, layer in _iter_transformer_layers(model):
-        adapter_weight_norm, effective_rank = _compute_layer_geometry(layer_idx, layer)
-        residual_modes, sample_count = _maybe_sample_residual_modes(
-            layer_idx, residual_sampler, residual_sampling_rate
-        )
+        with span("telemetry.layer_geometry", layer=layer_idx):
+            adapter_weight_norm, effective_rank = _compute_layer_geometry(layer_idx, layer)
+        with span("telemetry.residual_modes", layer=layer_idx):
+            residual_modes, sample_count = _maybe_sample_residual_modes(
+                layer_idx, residual_sampler, residual_sampling_rate
+            )
         timeline_point = RunTimelinePoint(
             step=step,
             timestamp=time.time(),
@@ -175,7 +178,8 @@ def finalize_geometry_run(recorder: GeometryTelemetryRecorder) -> Path | None:
     summary = recorder.end_run()
     if summary is None:
         return None
-    return recorder.save()
+    with span("telemetry.save"):
+        return recorder.save()
 
 
 def build_residual_sampler(
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from typing import Iterable, Sequence
 
+from ..utils.tracing import span
 from .schema import AtlasDirection, ExperimentRecord, HeadInfo, LayerInfo, SemanticCode
 from .storage import AtlasStorage
 
@@ -26,12 +27,13 @@ class AtlasWriter:
     ) -> LayerInfo:
         """Persist a natural language summary for a layer."""
 
-        return self.storage.save_layer_info(
-            model_name=model_name,
-            layer_index=layer_index,
-            summary=summary,
-            model_description=model_description,
-        )
+        with span("atlas.layer_summary"):
+            return self.storage.save_layer_info(
+                model_name=model_name,
+                layer_index=layer_index,
+                summary=summary,
+                model_description=model_description,
+            )
 
     def write_head_annotation(
         self,
@@ -46,15 +48,16 @@ class AtlasWriter:
     ) -> HeadInfo:
         """Persist annotations for a specific attention head."""
 
-        return self.storage.save_head_info(
-            model_name=model_name,
-            layer_index=layer_index,
-            head_index=head_index,
-            note=note,
-            importance=importance,
-            behaviors=behaviors,
-            model_description=model_description,
-        )
+        with span("atlas.head_annotation"):
+            return self.storage.save_head_info(
+                model_name=model_name,
+                layer_index=layer_index,
+                head_index=head_index,
+                note=note,
+                importance=importance,
+                behaviors=behaviors,
+                model_description=model_description,
+            )
 
     # ------------------------------------------------------------------
     # Experiment helpers
@@ -71,14 +74,15 @@ class AtlasWriter:
     ) -> ExperimentRecord:
         """Store metadata and key findings for an experiment run."""
 
-        return self.storage.save_experiment_record(
-            spec_id=spec_id,
-            exp_type=exp_type,
-            payload=payload,
-            result_path=result_path,
-            key_findings=key_findings,
-            tags=tags,
-        )
+        with span("atlas.experiment_record"):
+            return self.storage.save_experiment_record(
+                spec_id=spec_id,
+                exp_type=exp_type,
+                payload=payload,
+                result_path=result_path,
+                key_findings=key_findings,
+                tags=tags,
+            )
 
     # ------------------------------------------------------------------
     # Semantic code helpers
@@ -95,14 +99,15 @@ class AtlasWriter:
     ) -> SemanticCode:
         """Register or update a semantic code entry."""
 
-        return self.storage.save_semantic_code(
-            code=code,
-            title=title,
-            summary=summary,
-            payload=payload,
-            payload_ref=payload_ref,
-            tags=tags,
-        )
+        with span("atlas.semantic_code"):
+            return self.storage.save_semantic_code(
+                code=code,
+                title=title,
+                summary=summary,
+                payload=payload,
+                payload_ref=payload_ref,
+                tags=tags,
+            )
 
     # ------------------------------------------------------------------
     # Direction helpers
@@ -122,17 +127,18 @@ class AtlasWriter:
     ) -> AtlasDirection:
         """Persist a reusable activation direction entry."""
 
-        return self.storage.save_direction(
-            model_name=model_name,
-            name=name,
-            layer_index=layer_index,
-            component=component,
-            vector=list(direction),
-            source=source,
-            score=score,
-            tags=tags,
-            model_description=model_description,
-        )
+        with span("atlas.direction"):
+            return self.storage.save_direction(
+                model_name=model_name,
+                name=name,
+                layer_index=layer_index,
+                component=component,
+                vector=list(direction),
+                source=source,
+                score=score,
+                tags=tags,
+                model_description=model_description,
+            )
 
 
 __all__ = ["AtlasWriter"]
@@ -16,11 +16,8 @@ except ModuleNotFoundError:  # pragma: no cover - graceful fallback
         Module = object
 
 
-def zero_attention_head(layer: nn.Module, head_idx: int, attn_output_tensor: Tensor) -> Tensor:
-    """Zero the contribution of a specific attention head."""
-
-    if torch is None:
-        raise RuntimeError("PyTorch is required for attention head ablations")
+def resolve_num_heads(layer: nn.Module) -> int | None:
+    """Return the attention head count exposed by ``layer`` (or its ``self_attn``)."""
 
     # Try multiple locations for num_heads (different model architectures)
     attn_module = getattr(layer, "self_attn", layer)
@@ -29,6 +26,16 @@ def zero_attention_head(layer: nn.Module, head_idx: int, attn_output_tensor: Ten
         num_heads = getattr(attn_module, "num_attention_heads", None)
     if num_heads is None and hasattr(attn_module, "config"):
         num_heads = getattr(attn_module.config, "num_attention_heads", None)
+    return num_heads
+
+
+def zero_attention_head(layer: nn.Module, head_idx: int, attn_output_tensor: Tensor) -> Tensor:
+    """Zero the contribution of a specific attention head."""
+
+    if torch is None:
+        raise RuntimeError("PyTorch is required for attention head ablations")
+
+    num_heads = resolve_num_heads(layer)
     if num_heads is None or num_heads <= head_idx:
         return attn_output_tensor
     if attn_output_tensor.ndim < 3:
@@ -40,6 +47,35 @@ def zero_attention_head(layer: nn.Module, head_idx: int, attn_output_tensor: Ten
     return view.reshape_as(attn_output_tensor)
 
 
+def mask_attention_heads(layer: nn.Module, head_mask: Tensor, attn_output_tensor: Tensor) -> Tensor:
+    """Zero heads per batch row using a ``[batch, num_heads]`` keep-mask.
+
+    Row ``r`` keeps head ``h`` when ``head_mask[r, h]`` is truthy, so a batch
+    replicated ``H`` times can ablate a different head in each replica within a
+    single forward pass.
+    """
+
+    if torch is None:
+        raise RuntimeError("PyTorch is required for attention head ablations")
+    if attn_output_tensor.ndim < 3:
+        return attn_output_tensor
+    num_heads = resolve_num_heads(layer)
+    if num_heads is None:
+        num_heads = int(head_mask.shape[-1])
+    if head_mask.ndim != 2 or head_mask.shape != (attn_output_tensor.shape[0], num_heads):
+        raise ValueError(
+            f"head_mask shape {tuple(head_mask.shape)} does not match "
+            f"[batch={attn_output_tensor.shape[0]}, num_heads={num_heads}]"
+        )
+    hidden_size = attn_output_tensor.shape[-1]
+    head_dim = hidden_size // num_heads
+    view = attn_output_tensor.view(*attn_output_tensor.shape[:-1], num_heads, head_dim)
+    keep = head_mask.to(device=view.device, dtype=torch.bool)
+    keep = keep.view(keep.shape[0], *([1] * (view.ndim - 3)), num_heads, 1)
+    masked = torch.where(keep, view, torch.zeros((), dtype=view.dtype, device=view.device))
+    return masked.reshape_as(attn_output_tensor)
+
+
 def zero_mlp_neurons(layer: nn.Module, neuron_indices: Sequence[int], mlp_output_tensor: Tensor) -> Tensor:
     """Zero the specified MLP neurons inside the output tensor."""
 
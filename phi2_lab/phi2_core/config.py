@@ -10,6 +10,7 @@ from ..utils import load_yaml_data
 
 _ALLOWED_DTYPES = {"float16", "bfloat16", "float32", "int8"}
 _ALLOWED_DEVICES = {"cpu", "cuda", "auto"}
+_ALLOWED_CPU_MODES = {"none", "dynamic_int8", "bfloat16_autocast"}
 
 
 @dataclass
@@ -29,12 +30,18 @@ class ModelConfig:
     stop_tokens: Optional[list[str]] = None
     trust_remote_code: bool = False
     use_mock: bool = True
+    cpu_mode: str = "none"
+    compile: bool = False
 
     def __post_init__(self) -> None:
         if self.device not in _ALLOWED_DEVICES:
             raise ValueError(f"Unsupported device '{self.device}'. Allowed: {_ALLOWED_DEVICES}")
         if self.dtype not in _ALLOWED_DTYPES:
             raise ValueError(f"Unsupported dtype '{self.dtype}'. Allowed: {_ALLOWED_DTYPES}")
+        if self.cpu_mode not in _ALLOWED_CPU_MODES:
+            raise ValueError(f"Unsupported cpu_mode '{self.cpu_mode}'. Allowed: {_ALLOWED_CPU_MODES}")
+        if self.cpu_mode != "none" and self.dtype != "float32":
+            raise ValueError(f"cpu_mode '{self.cpu_mode}' starts from float32 weights; set dtype to float32")
         if self.context_window <= 0:
             raise ValueError("context_window must be positive")
         if self.max_new_tokens <= 0:
@@ -132,6 +139,78 @@ class GeometryTelemetryConfig:
         return root_path
 
 
+@dataclass
+class ActivationStoreConfig:
+    """Configuration for the on-disk activation store shared by probe and geometry runs."""
+
+    enabled: bool = True
+    root: str = "./results/cache/activations"
+    max_size_mb: int = 4096
+    dtype: str = "float32"
+    pooling: str = "mean"
+
+    def __post_init__(self) -> None:
+        if self.max_size_mb < 0:
+            raise ValueError("max_size_mb must be non-negative")
+        if self.dtype not in {"float16", "float32"}:
+            raise ValueError(f"Unsupported activation store dtype '{self.dtype}'. Allowed: float16, float32")
+        if self.pooling not in {"mean", "full"}:
+            raise ValueError(f"Unsupported activation store pooling '{self.pooling}'. Allowed: mean, full")
+
+    def resolve_root(self, base: Path | None = None) -> Path:
+        root_path = Path(self.root)
+        if base is not None and not root_path.is_absolute():
+            return base / root_path
+        return root_path
+
+
+@dataclass
+class TokenizedCacheConfig:
+    """Configuration for the on-disk cache of pre-tokenized datasets (opt-in)."""
+
+    enabled: bool = False
+    root: str = "./results/cache/tokenized"
+    max_size_mb: int = 1024
+
+    def __post_init__(self) -> None:
+        if self.max_size_mb < 0:
+            raise ValueError("max_size_mb must be non-negative")
+
+    def resolve_root(self, base: Path | None = None) -> Path:
+        root_path = Path(self.root)
+        if base is not None and not root_path.is_absolute():
+            return base / root_path
+        return root_path
+
+
+@dataclass
+class BaselineStoreConfig:
+    """Configuration for the SQLite store of per-record baseline metrics."""
+
+    enabled: bool = True
+    path: str = "./results/cache/baselines.sqlite"
+
+    def resolve_path(self, base: Path | None = None) -> Path:
+        db_path = Path(self.path)
+        if base is not None and not db_path.is_absolute():
+            return base / db_path
+        return db_path
+
+
+@dataclass
+class ResultCacheConfig:
+    """Configuration for the index of finished experiment results reused by identical runs."""
+
+    enabled: bool = True
+    index: str = "./results/cache/result_index.json"
+
+    def resolve_index(self, base: Path | None = None) -> Path:
+        index_path = Path(self.index)
+        if base is not None and not index_path.is_absolute():
+            return base / index_path
+        return index_path
+
+
 @dataclass
 class PlatformConfig:
     """Configuration for the distributed platform integration."""
@@ -162,6 +241,10 @@ class AppConfig:
     geometry_telemetry: GeometryTelemetryConfig = field(default_factory=GeometryTelemetryConfig)
     platform: PlatformConfig = field(default_factory=PlatformConfig)
     geometry_viewer: GeometryViewerConfig = field(default_factory=GeometryViewerConfig)
+    tokenized_cache: TokenizedCacheConfig = field(default_factory=TokenizedCacheConfig)
+    activation_store: ActivationStoreConfig = field(default_factory=ActivationStoreConfig)
+    baseline_store: BaselineStoreConfig = field(default_factory=BaselineStoreConfig)
+    result_cache: ResultCacheConfig = field(default_factory=ResultCacheConfig)
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
@@ -184,6 +267,10 @@ def load_app_config(path: str | Path) -> AppConfig:
     telemetry_cfg = GeometryTelemetryConfig(**data.get("geometry_telemetry", {}))
     platform_cfg = PlatformConfig(**data.get("platform", {}))
     geometry_viewer_cfg = GeometryViewerConfig(**data.get("geometry_viewer", {}))
+    tokenized_cache_cfg = TokenizedCacheConfig(**data.get("tokenized_cache", {}))
+    activation_store_cfg = ActivationStoreConfig(**data.get("activation_store", {}))
+    baseline_store_cfg = BaselineStoreConfig(**data.get("baseline_store", {}))
+    result_cache_cfg = ResultCacheConfig(**data.get("result_cache", {}))
     return AppConfig(
         model=model_cfg,
         atlas=atlas_cfg,
@@ -191,6 +278,10 @@ def load_app_config(path: str | Path) -> AppConfig:
         geometry_telemetry=telemetry_cfg,
         platform=platform_cfg,
         geometry_viewer=geometry_viewer_cfg,
+        tokenized_cache=tokenized_cache_cfg,
+        activation_store=activation_store_cfg,
+        baseline_store=baseline_store_cfg,
+        result_cache=result_cache_cfg,
     )
 
 
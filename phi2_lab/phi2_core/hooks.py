@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 try:  # pragma: no cover
     import torch
@@ -14,48 +14,139 @@ except ModuleNotFoundError:  # pragma: no cover - used when PyTorch is unavailab
     class nn:  # type: ignore
         Module = object
 
-from .ablation import zero_attention_head, zero_mlp_neurons
+from .ablation import mask_attention_heads, zero_attention_head, zero_mlp_neurons
 
 
 InterventionFn = Callable[["nn.Module", "torch.Tensor"], "torch.Tensor"]
 
+REDUCTIONS = ("mean", "last", "positions", "max")
+
 
 @dataclass(frozen=True)
 class HookPoint:
-    """Identifies a location inside the transformer stack."""
+    """Identifies a location inside the transformer stack.
+
+    A recorded point with a ``reduction`` is pooled over the sequence inside
+    the hook, on the model's device, so only ``[batch, hidden]`` (or
+    ``[batch, len(positions), hidden]``) is copied to host memory:
+
+    - ``mean``: mean over non-padded tokens (float32 accumulation);
+    - ``last``: the last non-padded token of each row;
+    - ``positions``: the tokens at ``positions`` (Python indexing over the
+      padded sequence);
+    - ``max``: elementwise max over non-padded tokens.
+
+    Padding is taken from :attr:`HookSpec.attention_mask`; without one every
+    position counts.
+    """
 
     layer_idx: int
     submodule: str
     head_idx: Optional[int] = None
+    reduction: Optional[str] = None
+    positions: Optional[Tuple[int, ...]] = None
+
+    def __post_init__(self) -> None:
+        if self.reduction is not None and self.reduction not in REDUCTIONS:
+            raise ValueError(f"Unknown hook reduction '{self.reduction}'; expected one of {REDUCTIONS}")
+        if (self.reduction == "positions") != (self.positions is not None):
+            raise ValueError("HookPoint positions are required by, and only valid with, the 'positions' reduction")
 
     def key(self) -> str:
         suffix = f".head{self.head_idx}" if self.head_idx is not None else ""
+        if self.reduction == "positions":
+            suffix += ":positions" + ",".join(str(position) for position in self.positions or ())
+        elif self.reduction is not None:
+            suffix += f":{self.reduction}"
         return f"layer{self.layer_idx}.{self.submodule}{suffix}"
 
 
+def reduce_activation(
+    tensor: "torch.Tensor", point: HookPoint, attention_mask: Optional["torch.Tensor"] = None
+) -> "torch.Tensor":
+    """Apply ``point.reduction`` over the sequence axis of a ``[batch, seq, hidden]`` activation.
+
+    A ``[seq, hidden]`` activation is treated as a single row. Points without a
+    reduction return ``tensor`` unchanged.
+    """
+
+    if point.reduction is None:
+        return tensor
+    if tensor.ndim == 2:
+        tensor = tensor.unsqueeze(0)
+    if point.reduction == "positions":
+        index = torch.tensor(point.positions, device=tensor.device)
+        return tensor.index_select(1, index)
+    if attention_mask is None:
+        if point.reduction == "mean":
+            return tensor.to(torch.float32).mean(dim=1)
+        if point.reduction == "last":
+            return tensor[:, -1]
+        return tensor.amax(dim=1)
+    mask = attention_mask.reshape(tensor.shape[:2]).to(device=tensor.device)
+    if point.reduction == "mean":
+        weights = mask.to(torch.float32)
+        total = torch.bmm(weights.unsqueeze(1), tensor.to(torch.float32)).squeeze(1)
+        return total / weights.sum(dim=1, keepdim=True).clamp(min=1.0)
+    if point.reduction == "last":
+        # Highest unmasked position, so both right and left padding are handled.
+        steps = torch.arange(1, tensor.shape[1] + 1, device=tensor.device)
+        last = (mask.bool() * steps).argmax(dim=1)
+        return tensor[torch.arange(tensor.shape[0], device=tensor.device), last]
+    return tensor.masked_fill(~mask.bool()[..., None], float("-inf")).amax(dim=1)
+
+
 class AblationKind(str, Enum):
     """Enumerates supported structured ablation types."""
 
     ATTENTION_HEAD = "attention_head"
+    ATTENTION_HEAD_MASK = "attention_head_mask"
     MLP_NEURONS = "mlp_neurons"
 
 
 @dataclass
 class AblationRequest:
-    """Declarative request for zeroing a head or set of neurons."""
+    """Declarative request for zeroing a head or set of neurons.
+
+    ``ATTENTION_HEAD_MASK`` requests carry a ``[batch, num_heads]`` keep-mask in
+    ``head_mask`` instead of ``indices`` so each batch row can ablate different heads.
+    """
 
     point: HookPoint
     kind: AblationKind
     indices: List[int]
+    head_mask: Optional["torch.Tensor"] = None
 
 
 @dataclass
 class HookSpec:
-    """Defines which activations to record and modify during a forward pass."""
+    """Defines which activations to record and modify during a forward pass.
+
+    ``attention_mask`` marks the non-padded tokens of the forward's inputs for
+    recorded points that declare a :attr:`HookPoint.reduction`.
+    ``logit_positions`` is an optional ``(rows, columns)`` index pair: when
+    set, the LM head only runs on the final hidden states at those positions
+    and the forward's logits are ``[len(rows), vocab]``.
+    """
 
     record_points: List[HookPoint] = field(default_factory=list)
     ablate_points: List[AblationRequest] = field(default_factory=list)
     interventions: Dict[HookPoint, InterventionFn] = field(default_factory=dict)
+    attention_mask: Optional["torch.Tensor"] = None
+    logit_positions: Optional[Tuple["torch.Tensor", "torch.Tensor"]] = None
+
+
+def _ablate(module: nn.Module, request: AblationRequest, hidden_states: "torch.Tensor") -> "torch.Tensor":
+    if request.kind == AblationKind.ATTENTION_HEAD:
+        for idx in request.indices:
+            hidden_states = zero_attention_head(module, idx, hidden_states)
+    elif request.kind == AblationKind.ATTENTION_HEAD_MASK:
+        if request.head_mask is None:
+            raise ValueError("ATTENTION_HEAD_MASK ablations require a head_mask tensor")
+        hidden_states = mask_attention_heads(module, request.head_mask, hidden_states)
+    elif request.kind == AblationKind.MLP_NEURONS:
+        hidden_states = zero_mlp_neurons(module, request.indices, hidden_states)
+    return hidden_states
 
 
 class HookManager:
@@ -92,7 +183,7 @@ class HookManager:
         def hook(_module: nn.Module, _inputs: tuple, output) -> None:
             # Handle tuple outputs (attention returns (hidden_states, weights))
             tensor = output[0] if isinstance(output, tuple) else output
-            self.activations[point.key()] = tensor.detach().cpu()
+            self.activations[point.key()] = reduce_activation(tensor.detach(), point, self.spec.attention_mask).cpu()
 
         return hook
 
@@ -100,21 +191,8 @@ class HookManager:
         def hook(module: nn.Module, _inputs: tuple, output):
             # Handle tuple outputs (attention returns (hidden_states, weights))
             if isinstance(output, tuple):
-                hidden_states = output[0]
-                rest = output[1:]
-                if request.kind == AblationKind.ATTENTION_HEAD:
-                    for idx in request.indices:
-                        hidden_states = zero_attention_head(module, idx, hidden_states)
-                elif request.kind == AblationKind.MLP_NEURONS:
-                    hidden_states = zero_mlp_neurons(module, request.indices, hidden_states)
-                return (hidden_states,) + rest
-            else:
-                if request.kind == AblationKind.ATTENTION_HEAD:
-                    for idx in request.indices:
-                        output = zero_attention_head(module, idx, output)
-                elif request.kind == AblationKind.MLP_NEURONS:
-                    output = zero_mlp_neurons(module, request.indices, output)
-                return output
+                return (_ablate(module, request, output[0]),) + output[1:]
+            return _ablate(module, request, output)
 
         return hook
 
@@ -129,18 +207,160 @@ class HookManager:
         return hook
 
     def _resolve_module(self, point: HookPoint) -> nn.Module:
-        blocks = self._resolve_blocks()
-        if point.layer_idx >= len(blocks):
-            raise IndexError(f"Layer index {point.layer_idx} exceeds available blocks ({len(blocks)})")
-        block = blocks[point.layer_idx]
-        module = getattr(block, point.submodule)
-        if not isinstance(module, nn.Module):
-            raise ValueError(f"Resolved object for {point.submodule} is not a nn.Module")
-        return module
+        return resolve_module(self._resolve_blocks(), point)
 
     def _resolve_blocks(self) -> List[nn.Module]:
-        if hasattr(self.model, "model") and hasattr(self.model.model, "layers"):
-            return list(self.model.model.layers)
-        if hasattr(self.model, "transformer") and hasattr(self.model.transformer, "h"):
-            return list(self.model.transformer.h)
-        raise ValueError("Unable to locate transformer blocks on model")
+        return resolve_blocks(self.model)
+
+
+def resolve_blocks(model: nn.Module) -> List[nn.Module]:
+    """Return the ordered transformer blocks of ``model``."""
+
+    if hasattr(model, "model") and hasattr(model.model, "layers"):
+        return list(model.model.layers)
+    if hasattr(model, "transformer") and hasattr(model.transformer, "h"):
+        return list(model.transformer.h)
+    raise ValueError("Unable to locate transformer blocks on model")
+
+
+def resolve_module(blocks: List[nn.Module], point: HookPoint) -> nn.Module:
+    """Return the submodule of ``blocks`` addressed by ``point``."""
+
+    if point.layer_idx >= len(blocks):
+        raise IndexError(f"Layer index {point.layer_idx} exceeds available blocks ({len(blocks)})")
+    block = blocks[point.layer_idx]
+    module = getattr(block, point.submodule)
+    if not isinstance(module, nn.Module):
+        raise ValueError(f"Resolved object for {point.submodule} is not a nn.Module")
+    return module
+
+
+@dataclass
+class _DispatchState:
+    """Actions a dispatch hook performs on the next forward pass."""
+
+    records: List[HookPoint] = field(default_factory=list)
+    ablations: List[AblationRequest] = field(default_factory=list)
+    interventions: List[InterventionFn] = field(default_factory=list)
+    attention_mask: Optional["torch.Tensor"] = None
+
+    def clear(self) -> None:
+        self.records.clear()
+        self.ablations.clear()
+        self.interventions.clear()
+        self.attention_mask = None
+
+
+class HookRegistry:
+    """Long-lived hook installation toggled between forwards.
+
+    Unlike :class:`HookManager`, which registers and removes one hook per point
+    around every forward, the registry installs a single dispatch hook per
+    touched ``(layer, submodule)`` the first time it is needed and keeps it for
+    the registry's lifetime. :meth:`apply` only rewrites the cheap per-module
+    :class:`_DispatchState`, so every point that targets the same module is
+    served by one hook call. Within that call recordings see the unmodified
+    output, then ablations and interventions are applied in spec order, which
+    matches the registration order used by :class:`HookManager`.
+    """
+
+    def __init__(self, model: nn.Module) -> None:
+        if torch is None:
+            raise RuntimeError("PyTorch is required for hook registration")
+        self.model = model
+        self.activations: Dict[str, Any] = {}
+        self._blocks = resolve_blocks(model)
+        self._states: Dict[tuple, _DispatchState] = {}
+        self._handles: List[Any] = []
+        self._active: List[_DispatchState] = []
+
+    @property
+    def installed_count(self) -> int:
+        """Number of dispatch hooks currently installed on the model."""
+
+        return len(self._handles)
+
+    def install(self, points: List[HookPoint]) -> None:
+        """Install dispatch hooks for ``points`` ahead of the first forward."""
+
+        for point in points:
+            self._state_for(point)
+
+    def apply(self, spec: HookSpec) -> None:
+        """Activate the actions described by ``spec`` for the next forward."""
+
+        self.clear()
+        self.activations = {}
+        for point in spec.record_points:
+            state = self._activate(point)
+            state.records.append(point)
+            state.attention_mask = spec.attention_mask
+        for request in spec.ablate_points:
+            self._activate(request.point).ablations.append(request)
+        for point, fn in spec.interventions.items():
+            self._activate(point).interventions.append(fn)
+
+    def clear(self) -> None:
+        """Deactivate every dispatch hook without removing it."""
+
+        for state in self._active:
+            state.clear()
+        self._active.clear()
+
+    def remove(self) -> None:
+        for handle in self._handles:
+            handle.remove()
+        self._handles.clear()
+        self._states.clear()
+        self._active.clear()
+
+    def __enter__(self) -> "HookRegistry":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.remove()
+
+    def _activate(self, point: HookPoint) -> _DispatchState:
+        state = self._state_for(point)
+        if not (state.records or state.ablations or state.interventions):
+            self._active.append(state)
+        return state
+
+    def _state_for(self, point: HookPoint) -> _DispatchState:
+        module_key = (point.layer_idx, point.submodule)
+        state = self._states.get(module_key)
+        if state is None:
+            module = resolve_module(self._blocks, point)
+            state = _DispatchState()
+            self._handles.append(module.register_forward_hook(self._dispatch(state)))
+            self._states[module_key] = state
+        return state
+
+    def _dispatch(self, state: _DispatchState) -> Callable[..., Any]:
+        def hook(module: nn.Module, _inputs: tuple, output):
+            if not (state.records or state.ablations or state.interventions):
+                return None
+            # Handle tuple outputs (attention returns (hidden_states, weights))
+            is_tuple = isinstance(output, tuple)
+            hidden_states = output[0] if is_tuple else output
+            if state.records:
+                detached = hidden_states.detach()
+                recorded = None
+                for point in state.records:
+                    if point.reduction is not None:
+                        self.activations[point.key()] = reduce_activation(
+                            detached, point, state.attention_mask
+                        ).cpu()
+                        continue
+                    if recorded is None:
+                        recorded = detached.cpu()
+                    self.activations[point.key()] = recorded
+            if not (state.ablations or state.interventions):
+                return None
+            for request in state.ablations:
+                hidden_states = _ablate(module, request, hidden_states)
+            for fn in state.interventions:
+                hidden_states = fn(module, hidden_states)
+            return (hidden_states,) + output[1:] if is_tuple else hidden_states
+
+        return hook
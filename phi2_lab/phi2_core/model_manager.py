@@ -1,10 +1,15 @@
 """Shared Phi-2 model manager with generation and hook-aware forward APIs."""
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
+import warnings
+import zlib
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from types import SimpleNamespace
 
@@ -26,12 +31,17 @@ except Exception:  # pragma: no cover - runtime-friendly fallback
     AutoModelForCausalLM = None  # type: ignore
     AutoTokenizer = None  # type: ignore
 
+from ..utils.tracing import span
 from .config import ModelConfig
-from .hooks import HookSpec, HookManager
+from .hooks import HookManager, HookPoint, HookRegistry, HookSpec, resolve_blocks
 
 logger = logging.getLogger(__name__)
 
 
+class _StopForward(Exception):
+    """Raised from a hook to abandon the rest of a forward pass."""
+
+
 @dataclass
 class Phi2Resources:
     """Container bundling model, tokenizer, and associated metadata."""
@@ -74,7 +84,12 @@ class _MockPhi2Model(nn.Module):
 
     def __init__(self, vocab_size: int = 128, hidden_size: int = 32, num_layers: int = 2, num_heads: int = 4) -> None:
         super().__init__()
-        self.config = SimpleNamespace(num_attention_heads=num_heads)
+        self.config = SimpleNamespace(
+            num_attention_heads=num_heads,
+            num_hidden_layers=num_layers,
+            hidden_size=hidden_size,
+            vocab_size=vocab_size,
+        )
         self.embed = nn.Embedding(vocab_size, hidden_size)
         self.layers = nn.ModuleList([_MockBlock(hidden_size, num_heads) for _ in range(num_layers)])
         self.model = SimpleNamespace(layers=self.layers)
@@ -104,15 +119,20 @@ class _MockPhi2Model(nn.Module):
 
 
 class _MockTokenizer:
-    """Whitespace tokenizer that mirrors the minimal HF tokenizer interface used here."""
+    """Whitespace tokenizer that mirrors the minimal HF tokenizer interface used here.
+
+    Token ids are a stable hash of the token text folded into ``1..vocab_size-1``
+    (``0`` is left for padding), so ids match across processes and never
+    exceed the mock model's embedding table.
+    """
 
-    def __init__(self) -> None:
-        self.vocab: Dict[str, int] = {}
+    name_or_path = "mock-phi2-whitespace-crc32"
+
+    def __init__(self, vocab_size: int = 128) -> None:
+        self.vocab_size = vocab_size
 
     def _encode_token(self, token: str) -> int:
-        if token not in self.vocab:
-            self.vocab[token] = len(self.vocab) + 1
-        return self.vocab[token]
+        return zlib.crc32(token.encode("utf-8")) % (self.vocab_size - 1) + 1
 
     def __call__(
         self,
@@ -136,6 +156,39 @@ class _MockTokenizer:
         return {"input_ids": input_ids, "attention_mask": attention_mask}
 
 
+def _gather_positions(positions: Tuple[Any, Any]) -> Callable[..., Any]:
+    """LM head pre-hook keeping only the ``(rows, columns)`` hidden states of a ``[batch, seq, hidden]`` input."""
+
+    def hook(_module: nn.Module, args: tuple) -> Optional[tuple]:
+        hidden = args[0]
+        if hidden.ndim != 3:
+            return None
+        rows, columns = (index.to(hidden.device) for index in positions)
+        return (hidden[rows, columns],) + args[1:]
+
+    return hook
+
+
+def _resolve_final_norm(model: nn.Module) -> Optional[nn.Module]:
+    """Return the norm applied between the last block and the LM head, if any."""
+
+    inner = getattr(model, "model", None)
+    for owner, name in ((inner, "final_layernorm"), (inner, "norm"), (getattr(model, "transformer", None), "ln_f")):
+        module = getattr(owner, name, None) if owner is not None else None
+        if isinstance(module, nn.Module):
+            return module
+    return None
+
+
+def _cpu_supports_bfloat16() -> bool:
+    """Whether oneDNN has native bfloat16 kernels for this CPU (AVX512-BF16/AMX)."""
+
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except (AttributeError, RuntimeError):  # pragma: no cover - older or non-x86 builds
+        return False
+
+
 class Phi2ModelManager:
     """Singleton responsible for lazily loading and serving the Phi-2 model."""
 
@@ -144,6 +197,9 @@ class Phi2ModelManager:
     def __init__(self, cfg: ModelConfig) -> None:
         self.cfg = cfg
         self._resources: Optional[Phi2Resources] = None
+        self._hook_registry: Optional[HookRegistry] = None
+        self._weights_fingerprint: Optional[Tuple[Any, str]] = None
+        self._autocast_dtype: Any = None
 
     @staticmethod
     def _project_root() -> Path:
@@ -186,12 +242,16 @@ class Phi2ModelManager:
         falling back to CPU. The configured ``dtype`` is forwarded to
         ``from_pretrained`` (including quantization flags for int8) and applied
         after loading so that model parameters match the requested precision on
-        the chosen device.
+        the chosen device. ``cpu_mode`` and ``compile`` are applied last (see
+        :meth:`_apply_cpu_mode`).
         """
 
         if self._resources is not None:
             return self._resources
+        with span("model.load"):
+            return self._load_resources()
 
+    def _load_resources(self) -> Phi2Resources:
         if torch is not None:
             requested = self.cfg.device
             resolved = requested
@@ -276,9 +336,63 @@ class Phi2ModelManager:
                 else:
                     model.to(device)
 
+        model = self._apply_cpu_mode(model, device)
         self._resources = Phi2Resources(model=model, tokenizer=tokenizer, device=device, config=self.cfg)
         return self._resources
 
+    def _apply_cpu_mode(self, model: Optional[nn.Module], device: Any) -> Optional[nn.Module]:
+        """Apply the CPU execution mode and optional compilation to a loaded float32 model.
+
+        ``dynamic_int8`` swaps every ``nn.Linear`` for a dynamically quantized
+        int8 equivalent in place (weights quantized once, activations per
+        call); submodule paths are unchanged, so hook points still resolve.
+        Quantized layers have no autograd support, so
+        :meth:`forward_with_gradients` refuses to run. ``bfloat16_autocast`` keeps
+        float32 weights and runs hooked forwards and generation under CPU
+        autocast; it falls back to float32 when the CPU lacks native bfloat16
+        kernels. ``compile`` compiles the top-level module in place with
+        ``nn.Module.compile``, so the module tree and its forward hooks are
+        kept. The compiled forward traces with TorchDynamo guarding on
+        submodule hooks (patched around this model's calls only, not process
+        wide), otherwise a graph traced before a hook was registered keeps
+        running without it; hook configurations that change between forwards
+        therefore trigger recompiles until TorchDynamo's cache limit, after
+        which it runs eagerly.
+        """
+
+        if torch is None or model is None:
+            return model
+        mode = self.cfg.cpu_mode
+        if mode != "none" and torch.device(device).type != "cpu":
+            logger.warning("cpu_mode=%s only applies on CPU; ignoring it on %s", mode, device)
+            mode = "none"
+        if mode == "dynamic_int8":
+            with warnings.catch_warnings():
+                # torch.ao eager quantization is deprecated in favour of torchao, which is not a dependency here.
+                warnings.simplefilter("ignore", DeprecationWarning)
+                warnings.filterwarnings("ignore", message=".*quantize_per_tensor", category=UserWarning)
+                model = torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8, inplace=True)
+            logger.info("Applied dynamic int8 quantization to Linear layers")
+        elif mode == "bfloat16_autocast":
+            if _cpu_supports_bfloat16():
+                self._autocast_dtype = torch.bfloat16
+                logger.info("Running forwards under bfloat16 CPU autocast")
+            else:
+                logger.warning("CPU has no native bfloat16 kernels; cpu_mode=bfloat16_autocast runs in float32")
+        if self.cfg.compile:
+            model.compile()
+            # Dynamo skips guards on submodule hooks by default, which would leave
+            # persistent and truncating hooks installed after the first compile unseen.
+            guard_hooks = torch._dynamo.config.patch(skip_nnmodule_hook_guards=False)
+            model._compiled_call_impl = guard_hooks(model._compiled_call_impl)
+            logger.info("Compiled model forward with torch.compile")
+        return model
+
+    def _autocast(self) -> Any:
+        if self._autocast_dtype is None:
+            return nullcontext()
+        return torch.autocast("cpu", dtype=self._autocast_dtype)
+
     def replace_model(self, model: nn.Module) -> None:
         """Replace the cached model instance (used when adapters wrap the base model)."""
         if self._resources is None:
@@ -290,6 +404,64 @@ class Phi2ModelManager:
             config=self._resources.config,
         )
 
+    def weights_fingerprint(self) -> str:
+        """Return a cheap identity for the loaded weights.
+
+        Hashes every parameter's name, shape and dtype plus a strided sample of
+        64 values, so distinct checkpoints (or randomly initialised mock models)
+        get distinct fingerprints without reading every weight. Memoized per
+        model object; in-place weight updates are not detected.
+        """
+
+        resources = self.load()
+        model = resources.model
+        if model is None:
+            raise RuntimeError("Model is not loaded")
+        cached = self._weights_fingerprint
+        if cached is not None and cached[0] is model:
+            return cached[1]
+        digest = hashlib.sha256(f"{type(model).__module__}.{type(model).__qualname__}".encode("utf-8"))
+        if self.cfg.cpu_mode != "none":
+            # Same weights, different numerics: keep caches keyed on this apart per execution mode.
+            digest.update(f"cpu_mode={self.cfg.cpu_mode}:{self._autocast_dtype}".encode("utf-8"))
+        if torch is not None:
+            with torch.no_grad():
+                for name, param in model.named_parameters():
+                    flat = param.detach().reshape(-1)
+                    sample = flat[:: max(1, flat.numel() // 64)][:64].float().cpu().numpy()
+                    digest.update(f"{name}:{tuple(param.shape)}:{param.dtype}".encode("utf-8"))
+                    digest.update(sample.tobytes())
+        fingerprint = digest.hexdigest()
+        self._weights_fingerprint = (model, fingerprint)
+        return fingerprint
+
+    @property
+    def loaded(self) -> bool:
+        return self._resources is not None
+
+    def checkpoint_identity(self) -> Optional[str]:
+        """Return an identity for the local checkpoint :meth:`load` reads, without loading it.
+
+        Hashes the model config plus the name, size and mtime of every file in
+        the checkpoint directory. ``None`` when weights only become known by
+        loading: the mock model, hub-only sources and a load that fell back to
+        the mock model.
+        """
+
+        if self.cfg.use_mock or torch is None or AutoModelForCausalLM is None:
+            return None
+        if self._resources is not None and isinstance(self._resources.model, _MockPhi2Model):
+            return None
+        source = self._resolve_local_source()
+        if source is None:
+            return None
+        digest = hashlib.sha256(json.dumps(asdict(self.cfg), sort_keys=True).encode("utf-8"))
+        for path in sorted(source.iterdir()):
+            if path.is_file():
+                stat = path.stat()
+                digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+        return digest.hexdigest()
+
     # pylint: disable=too-many-arguments
     def generate(
         self,
@@ -338,7 +510,7 @@ class Phi2ModelManager:
                 max_length=allowed_prompt_tokens,
             )
         inputs = inputs.to(resources.device)
-        with torch.no_grad():
+        with torch.no_grad(), self._autocast():
             output_ids = model.generate(
                 **inputs,
                 max_new_tokens=max_new_tokens,
@@ -361,13 +533,302 @@ class Phi2ModelManager:
         if torch is None:
             raise RuntimeError("PyTorch is required for hook-based execution")
 
-        manager = HookManager(model, hook_spec)
-        manager.register()
+        return self._run_with_hooks(model, hook_spec, lambda: model(**inputs))
+
+    def record_activations(self, inputs: Dict[str, Any], hook_spec: HookSpec) -> Dict[str, Any]:
+        """Run a hooked forward only as deep as ``hook_spec`` needs and return its recorded activations.
+
+        The forward is abandoned right after the decoder block holding the
+        deepest recorded :class:`HookPoint`, so later blocks, the final norm
+        and the LM head never run. Ablations and interventions at or above that
+        block still apply; deeper ones cannot affect the recordings. Use
+        :meth:`forward_with_hooks` when the logits are needed.
+        """
+
+        resources = self.load()
+        model = resources.model
+        if model is None:
+            raise RuntimeError("Model is not loaded")
+        if torch is None:
+            raise RuntimeError("PyTorch is required for hook-based execution")
+        if not hook_spec.record_points:
+            return {}
+        blocks = resolve_blocks(model)
+        deepest = max(point.layer_idx for point in hook_spec.record_points)
+        if not 0 <= deepest < len(blocks):
+            raise IndexError(f"Layer index {deepest} exceeds available blocks ({len(blocks)})")
+
+        def _stop(_module: nn.Module, _args: tuple, _output: Any) -> None:
+            raise _StopForward
+
+        def _truncated() -> None:
+            try:
+                model(**{**inputs, "use_cache": False})
+            except _StopForward:
+                pass
+
+        handle = blocks[deepest].register_forward_hook(_stop)
+        try:
+            _outputs, activations = self._run_with_hooks(model, hook_spec, _truncated)
+        finally:
+            handle.remove()
+        return activations
+
+    def capture_block_inputs(
+        self, inputs: Dict[str, Any], hook_spec: HookSpec, layers: Sequence[int]
+    ) -> Tuple[Any, Dict[str, Any], Dict[int, Any]]:
+        """Run a hooked forward and also return the hidden state entering each of ``layers``.
+
+        The captured tensors are the residual stream at the input of the
+        decoder blocks and can be passed back to :meth:`forward_from_layer`.
+        """
+
+        resources = self.load()
+        model = resources.model
+        if model is None:
+            raise RuntimeError("Model is not loaded")
+        if torch is None:
+            raise RuntimeError("PyTorch is required for hook-based execution")
+        blocks = resolve_blocks(model)
+        captured: Dict[int, Any] = {}
+        handles = []
+
+        def _capture(layer_idx: int):
+            def hook(_module: nn.Module, args: tuple, kwargs: Dict[str, Any]) -> None:
+                hidden = args[0] if args else kwargs["hidden_states"]
+                captured[layer_idx] = hidden.detach()
+
+            return hook
+
+        for layer_idx in sorted(set(layers)):
+            if 0 <= layer_idx < len(blocks):
+                handle = blocks[layer_idx].register_forward_pre_hook(_capture(layer_idx), with_kwargs=True)
+                handles.append(handle)
+        try:
+            outputs, activations = self.forward_with_hooks(inputs, hook_spec)
+        finally:
+            for handle in handles:
+                handle.remove()
+        return outputs, activations, captured
+
+    def record_block_inputs(self, inputs: Dict[str, Any], layers: Sequence[int]) -> Dict[int, Any]:
+        """Return the hidden state entering each of ``layers`` without finishing the forward.
+
+        Like :meth:`record_activations`, the forward is abandoned as soon as it
+        has what it needs: here, on entering the deepest of ``layers``, so that
+        block, everything after it and the LM head never run. The captured
+        tensors match :meth:`capture_block_inputs` for the same inputs.
+        """
+
+        resources = self.load()
+        model = resources.model
+        if model is None:
+            raise RuntimeError("Model is not loaded")
+        if torch is None:
+            raise RuntimeError("PyTorch is required for hook-based execution")
+        blocks = resolve_blocks(model)
+        targets = sorted({layer_idx for layer_idx in layers if 0 <= layer_idx < len(blocks)})
+        if not targets:
+            return {}
+        captured: Dict[int, Any] = {}
+
+        def _capture(layer_idx: int):
+            def hook(_module: nn.Module, args: tuple, kwargs: Dict[str, Any]) -> None:
+                hidden = args[0] if args else kwargs["hidden_states"]
+                captured[layer_idx] = hidden.detach()
+                if layer_idx == targets[-1]:
+                    raise _StopForward
+
+            return hook
+
+        def _truncated() -> None:
+            try:
+                model(**{**inputs, "use_cache": False})
+            except _StopForward:
+                pass
+
+        handles = [
+            blocks[layer_idx].register_forward_pre_hook(_capture(layer_idx), with_kwargs=True) for layer_idx in targets
+        ]
+        try:
+            self._run_with_hooks(model, HookSpec(), _truncated)
+        finally:
+            for handle in handles:
+                handle.remove()
+        return captured
+
+    def forward_from_layer(
+        self, inputs: Dict[str, Any], layer_idx: int, hidden_states: Any, hook_spec: HookSpec
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Resume a forward at decoder block ``layer_idx`` from a cached residual stream.
+
+        Blocks below ``layer_idx`` are skipped: the block call arguments
+        (attention mask, position ids, rotary embeddings, ...) are taken from a
+        forward that is abandoned as soon as it reaches the first block, so only
+        the embedding and mask preparation run before the cached state is fed
+        into blocks ``layer_idx..N`` followed by the final norm and LM head.
+        Returns logits only (``loss`` is ``None``).
+        """
+
+        resources = self.load()
+        model = resources.model
+        if model is None:
+            raise RuntimeError("Model is not loaded")
+        if torch is None:
+            raise RuntimeError("PyTorch is required for hook-based execution")
+        blocks = resolve_blocks(model)
+        if not 0 <= layer_idx < len(blocks):
+            raise IndexError(f"Layer index {layer_idx} exceeds available blocks ({len(blocks)})")
+        block_args = self._capture_block_call(model, blocks[0], inputs)
+
+        def _resume() -> Any:
+            args, kwargs = block_args
+            hidden = hidden_states
+            for block in blocks[layer_idx:]:
+                if args:
+                    output = block(hidden, *args[1:], **kwargs)
+                else:
+                    output = block(**{**kwargs, "hidden_states": hidden})
+                hidden = output[0] if isinstance(output, tuple) else output
+            final_norm = _resolve_final_norm(model)
+            if final_norm is not None:
+                hidden = final_norm(hidden)
+            return SimpleNamespace(logits=model.lm_head(hidden), loss=None)
+
+        return self._run_with_hooks(model, hook_spec, _resume)
+
+    def forward_with_gradients(
+        self,
+        inputs: Dict[str, Any],
+        points: Sequence[HookPoint],
+        loss_fn: Callable[[Any], Any],
+    ) -> Tuple[Any, Dict[str, Tuple[Any, Any]]]:
+        """Run one forward and one backward pass, returning activations and their gradients.
+
+        ``loss_fn`` maps the model outputs to a scalar tensor. The result maps
+        each ``point.key()`` to a detached ``(activation, d loss / d activation)``
+        pair on the model device. Gradients are taken with
+        :func:`torch.autograd.grad`, so parameter ``.grad`` buffers are left
+        untouched; the residual stream entering the first block is made to
+        require grad so frozen or quantised weights still yield a graph.
+        """
+
+        resources = self.load()
+        model = resources.model
+        if model is None:
+            raise RuntimeError("Model is not loaded")
+        if torch is None:
+            raise RuntimeError("PyTorch is required for hook-based execution")
+        if self.cfg.cpu_mode == "dynamic_int8":
+            raise RuntimeError("Dynamically quantized Linear layers have no gradients; use cpu_mode 'none'")
+        captured: Dict[str, Any] = {}
+
+        def _capture(key: str):
+            def fn(_module: nn.Module, tensor: Any) -> Any:
+                captured[key] = tensor
+                return tensor
+
+            return fn
+
+        def _require_grad(_module: nn.Module, args: tuple, kwargs: Dict[str, Any]):
+            if args and not args[0].requires_grad:
+                return (args[0].detach().requires_grad_(True),) + args[1:], kwargs
+            if not args and not kwargs["hidden_states"].requires_grad:
+                return args, {**kwargs, "hidden_states": kwargs["hidden_states"].detach().requires_grad_(True)}
+            return None
+
+        hook_spec = HookSpec(interventions={point: _capture(point.key()) for point in points})
+        handle = resolve_blocks(model)[0].register_forward_pre_hook(_require_grad, with_kwargs=True)
+        try:
+            with torch.enable_grad():
+                outputs, _ = self._run_with_hooks(model, hook_spec, lambda: model(**inputs))
+                loss = loss_fn(outputs)
+                keys = [point.key() for point in points]
+                with span("backward"):
+                    grads = torch.autograd.grad(loss, [captured[key] for key in keys], allow_unused=True)
+        finally:
+            handle.remove()
+        result: Dict[str, Tuple[Any, Any]] = {}
+        for key, grad in zip(keys, grads):
+            activation = captured[key].detach()
+            result[key] = (activation, torch.zeros_like(activation) if grad is None else grad.detach())
+        return outputs, result
+
+    @staticmethod
+    def _capture_block_call(
+        model: nn.Module, first_block: nn.Module, inputs: Dict[str, Any]
+    ) -> Tuple[tuple, Dict[str, Any]]:
+        captured: List[Tuple[tuple, Dict[str, Any]]] = []
+
+        def hook(_module: nn.Module, args: tuple, kwargs: Dict[str, Any]) -> None:
+            captured.append((args, kwargs))
+            raise _StopForward
+
+        handle = first_block.register_forward_pre_hook(hook, with_kwargs=True)
+        try:
+            model(**{**inputs, "use_cache": False})
+        except _StopForward:
+            pass
+        finally:
+            handle.remove()
+        if not captured:
+            raise RuntimeError("Model forward did not reach its first decoder block")
+        return captured[0]
+
+    def _run_with_hooks(
+        self, model: nn.Module, hook_spec: HookSpec, fn: Callable[[], Any]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        gather = None
+        lm_head = getattr(model, "lm_head", None)
+        if hook_spec.logit_positions is not None and isinstance(lm_head, nn.Module):
+            gather = lm_head.register_forward_pre_hook(_gather_positions(hook_spec.logit_positions))
+        try:
+            registry = self._hook_registry
+            if registry is not None and registry.model is model:
+                with span("hooks.register"):
+                    registry.apply(hook_spec)
+                try:
+                    with span("forward"), self._autocast():
+                        outputs = fn()
+                finally:
+                    registry.clear()
+                return outputs, registry.activations
+
+            manager = HookManager(model, hook_spec)
+            with span("hooks.register"):
+                manager.register()
+            try:
+                with span("forward"), self._autocast():
+                    outputs = fn()
+            finally:
+                manager.remove()
+            return outputs, manager.activations
+        finally:
+            if gather is not None:
+                gather.remove()
+
+    @contextmanager
+    def persistent_hooks(self) -> Iterator[Optional[HookRegistry]]:
+        """Serve :meth:`forward_with_hooks` from one long-lived :class:`HookRegistry`.
+
+        Dispatch hooks are installed lazily on first use and removed when the
+        context exits. Nested use reuses the outer registry.
+        """
+
+        if self._hook_registry is not None:
+            yield self._hook_registry
+            return
+        resources = self.load()
+        if torch is None or resources.model is None:
+            yield None
+            return
+        registry = HookRegistry(resources.model)
+        self._hook_registry = registry
         try:
-            outputs = model(**inputs)
+            yield registry
         finally:
-            manager.remove()
-        return outputs, manager.activations
+            self._hook_registry = None
+            registry.remove()
 
     def _mock_generate(self, prompt: str, max_new_tokens: int) -> str:
         snippet = prompt.strip().splitlines()[-1] if prompt.strip() else ""
@@ -0,0 +1,229 @@
+"""Memory-mapped, size-bounded store of hook activations reused across runs."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from ..phi2_core.config import ActivationStoreConfig
+
+logger = logging.getLogger(__name__)
+
+DATA_FILE = "activations.bin"
+INDEX_FILE = "index.npy"
+META_FILE = "meta.json"
+FORMAT_VERSION = 1
+
+
+class ActivationStore:
+    """Stores per-record activations of one hook point as a memory-mapped array.
+
+    Each entry lives in ``root/<key>/``. With ``pooling="mean"`` the data
+    file is a ``[records, dim]`` array of sequence-mean activations; with
+    ``pooling="full"`` it is a ``[total_tokens, dim]`` array of every
+    position, and ``index.npy`` holds each record's ``(offset, length)``.
+    Values are stored as ``dtype`` (float32 or float16). Runs using the store
+    see fresh activations cast through ``dtype`` too (see :meth:`round_trip`),
+    so float16 halves the store's size at the cost of rounding every result.
+    An entry holding at least the requested number of records is a hit.
+
+    The store is bounded by ``max_bytes``: after each write the least
+    recently used entries (by ``meta.json`` mtime, refreshed on every hit)
+    are deleted until the total size fits.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        max_bytes: int,
+        dtype: str = "float32",
+        pooling: str = "mean",
+    ) -> None:
+        if pooling not in {"mean", "full"}:
+            raise ValueError(f"Unsupported pooling '{pooling}'")
+        self.root = Path(root)
+        self.max_bytes = max(0, int(max_bytes))
+        self.dtype = np.dtype(dtype)
+        self.pooling = pooling
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = 0
+
+    @classmethod
+    def from_config(cls, config: ActivationStoreConfig, base: Path | None = None) -> "ActivationStore":
+        return cls(
+            config.resolve_root(base),
+            max_bytes=config.max_size_mb * 2**20,
+            dtype=config.dtype,
+            pooling=config.pooling,
+        )
+
+    def key(self, **identity: Any) -> str:
+        """Derive an entry key from identifying fields (model, adapters, dataset, hook, ...)."""
+
+        payload = json.dumps(
+            {"version": FORMAT_VERSION, "dtype": self.dtype.name, "pooling": self.pooling, **identity},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def get(self, key: str, count: int) -> np.ndarray | None:
+        """Return ``[count, dim]`` sequence-mean activations as float32, or ``None`` on a miss."""
+
+        entry = self.root / key
+        meta = self._read_meta(entry)
+        if meta is None or meta["records"] < count:
+            self.misses += 1
+            return None
+        data = self._open_data(entry, meta)
+        if meta["pooling"] == "mean":
+            pooled = np.asarray(data[:count], dtype=np.float32)
+        else:
+            pooled = np.zeros((count, meta["dim"]), dtype=np.float32)
+            index = np.load(entry / INDEX_FILE)
+            for row, (offset, length) in enumerate(index[:count].tolist()):
+                pooled[row] = np.asarray(data[offset : offset + length], dtype=np.float32).mean(axis=0)
+        self._touch(entry)
+        self.hits += 1
+        return pooled
+
+    def get_sequences(self, key: str, count: int) -> List[np.ndarray] | None:
+        """Return per-record ``[length, dim]`` activations for a ``pooling="full"`` entry."""
+
+        entry = self.root / key
+        meta = self._read_meta(entry)
+        if meta is None or meta["records"] < count or meta["pooling"] != "full":
+            self.misses += 1
+            return None
+        data = self._open_data(entry, meta)
+        index = np.load(entry / INDEX_FILE)
+        sequences = [
+            np.asarray(data[offset : offset + length], dtype=np.float32) for offset, length in index[:count].tolist()
+        ]
+        self._touch(entry)
+        self.hits += 1
+        return sequences
+
+    def put(self, key: str, activations: Sequence[np.ndarray], meta: Dict[str, Any] | None = None) -> None:
+        """Write per-record activations (``[dim]`` or ``[length, dim]``) as entry ``key``."""
+
+        if not activations:
+            return
+        sequences = [np.asarray(item).reshape(-1, np.asarray(item).shape[-1]) for item in activations]
+        if self.pooling == "mean":
+            rows = np.stack([sequence.mean(axis=0) for sequence in sequences])
+            index = None
+        else:
+            rows = np.concatenate(sequences, axis=0)
+            lengths = np.array([len(sequence) for sequence in sequences], dtype=np.int64)
+            index = np.stack([np.cumsum(lengths) - lengths, lengths], axis=1)
+        if rows.size * self.dtype.itemsize > self.max_bytes:
+            logger.info("Activation entry %s exceeds the store budget; not cached", key)
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=self.root))
+        try:
+            data = np.memmap(staging / DATA_FILE, dtype=self.dtype, mode="w+", shape=rows.shape)
+            data[:] = rows
+            data.flush()
+            del data
+            if index is not None:
+                np.save(staging / INDEX_FILE, index)
+            info = {
+                "version": FORMAT_VERSION,
+                "records": len(sequences),
+                "shape": list(rows.shape),
+                "dim": int(rows.shape[-1]),
+                "dtype": self.dtype.name,
+                "pooling": self.pooling,
+                **(meta or {}),
+            }
+            (staging / META_FILE).write_text(json.dumps(info, indent=2, sort_keys=True, default=str), encoding="utf-8")
+            target = self.root / key
+            if target.exists():
+                shutil.rmtree(target, ignore_errors=True)
+            os.replace(staging, target)
+        except OSError as exc:
+            logger.warning("Could not write activation store entry %s: %s", key, exc)
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        self._touch(target)
+        self._evict(keep=key)
+
+    def round_trip(self, vectors: np.ndarray) -> np.ndarray:
+        """Cast ``vectors`` through the storage dtype so fresh and cached runs see identical values."""
+
+        return np.asarray(vectors).astype(self.dtype).astype(np.float32)
+
+    def size_bytes(self) -> int:
+        return sum(size for _, _, size in self._entries())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "root": str(self.root),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "budget_bytes": self.max_bytes,
+        }
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _read_meta(self, entry: Path) -> Dict[str, Any] | None:
+        try:
+            return json.loads((entry / META_FILE).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+
+    def _open_data(self, entry: Path, meta: Dict[str, Any]) -> np.memmap:
+        return np.memmap(entry / DATA_FILE, dtype=np.dtype(meta["dtype"]), mode="r", shape=tuple(meta["shape"]))
+
+    def _touch(self, entry: Path) -> None:
+        # Explicit, strictly increasing timestamps: filesystem clocks can be too
+        # coarse to order accesses made within a few milliseconds.
+        self._clock = max(time.time_ns(), self._clock + 1)
+        try:
+            os.utime(entry / META_FILE, ns=(self._clock, self._clock))
+        except OSError:
+            pass
+
+    def _entries(self) -> List[tuple[int, Path, int]]:
+        if not self.root.is_dir():
+            return []
+        entries = []
+        for entry in self.root.iterdir():
+            meta_path = entry / META_FILE
+            if entry.name.startswith(".") or not meta_path.is_file():
+                continue
+            size = sum(path.stat().st_size for path in entry.iterdir() if path.is_file())
+            entries.append((meta_path.stat().st_mtime_ns, entry, size))
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        entries = sorted(self._entries(), key=lambda item: item[0])
+        total = sum(size for _, _, size in entries)
+        for _, entry, size in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            self.evictions += 1
+            logger.debug("Evicted activation store entry %s (%d bytes)", entry.name, size)
+
+
+__all__ = ["ActivationStore"]
@@ -0,0 +1,202 @@
+"""SQLite store of per-record baseline metrics reused across runs and experiment types."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Sequence, Tuple
+
+import numpy as np
+
+from ..phi2_core.config import BaselineStoreConfig
+from .token_cache import tokenizer_fingerprint
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 2
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS baselines (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    dataset_sha256 TEXT NOT NULL,
+    records INTEGER NOT NULL,
+    losses BLOB NOT NULL,
+    accuracies BLOB NOT NULL,
+    identity TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (scope, key)
+)
+"""
+
+
+class BaselineStore:
+    """Keeps the un-ablated loss and accuracy of every record in one SQLite table.
+
+    Rows are addressed by a *scope* (which model and dataset file a baseline
+    describes, see :meth:`scope`) and a *key* hashing the rest of what the
+    metrics depend on: weights fingerprint, adapter ids, tokenizer
+    fingerprint and ``max_length`` (see :meth:`key`). Runs that differ only
+    in those keep separate rows, so alternating between them keeps hitting.
+    Each row also records the dataset content hash it was computed on; once
+    the file at a scope's path changes, the rows of its old content are
+    stale and deleted on the next lookup. Losses and accuracies are stored as
+    float64 blobs and read back bit-identical; a row holding at least the
+    requested number of records is a hit.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._fingerprints: Dict[int, Tuple[Any, Dict[str, str]]] = {}
+        self._initialized = False
+
+    @classmethod
+    def from_config(cls, config: BaselineStoreConfig, base: Path | None = None) -> "BaselineStore":
+        return cls(config.resolve_path(base))
+
+    @staticmethod
+    def scope(**location: Any) -> str:
+        """Name the slot a baseline occupies (model name, dataset path, shard, ...)."""
+
+        return json.dumps(location, sort_keys=True, default=str)
+
+    def key(
+        self,
+        *,
+        weights: str,
+        adapters: Sequence[str],
+        tokenizer: Any,
+        max_length: int | None,
+    ) -> str:
+        payload = json.dumps(
+            {
+                "version": FORMAT_VERSION,
+                "weights": weights,
+                "adapters": list(adapters),
+                "tokenizer": self._fingerprint(tokenizer),
+                "max_length": max_length,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def get(self, scope: str, key: str, dataset_sha256: str, count: int) -> Tuple[np.ndarray, np.ndarray] | None:
+        """Return the first ``count`` ``(losses, accuracies)`` stored for ``(scope, key)``, or ``None`` on a miss.
+
+        Rows of ``scope`` computed on other dataset contents than ``dataset_sha256`` are deleted.
+        """
+
+        try:
+            with self._connect() as conn:
+                stale = conn.execute(
+                    "DELETE FROM baselines WHERE scope = ? AND dataset_sha256 != ?", (scope, dataset_sha256)
+                ).rowcount
+                if stale > 0:
+                    self.invalidations += stale
+                    logger.info("Invalidated %d stale baseline entries for %s", stale, scope)
+                row = conn.execute(
+                    "SELECT records, losses, accuracies FROM baselines WHERE scope = ? AND key = ?", (scope, key)
+                ).fetchone()
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Could not read baseline store %s: %s", self.path, exc)
+            row = None
+        if row is None or row[0] < count:
+            self.misses += 1
+            return None
+        self.hits += 1
+        losses = np.frombuffer(row[1], dtype=np.float64)[:count].copy()
+        accuracies = np.frombuffer(row[2], dtype=np.float64)[:count].copy()
+        return losses, accuracies
+
+    def put(
+        self,
+        scope: str,
+        key: str,
+        dataset_sha256: str,
+        losses: Sequence[float],
+        accuracies: Sequence[float],
+        identity: Dict[str, Any] | None = None,
+    ) -> None:
+        """Write the baseline of ``(scope, key)``, replacing a stale row or one covering fewer records."""
+
+        losses_array = np.asarray(losses, dtype=np.float64)
+        accuracies_array = np.asarray(accuracies, dtype=np.float64)
+        if losses_array.shape != accuracies_array.shape or losses_array.ndim != 1:
+            raise ValueError("losses and accuracies must be 1-D arrays of the same length")
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO baselines (scope, key, dataset_sha256, records, losses, accuracies, identity, updated)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(scope, key) DO UPDATE SET
+                        dataset_sha256 = excluded.dataset_sha256,
+                        records = excluded.records,
+                        losses = excluded.losses,
+                        accuracies = excluded.accuracies,
+                        identity = excluded.identity,
+                        updated = excluded.updated
+                    WHERE baselines.dataset_sha256 != excluded.dataset_sha256 OR baselines.records < excluded.records
+                    """,
+                    (
+                        scope,
+                        key,
+                        dataset_sha256,
+                        len(losses_array),
+                        losses_array.tobytes(),
+                        accuracies_array.tobytes(),
+                        json.dumps(identity or {}, sort_keys=True, default=str),
+                        time.time(),
+                    ),
+                )
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Could not write baseline store entry %s: %s", key, exc)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # A short-lived connection per call: runners fork sweep workers, and
+        # SQLite connections must not cross a fork.
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30.0)
+        try:
+            with conn:
+                if not self._initialized:
+                    if conn.execute("PRAGMA user_version").fetchone()[0] != FORMAT_VERSION:
+                        # Stores written with another layout are only a cache: start over.
+                        conn.execute("DROP TABLE IF EXISTS baselines")
+                        conn.execute(f"PRAGMA user_version = {FORMAT_VERSION}")
+                    conn.execute(_SCHEMA)
+                    self._initialized = True
+                yield conn
+        finally:
+            conn.close()
+
+    def _fingerprint(self, tokenizer: Any) -> Dict[str, str]:
+        cached = self._fingerprints.get(id(tokenizer))
+        if cached is None or cached[0] is not tokenizer:
+            cached = (tokenizer, tokenizer_fingerprint(tokenizer))
+            self._fingerprints[id(tokenizer)] = cached
+        return cached[1]
+
+
+__all__ = ["BaselineStore"]
@@ -0,0 +1,105 @@
+"""Padding and batching helpers for experiment forwards."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence
+
+try:  # pragma: no cover - optional dependency guard
+    import torch
+    from torch import Tensor
+except ModuleNotFoundError:  # pragma: no cover - batching requires PyTorch when active
+    torch = None  # type: ignore
+
+IGNORE_INDEX = -100
+
+
+@dataclass
+class EncodedBatch:
+    """Right-padded batch of tokenized records plus their dataset positions."""
+
+    inputs: Dict[str, Tensor]
+    record_indices: List[int]
+
+    @property
+    def size(self) -> int:
+        return len(self.record_indices)
+
+
+def resolve_pad_token_id(tokenizer: Any) -> int:
+    """Return the id used to pad ``input_ids`` (pad, then eos, then 0)."""
+
+    for attr in ("pad_token_id", "eos_token_id"):
+        value = getattr(tokenizer, attr, None)
+        if isinstance(value, int):
+            return value
+    return 0
+
+
+def collate_encoded(encoded: Sequence[Dict[str, Tensor]], pad_token_id: int) -> Dict[str, Tensor]:
+    """Right-pad single-record encodings (shape ``[1, seq]``) into one batch.
+
+    Padding is appended after the real tokens so causal models produce the
+    same activations for every real position as the unpadded forward. Padded
+    ``labels`` use :data:`IGNORE_INDEX` and padded attention positions are 0.
+    """
+
+    if torch is None:
+        raise RuntimeError("PyTorch is required for batching")
+    if not encoded:
+        raise ValueError("Cannot collate an empty batch")
+    max_len = max(int(item["input_ids"].shape[-1]) for item in encoded)
+    batch: Dict[str, Tensor] = {}
+    for key in encoded[0].keys():
+        if key == "input_ids":
+            fill = pad_token_id
+        elif key == "labels":
+            fill = IGNORE_INDEX
+        else:
+            fill = 0
+        rows = []
+        for item in encoded:
+            value = item[key]
+            pad = max_len - int(value.shape[-1])
+            if pad:
+                value = torch.nn.functional.pad(value, (0, pad), value=fill)
+            rows.append(value)
+        batch[key] = torch.cat(rows, dim=0)
+    if "attention_mask" not in batch:
+        mask_rows = []
+        for item in encoded:
+            row = torch.ones_like(item["input_ids"])
+            pad = max_len - int(row.shape[-1])
+            if pad:
+                row = torch.nn.functional.pad(row, (0, pad), value=0)
+            mask_rows.append(row)
+        batch["attention_mask"] = torch.cat(mask_rows, dim=0)
+    return batch
+
+
+def build_batches(
+    encoded_inputs: Sequence[Dict[str, Tensor]],
+    batch_size: int,
+    pad_token_id: int,
+    *,
+    sort_by_length: bool = True,
+) -> List[EncodedBatch]:
+    """Group single-record encodings into padded batches.
+
+    When ``sort_by_length`` is set, records are bucketed by sequence length
+    so each batch carries as little padding as possible; ``record_indices``
+    keeps the mapping back to dataset order.
+    """
+
+    batch_size = max(1, int(batch_size))
+    order = list(range(len(encoded_inputs)))
+    if sort_by_length:
+        order.sort(key=lambda idx: int(encoded_inputs[idx]["input_ids"].shape[-1]))
+    batches: List[EncodedBatch] = []
+    for start in range(0, len(order), batch_size):
+        indices = order[start : start + batch_size]
+        inputs = collate_encoded([encoded_inputs[idx] for idx in indices], pad_token_id)
+        batches.append(EncodedBatch(inputs=inputs, record_indices=indices))
+    return batches
+
+
+__all__ = ["EncodedBatch", "IGNORE_INDEX", "build_batches", "collate_encoded", "resolve_pad_token_id"]
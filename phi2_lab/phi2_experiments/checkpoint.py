@@ -0,0 +1,113 @@
+"""Append-only checkpoints that let interrupted head-ablation sweeps resume."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE = "checkpoint.jsonl"
+FORMAT_VERSION = 1
+
+
+class SweepCheckpoint:
+    """Crash-safe log of completed work for one head-ablation sweep.
+
+    ``run_dir/checkpoint.jsonl`` holds one JSON object per line: a header
+    identifying the run, then the baseline metrics, then one block per
+    completed layer with the ablated losses and accuracies of every swept
+    head (``[heads, records]``). Each line is flushed and fsynced before the
+    sweep moves on, so a killed run loses at most the layer in progress. A
+    torn final line is discarded when the checkpoint is reopened.
+
+    Floats are written with ``repr`` precision, so values restored on resume
+    are bit-identical to the ones originally computed.
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any]) -> None:
+        self.path = path
+        self.header = header
+        self.baseline: Tuple[List[float], List[float]] | None = None
+        self.blocks: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    @classmethod
+    def create(cls, run_dir: str | Path, header: Dict[str, Any]) -> "SweepCheckpoint":
+        """Start a fresh checkpoint in ``run_dir``, replacing any previous one."""
+
+        checkpoint = cls(Path(run_dir) / CHECKPOINT_FILE, header)
+        checkpoint.path.parent.mkdir(parents=True, exist_ok=True)
+        checkpoint.path.write_text("", encoding="utf-8")
+        checkpoint._append({"kind": "header", "version": FORMAT_VERSION, **header})
+        return checkpoint
+
+    @classmethod
+    def resume(cls, run_dir: str | Path, header: Dict[str, Any]) -> "SweepCheckpoint":
+        """Reopen the checkpoint in ``run_dir`` and load its completed work.
+
+        Raises ``FileNotFoundError`` when ``run_dir`` has no checkpoint and
+        ``ValueError`` when its header does not match ``header`` (a different
+        spec, dataset, model or sweep shape).
+        """
+
+        checkpoint = cls(Path(run_dir) / CHECKPOINT_FILE, header)
+        entries, valid_bytes = checkpoint._read_entries()
+        if not entries or entries[0].get("kind") != "header":
+            raise ValueError(f"{checkpoint.path} does not start with a checkpoint header")
+        stored = entries[0]
+        if stored.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{checkpoint.path} has unsupported checkpoint version {stored.get('version')}")
+        mismatched = sorted(key for key, value in header.items() if stored.get(key) != value)
+        if mismatched:
+            raise ValueError(f"Cannot resume from {checkpoint.path}: {', '.join(mismatched)} changed since it was written")
+        for entry in entries[1:]:
+            if entry["kind"] == "baseline":
+                checkpoint.baseline = (entry["losses"], entry["accuracies"])
+            elif entry["kind"] == "block":
+                checkpoint.blocks[int(entry["layer"])] = (
+                    np.asarray(entry["losses"], dtype=np.float64),
+                    np.asarray(entry["accuracies"], dtype=np.float64),
+                )
+        if valid_bytes < checkpoint.path.stat().st_size:
+            logger.warning("Discarding torn trailing entry in %s", checkpoint.path)
+            with checkpoint.path.open("r+b") as handle:
+                handle.truncate(valid_bytes)
+        logger.info("Resuming from %s with %d completed layers", checkpoint.path, len(checkpoint.blocks))
+        return checkpoint
+
+    def write_baseline(self, losses: Sequence[float], accuracies: Sequence[float]) -> None:
+        self.baseline = (list(losses), list(accuracies))
+        self._append({"kind": "baseline", "losses": self.baseline[0], "accuracies": self.baseline[1]})
+
+    def write_block(self, layer: int, losses: np.ndarray, accuracies: np.ndarray) -> None:
+        """Record the ``[heads, records]`` results of a fully swept layer."""
+
+        self.blocks[layer] = (np.array(losses, dtype=np.float64), np.array(accuracies, dtype=np.float64))
+        self._append({"kind": "block", "layer": layer, "losses": losses.tolist(), "accuracies": accuracies.tolist()})
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def _read_entries(self) -> Tuple[List[Dict[str, Any]], int]:
+        entries: List[Dict[str, Any]] = []
+        valid_bytes = 0
+        with self.path.open("rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break
+                valid_bytes += len(line)
+        return entries, valid_bytes
+
+
+__all__ = ["CHECKPOINT_FILE", "SweepCheckpoint"]
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import csv
 import json
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, NamedTuple
 
@@ -26,20 +27,56 @@ def load_dataset(spec: DatasetSpec) -> List[Record]:
     return load_dataset_with_limit(spec)
 
 
-def load_dataset_with_limit(spec: DatasetSpec, max_records: int | None = None) -> List[Record]:
-    """Load a dataset described by ``DatasetSpec`` with optional record limit."""
-
+def load_dataset_with_limit(
+    spec: DatasetSpec,
+    max_records: int | None = None,
+    *,
+    shard_index: int = 0,
+    num_shards: int = 1,
+) -> List[Record]:
+    """Load a dataset described by ``DatasetSpec`` with optional record limit.
+
+    Records are read through :func:`iter_dataset`, so only the first
+    ``max_records`` rows (of the selected shard) are parsed.
+    """
+
+    return list(iter_dataset(spec, max_records=max_records, shard_index=shard_index, num_shards=num_shards))
+
+
+def iter_dataset(
+    spec: DatasetSpec,
+    max_records: int | None = None,
+    *,
+    shard_index: int = 0,
+    num_shards: int = 1,
+) -> Iterator[Record]:
+    """Lazily yield the records of a dataset, optionally restricted to one shard.
+
+    Local JSONL/CSV files are split by byte offset: shard ``i`` of ``n``
+    owns every line that starts inside ``[i * size // n, (i + 1) * size // n)``,
+    so a worker seeks straight to its range and never parses the others.
+    Shards are disjoint, cover the file in order, and assume one record per
+    physical line (CSV headers are read once from the top of the file).
+    HuggingFace datasets use ``Dataset.shard``. ``max_records`` limits the
+    records yielded for the selected shard; reading stops as soon as it is
+    reached.
+    """
+
+    if num_shards < 1 or not 0 <= shard_index < num_shards:
+        raise ValueError(f"Invalid shard {shard_index} of {num_shards}")
+    if max_records is not None and max_records < 0:
+        max_records = None
+    if max_records == 0:
+        return iter(())
     format_hint = (spec.format or "auto").lower()
     if spec.path:
         path = Path(spec.path)
         if not path.exists():
             raise FileNotFoundError(path)
-        records = _load_local_dataset(path, format_hint)
+        records = _iter_local_dataset(path, format_hint, shard_index, num_shards)
     else:
-        records = _load_huggingface_dataset(spec)
-    if max_records is not None and max_records >= 0:
-        return records[:max_records]
-    return records
+        records = _iter_huggingface_dataset(spec, shard_index, num_shards)
+    return islice(records, max_records)
 
 
 def iter_inputs(records: Iterable[Record]) -> Iterator[str]:
@@ -47,45 +84,68 @@ def iter_inputs(records: Iterable[Record]) -> Iterator[str]:
         yield record.input_text
 
 
-def _load_local_dataset(path: Path, format_hint: str) -> List[Record]:
+def _iter_local_dataset(path: Path, format_hint: str, shard_index: int, num_shards: int) -> Iterator[Record]:
     extension = path.suffix.lstrip(".").lower()
     normalized_format = format_hint if format_hint != "auto" else extension
     if normalized_format not in {"jsonl", "jsonlines", "csv"}:
         if extension in {"jsonl", "jsonlines", "csv"}:
             normalized_format = extension
     if normalized_format in {"jsonl", "jsonlines"}:
-        return _load_jsonl_path(path)
+        return _iter_jsonl_path(path, shard_index, num_shards)
     if normalized_format == "csv":
-        return _load_csv_path(path)
+        return _iter_csv_path(path, shard_index, num_shards)
     raise ValueError(f"Unsupported dataset format '{format_hint}' for path '{path}'")
 
 
-def _load_jsonl_path(path: Path) -> List[Record]:
-    records: List[Record] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            if not line.strip():
-                continue
-            payload = json.loads(line)
-            if not isinstance(payload, Mapping):
-                raise ValueError(f"JSONL row must be an object: {payload!r}")
-            records.append(_normalize_payload(payload, input_key="input", label_key="label"))
-    return records
-
-
-def _load_csv_path(path: Path) -> List[Record]:
-    records: List[Record] = []
-    with path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            if row is None:
-                continue
-            payload: Dict[str, Any] = {key: value for key, value in row.items() if key is not None}
-            records.append(_normalize_payload(payload, input_key="input", label_key="label"))
-    return records
-
-
-def _load_huggingface_dataset(spec: DatasetSpec) -> List[Record]:
+def _iter_shard_lines(path: Path, shard_index: int, num_shards: int, skip_header: bool = False) -> Iterator[str]:
+    """Yield the decoded lines whose first byte falls inside the shard's byte range."""
+
+    with path.open("rb") as handle:
+        header_end = len(handle.readline()) if skip_header else 0
+        size = path.stat().st_size - header_end
+        start = header_end + size * shard_index // num_shards
+        end = header_end + size * (shard_index + 1) // num_shards
+        if start > header_end:
+            # Land on the first line starting at or after ``start``; the line
+            # straddling the boundary belongs to the previous shard.
+            handle.seek(start - 1)
+            handle.readline()
+        else:
+            handle.seek(start)
+        position = handle.tell()
+        while position < end:
+            line = handle.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line.decode("utf-8")
+
+
+def _iter_jsonl_path(path: Path, shard_index: int = 0, num_shards: int = 1) -> Iterator[Record]:
+    for line in _iter_shard_lines(path, shard_index, num_shards):
+        if not line.strip():
+            continue
+        payload = json.loads(line)
+        if not isinstance(payload, Mapping):
+            raise ValueError(f"JSONL row must be an object: {payload!r}")
+        yield _normalize_payload(payload, input_key="input", label_key="label")
+
+
+def _iter_csv_path(path: Path, shard_index: int = 0, num_shards: int = 1) -> Iterator[Record]:
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        fieldnames = next(csv.reader(handle), None)
+    if not fieldnames:
+        return
+    lines = _iter_shard_lines(path, shard_index, num_shards, skip_header=True)
+    reader = csv.DictReader(lines, fieldnames=fieldnames)
+    for row in reader:
+        if row is None:
+            continue
+        payload: Dict[str, Any] = {key: value for key, value in row.items() if key is not None}
+        yield _normalize_payload(payload, input_key="input", label_key="label")
+
+
+def _iter_huggingface_dataset(spec: DatasetSpec, shard_index: int = 0, num_shards: int = 1) -> Iterator[Record]:
     if hf_load_dataset is None:
         raise ImportError("datasets library is required to load HuggingFace datasets")
     dataset_name = spec.huggingface_name or spec.name
@@ -94,12 +154,12 @@ def _load_huggingface_dataset(spec: DatasetSpec) -> List[Record]:
     if not dataset_name:
         raise ValueError("A HuggingFace dataset name must be provided in DatasetSpec")
     dataset = hf_load_dataset(dataset_name, subset, split=split)
-    records: List[Record] = []
+    if num_shards > 1:
+        dataset = dataset.shard(num_shards=num_shards, index=shard_index, contiguous=True)
     for row in dataset:
         if not isinstance(row, Mapping):
             row = {"value": row}
-        records.append(_normalize_payload(row))
-    return records
+        yield _normalize_payload(row)
 
 
 def _normalize_payload(
@@ -2,10 +2,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, Iterator, Tuple
 
 import numpy as np
 
+GEOMETRY_ALGORITHMS = ("exact", "randomized", "incremental")
+
+# Rows per block when a matrix is streamed through :class:`IncrementalPCA`.
+INCREMENTAL_CHUNK_ROWS = 32
+# Extra directions the approximate solvers carry beyond the requested rank.
+DEFAULT_OVERSAMPLES = 10
+DEFAULT_POWER_ITERATIONS = 2
+# Up to this many singular values the full LAPACK SVD costs well under 0.1s.
+EXACT_MAX_RANK = 128
+
 
 @dataclass
 class PCAResult:
@@ -32,37 +42,222 @@ class SVDResult:
         }
 
 
-def compute_pca(matrix: np.ndarray, *, components: int = 3, center: bool = True) -> PCAResult:
-    """Compute PCA using SVD for numerical stability."""
+def choose_algorithm(shape: Tuple[int, int], components: int) -> str:
+    """Pick the solver for an in-memory ``shape`` matrix and ``components`` rank.
+
+    Small matrices, or requests for a sizeable fraction of the spectrum, use
+    the exact SVD; everything else uses the randomized sketch. The
+    incremental solver is never picked here: on a matrix that is already in
+    memory it is slower than the sketch, and it only pays off when rows
+    arrive in chunks that should not be stacked.
+    """
+
+    rank = min(shape)
+    if rank <= EXACT_MAX_RANK or 4 * (components + DEFAULT_OVERSAMPLES) >= rank:
+        return "exact"
+    return "randomized"
+
+
+def _working_matrix(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix)
+    if matrix.dtype not in (np.float32, np.float64):
+        matrix = matrix.astype(np.float32)
+    return matrix
+
+
+def _row_chunks(matrix: np.ndarray, rows: int) -> Iterator[np.ndarray]:
+    for start in range(0, matrix.shape[0], rows):
+        yield matrix[start : start + rows]
+
+
+def _centered_sum_of_squares(matrix: np.ndarray, mean: np.ndarray) -> float:
+    return float(sum(np.sum((chunk - mean) ** 2, dtype=np.float64) for chunk in _row_chunks(matrix, 4096)))
+
+
+def randomized_svd(
+    matrix: np.ndarray,
+    rank: int,
+    *,
+    mean: np.ndarray | None = None,
+    oversamples: int = DEFAULT_OVERSAMPLES,
+    power_iterations: int = DEFAULT_POWER_ITERATIONS,
+    seed: int = 0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the top ``rank`` ``(singular_values, right_vectors)`` of ``matrix - mean``.
+
+    Randomized range finder (Halko, Martinsson & Tropp): a Gaussian sketch of
+    ``rank + oversamples`` columns is refined by ``power_iterations`` rounds of
+    ``(AAᵀ)`` with QR re-orthonormalization, then the small projected matrix
+    is decomposed exactly. Centering is applied implicitly inside the
+    products, so the input is never copied.
+    """
+
+    matrix = _working_matrix(matrix)
+    rows, cols = matrix.shape
+    width = min(rank + oversamples, rows, cols)
+    offset = np.zeros((1, cols), dtype=matrix.dtype)
+    if mean is not None:
+        offset = np.asarray(mean, dtype=matrix.dtype).reshape(1, cols)
+
+    def right(block: np.ndarray) -> np.ndarray:  # (A - 1μᵀ) @ block
+        return matrix @ block - offset @ block
+
+    def left(block: np.ndarray) -> np.ndarray:  # (A - 1μᵀ)ᵀ @ block
+        return matrix.T @ block - offset.T @ block.sum(axis=0, keepdims=True)
+
+    rng = np.random.default_rng(seed)
+    basis, _ = np.linalg.qr(right(rng.standard_normal((cols, width)).astype(matrix.dtype)))
+    for _ in range(power_iterations):
+        row_basis, _ = np.linalg.qr(left(basis))
+        basis, _ = np.linalg.qr(right(row_basis))
+    projected = left(basis).T.astype(np.float64)
+    _u, singular_values, vh = np.linalg.svd(projected, full_matrices=False)
+    return singular_values[:rank], vh[:rank]
+
+
+def _thin_svd(block: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """``(singular_values, right_vectors)`` of a short, wide block via its row Gram matrix."""
+
+    if block.shape[0] > block.shape[1]:
+        _u, singular_values, vh = np.linalg.svd(block, full_matrices=False)
+        return singular_values, vh
+    eigenvalues, left = np.linalg.eigh(block @ block.T)
+    order = np.argsort(eigenvalues)[::-1]
+    eigenvalues, left = eigenvalues[order], left[:, order]
+    keep = eigenvalues > eigenvalues[0] * max(block.shape) * np.finfo(block.dtype).eps
+    singular_values = np.sqrt(eigenvalues[keep])
+    return singular_values, (left[:, keep].T @ block) / singular_values[:, None]
+
+
+class IncrementalPCA:
+    """Streaming PCA that folds activation chunks into a rank-limited basis.
+
+    Each :meth:`partial_fit` stacks the current ``S·Vᵀ`` summary, the
+    centered chunk and a mean-shift row (Ross et al., 2008) and keeps the top
+    ``components + oversamples`` right singular vectors, so memory stays at
+    ``O((rank + chunk) · features)`` however many rows are seen. The running
+    mean and total sum of squares are exact; the components are exact when
+    the data rank fits in the carried basis and close otherwise.
+    """
+
+    def __init__(self, components: int = 3, *, center: bool = True, oversamples: int = DEFAULT_OVERSAMPLES) -> None:
+        self.components = components
+        self.center = center
+        self.rank = components + oversamples
+        self.samples = 0
+        self.mean: np.ndarray | None = None
+        self.singular_values = np.zeros(0)
+        self.right_vectors: np.ndarray | None = None
+        self.sum_of_squares = 0.0
+
+    def partial_fit(self, chunk: np.ndarray) -> "IncrementalPCA":
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if chunk.ndim != 2:
+            raise ValueError("IncrementalPCA expects 2D chunks of shape [samples, features]")
+        if chunk.shape[0] == 0:
+            return self
+        if self.mean is None:
+            self.mean = np.zeros(chunk.shape[1])
+            self.right_vectors = np.zeros((0, chunk.shape[1]))
+        seen, added = self.samples, chunk.shape[0]
+        total = seen + added
+        blocks = [self.singular_values[:, None] * self.right_vectors]
+        chunk_mean = chunk.mean(axis=0)
+        if self.center:
+            centered = chunk - chunk_mean
+            shift = np.sqrt(seen * added / total) * (self.mean - chunk_mean)
+            blocks += [centered, shift[None, :]]
+            self.sum_of_squares += float(np.sum(centered**2)) + float(shift @ shift)
+        else:
+            blocks.append(chunk)
+            self.sum_of_squares += float(np.sum(chunk**2))
+        self.mean = self.mean + (chunk_mean - self.mean) * (added / total)
+        singular_values, right_vectors = _thin_svd(np.concatenate(blocks))
+        self.singular_values = singular_values[: self.rank]
+        self.right_vectors = right_vectors[: self.rank]
+        self.samples = total
+        return self
+
+    def fit(self, chunks: Iterable[np.ndarray]) -> "IncrementalPCA":
+        for chunk in chunks:
+            self.partial_fit(chunk)
+        return self
+
+    def pca_result(self) -> PCAResult:
+        if self.samples < 2 or self.right_vectors is None:
+            raise ValueError("At least two samples are required to compute PCA")
+        top = min(self.components, self.singular_values.size)
+        denominator = max(self.samples - 1, 1)
+        explained_variance = self.singular_values[:top] ** 2 / denominator
+        total_variance = self.sum_of_squares / denominator or 1.0
+        return PCAResult(
+            components=self.right_vectors[:top],
+            explained_variance=explained_variance,
+            explained_variance_ratio=explained_variance / total_variance,
+            mean=self.mean[None, :],
+        )
+
+    def svd_result(self) -> SVDResult:
+        if self.right_vectors is None:
+            raise ValueError("IncrementalPCA has not seen any samples")
+        top = min(self.components, self.singular_values.size)
+        return SVDResult(singular_values=self.singular_values[:top], right_singular_vectors=self.right_vectors[:top])
+
+
+def _decompose(
+    matrix: np.ndarray, components: int, center: bool, algorithm: str
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """Return ``(singular_values, right_vectors, mean, centered_sum_of_squares)``."""
+
+    if algorithm not in GEOMETRY_ALGORITHMS:
+        raise ValueError(f"Unknown geometry algorithm '{algorithm}'; expected one of {GEOMETRY_ALGORITHMS}")
+    matrix = _working_matrix(matrix)
+    if algorithm == "incremental":
+        streamed = IncrementalPCA(components, center=center).fit(_row_chunks(matrix, INCREMENTAL_CHUNK_ROWS))
+        return streamed.singular_values, streamed.right_vectors, streamed.mean[None, :], streamed.sum_of_squares
+    mean = matrix.mean(axis=0, keepdims=True, dtype=np.float64)
+    offset = mean if center else np.zeros_like(mean)
+    if algorithm == "randomized":
+        singular_values, vh = randomized_svd(matrix, components, mean=offset)
+        return singular_values, vh, mean, _centered_sum_of_squares(matrix, offset)
+    centered = matrix - mean.astype(matrix.dtype) if center else matrix
+    _u, singular_values, vh = np.linalg.svd(centered, full_matrices=False)
+    return singular_values, vh, mean, float(np.sum(singular_values.astype(np.float64) ** 2))
+
+
+def compute_pca(
+    matrix: np.ndarray, *, components: int = 3, center: bool = True, algorithm: str = "exact"
+) -> PCAResult:
+    """Compute PCA with the exact SVD or one of the truncated ``algorithm`` solvers."""
 
     if matrix.ndim != 2:
         raise ValueError("PCA expects a 2D matrix of shape [samples, features]")
     if matrix.shape[0] < 2:
         raise ValueError("At least two samples are required to compute PCA")
-    centered = matrix - matrix.mean(axis=0, keepdims=True) if center else matrix
-    u, s, vh = np.linalg.svd(centered, full_matrices=False)
+    singular_values, vh, mean, sum_of_squares = _decompose(matrix, components, center, algorithm)
     n_samples = matrix.shape[0]
-    explained_variance = (s**2) / max(n_samples - 1, 1)
-    total_variance = explained_variance.sum() or 1.0
+    explained_variance = (singular_values**2) / max(n_samples - 1, 1)
+    total_variance = sum_of_squares / max(n_samples - 1, 1) or 1.0
     explained_variance_ratio = explained_variance / total_variance
     top_components = min(components, vh.shape[0])
     return PCAResult(
         components=vh[:top_components],
         explained_variance=explained_variance[:top_components],
         explained_variance_ratio=explained_variance_ratio[:top_components],
-        mean=centered.mean(axis=0, keepdims=True),
+        mean=mean,
     )
 
 
-def compute_svd(matrix: np.ndarray, *, components: int = 3, center: bool = True) -> SVDResult:
+def compute_svd(
+    matrix: np.ndarray, *, components: int = 3, center: bool = True, algorithm: str = "exact"
+) -> SVDResult:
     """Return singular values/vectors for the provided matrix."""
 
     if matrix.ndim != 2:
         raise ValueError("SVD expects a 2D matrix of shape [samples, features]")
-    centered = matrix - matrix.mean(axis=0, keepdims=True) if center else matrix
-    _u, s, vh = np.linalg.svd(centered, full_matrices=False)
+    singular_values, vh, _mean, _sum_of_squares = _decompose(matrix, components, center, algorithm)
     top_components = min(components, vh.shape[0])
-    return SVDResult(singular_values=s[:top_components], right_singular_vectors=vh[:top_components])
+    return SVDResult(singular_values=singular_values[:top_components], right_singular_vectors=vh[:top_components])
 
 
 def top_direction(result: PCAResult | SVDResult) -> Tuple[float, np.ndarray]:
@@ -77,4 +272,14 @@ def top_direction(result: PCAResult | SVDResult) -> Tuple[float, np.ndarray]:
     return float(result.singular_values[0]), result.right_singular_vectors[0]
 
 
-__all__ = ["compute_pca", "compute_svd", "PCAResult", "SVDResult", "top_direction"]
+__all__ = [
+    "GEOMETRY_ALGORITHMS",
+    "IncrementalPCA",
+    "PCAResult",
+    "SVDResult",
+    "choose_algorithm",
+    "compute_pca",
+    "compute_svd",
+    "randomized_svd",
+    "top_direction",
+]
@@ -26,10 +26,19 @@ def record_activation(
     layer_idx: int,
     submodule: HookSubmodule,
     head_idx: int | None = None,
+    *,
+    reduction: str | None = None,
+    positions: Sequence[int] | None = None,
 ) -> HookPoint:
-    """Return a :class:`HookPoint` capturing the desired activation."""
+    """Return a :class:`HookPoint` capturing the desired activation, optionally pooled in the hook."""
 
-    return HookPoint(layer_idx=layer_idx, submodule=submodule.value, head_idx=head_idx)
+    return HookPoint(
+        layer_idx=layer_idx,
+        submodule=submodule.value,
+        head_idx=head_idx,
+        reduction=reduction,
+        positions=tuple(positions) if positions is not None else None,
+    )
 
 
 def ablate_attention_heads(
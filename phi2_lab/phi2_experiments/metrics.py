@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import warnings
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -105,6 +106,81 @@ def rank_heads_by_importance(
     return ranked
 
 
+def summarize_metric_array(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """Vectorized :func:`aggregate_metric_values` over the last axis.
+
+    ``values`` is typically a dense ``[layers, heads, records]`` array; the
+    result maps ``mean``/``min``/``max`` to arrays of the leading shape
+    (zeros where the last axis is empty). NaN entries mark records that were
+    not evaluated and are skipped.
+    """
+
+    array = np.asarray(values, dtype=np.float64)
+    if array.shape[-1] == 0:
+        zeros = np.zeros(array.shape[:-1])
+        return {"mean": zeros, "min": zeros.copy(), "max": zeros.copy()}
+    if np.isnan(array).any():
+        with warnings.catch_warnings():
+            # Rows with no evaluated records summarize to NaN.
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return {
+                "mean": np.nanmean(array, axis=-1),
+                "min": np.nanmin(array, axis=-1),
+                "max": np.nanmax(array, axis=-1),
+            }
+    return {"mean": array.mean(axis=-1), "min": array.min(axis=-1), "max": array.max(axis=-1)}
+
+
+def rank_heads_by_importance_array(
+    scores: np.ndarray,
+    layers: Sequence[int],
+    heads: Sequence[int],
+    top_k: int | None = None,
+) -> List[Dict[str, float]]:
+    """Vectorized :func:`rank_heads_by_importance` over a ``[layers, heads]`` score array.
+
+    Produces the same ``layer{L}.head{H}`` entries in the same order: by
+    descending score, ties broken by head name. NaN scores (heads that were
+    never ablated on their own) are left out.
+    """
+
+    score_array = np.asarray(scores, dtype=np.float64).reshape(len(layers), len(heads))
+    names = np.array([f"layer{layer}.head{head}" for layer in layers for head in heads])
+    flat = score_array.reshape(-1)
+    order = np.lexsort((names, -flat))
+    order = order[~np.isnan(flat[order])]
+    if top_k is not None:
+        order = order[:top_k]
+    return [{"head": str(names[idx]), "score": float(flat[idx])} for idx in order]
+
+
+def compute_task_correlations_array(metric_sets: Mapping[str, np.ndarray]) -> Dict[str, float]:
+    """Vectorized :func:`compute_task_correlations` for equally sized metric arrays.
+
+    All pairwise Pearson correlations come from one ``np.corrcoef`` call;
+    constant series correlate as ``0.0`` and series of mismatched or
+    too-short length are skipped, as in the scalar version.
+    """
+
+    names = list(metric_sets.keys())
+    arrays = [np.asarray(metric_sets[name], dtype=float).reshape(-1) for name in names]
+    correlations: Dict[str, float] = {}
+    if not arrays:
+        return correlations
+    size = arrays[0].size
+    if size < 2 or any(array.size != size for array in arrays):
+        return compute_task_correlations({name: array for name, array in zip(names, arrays)})
+    stacked = np.stack(arrays)
+    constant = np.isclose(stacked, stacked[:, :1]).all(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        matrix = np.corrcoef(stacked)
+    for idx, name_a in enumerate(names):
+        for jdx in range(idx + 1, len(names)):
+            value = 0.0 if constant[idx] or constant[jdx] else float(matrix[idx, jdx])
+            correlations[f"{name_a}|{names[jdx]}"] = value
+    return correlations
+
+
 def compute_task_correlations(metric_sets: Mapping[str, Sequence[float]]) -> Dict[str, float]:
     """Compute pairwise Pearson correlations across named metric sequences."""
 
@@ -196,6 +272,14 @@ class ExperimentResult:
         }
 
 
+def experiment_output_dir(
+    spec_id: str, timestamp: datetime, base_dir: str | Path = "results/experiments"
+) -> Path:
+    """Directory holding the artifacts of the run of ``spec_id`` started at ``timestamp``."""
+
+    return Path(base_dir) / spec_id / timestamp.isoformat(timespec="seconds")
+
+
 def log_experiment_result(
     result: ExperimentResult,
     base_dir: str | Path = "results/experiments",
@@ -203,8 +287,7 @@ def log_experiment_result(
 ) -> Path:
     """Persist the experiment result JSON and optional NPZ artifacts."""
 
-    timestamp_slug = result.timestamp_iso
-    output_dir = Path(base_dir) / result.spec_id / timestamp_slug
+    output_dir = experiment_output_dir(result.spec_id, result.timestamp, base_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     result_path = output_dir / "result.json"
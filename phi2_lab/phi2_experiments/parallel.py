@@ -0,0 +1,82 @@
+"""Fork-based CPU worker pool for splitting experiment work units across processes."""
+from __future__ import annotations
+
+import logging
+import os
+from typing import Any, Callable, Iterator, List, Sequence, Set, Tuple
+
+try:  # pragma: no cover - optional dependency guard
+    import torch
+    import torch.multiprocessing as torch_mp
+except ModuleNotFoundError:  # pragma: no cover - the pool requires PyTorch when active
+    torch = None  # type: ignore
+    torch_mp = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Set in the parent right before the pool forks; workers inherit it, so the task
+# (usually a bound method closing over models, batches and caches) is never pickled.
+_TASK: Callable[[Any], Any] | None = None
+
+
+def available_cpus() -> List[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _cpu_sets(workers: int) -> List[Set[int]]:
+    cpus = available_cpus()
+    if len(cpus) < workers:
+        return []
+    size = len(cpus) // workers
+    return [set(cpus[idx * size : (idx + 1) * size]) for idx in range(workers)]
+
+
+def _init_worker(threads: int, cpu_sets: Sequence[Set[int]]) -> None:
+    assert torch is not None and torch_mp is not None
+    torch.set_num_threads(threads)
+    identity = torch_mp.current_process()._identity
+    if cpu_sets and identity and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpu_sets[(identity[0] - 1) % len(cpu_sets)])
+
+
+def _run_task(item: Any) -> Tuple[Any, Any]:
+    assert _TASK is not None
+    return item, _TASK(item)
+
+
+def fork_map(
+    fn: Callable[[Any], Any],
+    items: Sequence[Any],
+    workers: int,
+    threads_per_worker: int | None = None,
+) -> Iterator[Tuple[Any, Any]]:
+    """Yield ``(item, fn(item))`` pairs computed by ``workers`` forked CPU processes.
+
+    Workers are forked after ``fn`` is installed, so everything it closes over
+    is inherited copy-on-write instead of being pickled; only items and results
+    cross process boundaries. Each worker runs ``threads_per_worker`` torch
+    intra-op threads (default: available CPUs divided evenly) and, when there
+    are enough CPUs, is pinned to its own disjoint set of cores. Results are
+    yielded in completion order; callers place them by item.
+    """
+
+    global _TASK
+    if torch_mp is None:
+        raise RuntimeError("PyTorch is required for multi-process execution")
+    if _TASK is not None:
+        raise RuntimeError("fork_map cannot be nested")
+    workers = max(1, min(int(workers), len(items)))
+    threads = threads_per_worker or max(1, len(available_cpus()) // workers)
+    context = torch_mp.get_context("fork")
+    _TASK = fn
+    try:
+        with context.Pool(workers, initializer=_init_worker, initargs=(threads, _cpu_sets(workers))) as pool:
+            logger.info("Started %d CPU workers with %d threads each for %d work units", workers, threads, len(items))
+            yield from pool.imap_unordered(_run_task, items)
+    finally:
+        _TASK = None
+
+
+__all__ = ["available_cpus", "fork_map"]
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Tuple
+from typing import List, Sequence, Tuple
 
 import numpy as np
 
@@ -16,18 +16,121 @@ class ProbeModel:
         return activations @ self.weights + self.bias
 
 
+@dataclass
+class RidgePath:
+    """Cross-validated error of a ridge probe over a grid of penalties."""
+
+    penalties: List[float]
+    cv_mse: List[float]
+    folds: int
+    best_penalty: float
+
+    def to_dict(self) -> dict:
+        return {
+            "penalties": list(self.penalties),
+            "cv_mse": list(self.cv_mse),
+            "folds": self.folds,
+            "best_penalty": self.best_penalty,
+        }
+
+
+def ridge_weights(activations: np.ndarray, labels: np.ndarray, penalty: float) -> np.ndarray:
+    """Solve ``(XᵀX + λI) w = Xᵀy``, in the dual ``w = Xᵀ(XXᵀ + λI)⁻¹y`` form when ``n < d``.
+
+    Both forms give the same weights; the dual only factors an ``n×n``
+    system, which is far cheaper when there are fewer records than
+    activation dimensions.
+    """
+
+    n, d = activations.shape
+    if n < d:
+        gram = activations @ activations.T + penalty * np.eye(n)
+        return activations.T @ np.linalg.solve(gram, labels)
+    xtx = activations.T @ activations + penalty * np.eye(d)
+    return np.linalg.solve(xtx, activations.T @ labels)
+
+
 def train_linear_probe(activations: np.ndarray, labels: np.ndarray, penalty: float = 1.0) -> ProbeModel:
     """Train a ridge-regression style linear probe."""
 
     activations = np.asarray(activations)
     labels = np.asarray(labels)
-    xtx = activations.T @ activations + penalty * np.eye(activations.shape[1])
-    xty = activations.T @ labels
-    weights = np.linalg.solve(xtx, xty)
+    weights = ridge_weights(activations, labels, penalty)
     bias = labels.mean(axis=0, keepdims=True)
     return ProbeModel(weights=weights, bias=bias)
 
 
+def _gram_decomposition(activations: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """Return ``(U, s², V)`` of the thin SVD of ``X`` from the smaller Gram matrix.
+
+    ``XXᵀ`` (``n ≤ d``) or ``XᵀX`` (``n > d``) is eigendecomposed instead of
+    running an SVD of ``X`` itself; ``V`` is only formed in the primal case
+    (``None`` otherwise, where weights are recovered through ``Xᵀ``).
+    Directions with zero singular value are dropped.
+    """
+
+    n, d = activations.shape
+    if n <= d:
+        eigenvalues, left = np.linalg.eigh(activations @ activations.T)
+        keep = eigenvalues > eigenvalues.max(initial=0.0) * max(n, d) * np.finfo(activations.dtype).eps
+        return left[:, keep], eigenvalues[keep], None
+    eigenvalues, right = np.linalg.eigh(activations.T @ activations)
+    keep = eigenvalues > eigenvalues.max(initial=0.0) * max(n, d) * np.finfo(activations.dtype).eps
+    right, eigenvalues = right[:, keep], eigenvalues[keep]
+    return (activations @ right) / np.sqrt(eigenvalues), eigenvalues, right
+
+
+def train_linear_probe_cv(
+    activations: np.ndarray, labels: np.ndarray, penalties: Sequence[float], folds: int = 5
+) -> Tuple[ProbeModel, RidgePath]:
+    """Pick the ridge penalty by k-fold cross-validation and train the probe with it.
+
+    One decomposition ``X = U S Vᵀ`` (via the smaller Gram matrix) serves the
+    whole grid. For each penalty the hat matrix is ``H = U diag(s²/(s²+λ)) Uᵀ``
+    and the held-out residuals of fold ``f`` are exactly
+    ``(I - H_ff)⁻¹ (y_f - (Hy)_f)``, so no fold is refitted. Held-out
+    predictions include the training-fold label mean as bias, matching
+    :func:`train_linear_probe`. Folds are interleaved (record ``i`` is in
+    fold ``i % folds``); ties pick the largest penalty.
+    """
+
+    activations = np.asarray(activations, dtype=np.float64)
+    labels = np.asarray(labels, dtype=np.float64)
+    n = activations.shape[0]
+    if n < 2:
+        raise ValueError("Cross-validating a probe needs at least two records")
+    folds = max(2, min(int(folds), n))
+    u, squared_singular, v = _gram_decomposition(activations)
+    column = labels.reshape(n, -1)
+    uty = u.T @ column
+    fold_rows = [np.arange(fold, n, folds) for fold in range(folds)]
+    label_sum = column.sum(axis=0)
+    cv_mse: List[float] = []
+    for penalty in penalties:
+        shrink = squared_singular / (squared_singular + penalty)
+        fitted = u @ (shrink[:, None] * uty)
+        squared = 0.0
+        for rows in fold_rows:
+            u_fold = u[rows]
+            hat_block = (u_fold * shrink) @ u_fold.T
+            residual = np.linalg.solve(np.eye(len(rows)) - hat_block, column[rows] - fitted[rows])
+            # residual = y_f - X_f w_(-f); the probe also adds the held-in label mean.
+            bias = (label_sum - column[rows].sum(axis=0)) / (n - len(rows))
+            squared += float(np.sum((residual - bias) ** 2))
+        cv_mse.append(squared / labels.size)
+    scores = np.asarray(cv_mse)
+    best = max(float(penalty) for penalty, score in zip(penalties, scores) if score <= scores.min())
+    inverse = 1.0 / (squared_singular + best)
+    if v is None:
+        weights = activations.T @ (u @ (inverse[:, None] * uty))
+    else:
+        weights = v @ ((inverse * np.sqrt(squared_singular))[:, None] * uty)
+    weights = weights.reshape(activations.shape[1:] + labels.shape[1:])
+    model = ProbeModel(weights=weights, bias=labels.mean(axis=0, keepdims=True))
+    path = RidgePath(penalties=[float(value) for value in penalties], cv_mse=cv_mse, folds=folds, best_penalty=best)
+    return model, path
+
+
 def evaluate_probe(probe: ProbeModel, activations: np.ndarray, labels: np.ndarray) -> Tuple[float, float]:
     preds = probe.predict(activations)
     mse = float(np.mean((preds - labels) ** 2))
@@ -0,0 +1,66 @@
+"""In-memory cache of residual-stream states captured during baseline passes."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResidualCache:
+    """Holds the hidden state entering selected decoder blocks, per batch.
+
+    Ablating a component of layer ``L`` leaves every block below ``L``
+    unchanged, so an ablation forward can resume from the cached input of
+    block ``L``. Entries are added until ``max_bytes`` is reached; lookups
+    past that point miss and callers fall back to a full forward.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Tuple[int, int], Any] = {}
+        self._full = False
+
+    def put(self, batch_idx: int, layer_idx: int, hidden_states: Any) -> bool:
+        """Store ``hidden_states`` for ``(batch_idx, layer_idx)`` if the budget allows."""
+
+        size = int(hidden_states.numel()) * int(hidden_states.element_size())
+        if self.used_bytes + size > self.max_bytes:
+            if not self._full:
+                logger.info(
+                    "Residual cache budget of %.1f MiB reached; remaining batches use full forwards",
+                    self.max_bytes / 2**20,
+                )
+            self._full = True
+            return False
+        self._entries[(batch_idx, layer_idx)] = hidden_states
+        self.used_bytes += size
+        return True
+
+    def get(self, batch_idx: int, layer_idx: int) -> Any | None:
+        hidden_states = self._entries.get((batch_idx, layer_idx))
+        if hidden_states is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return hidden_states
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.used_bytes = 0
+        self._full = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.used_bytes,
+            "budget_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+__all__ = ["ResidualCache"]
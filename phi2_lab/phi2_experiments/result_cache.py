@@ -0,0 +1,125 @@
+"""Content-addressed index of finished experiment results, so identical runs are not recomputed."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+
+from ..phi2_core.config import ResultCacheConfig
+from .metrics import ExperimentResult
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+
+class ResultCache:
+    """Maps a run's identity to the ``result.json`` it produced under ``results/experiments/``.
+
+    The index is one small JSON file mapping keys to result paths, so a lookup
+    is a dictionary access rather than a scan of result directories. Hits
+    return the earlier :class:`ExperimentResult` loaded from disk; its
+    ``artifact_paths`` keep referencing the original run directory, nothing
+    is copied. An entry whose artifacts have been deleted is dropped on
+    lookup.
+
+    The index also remembers the weights fingerprint of each local checkpoint
+    (see :meth:`Phi2ModelManager.checkpoint_identity`), so a run can derive its
+    key, and return a hit, without loading the model.
+    """
+
+    def __init__(self, index_path: str | Path) -> None:
+        self.index_path = Path(index_path)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: ResultCacheConfig, base: Path | None = None) -> "ResultCache":
+        return cls(config.resolve_index(base))
+
+    def key(self, **identity: Any) -> str:
+        """Derive an entry key from identifying fields (manifest, spec, model config, ...)."""
+
+        payload = json.dumps({"version": FORMAT_VERSION, **identity}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def get(self, key: str) -> ExperimentResult | None:
+        index = self._read_index()
+        result_path = index["results"].get(key)
+        result = self._load(Path(result_path)) if result_path else None
+        if result is None:
+            if result_path:
+                logger.info("Dropping result cache entry %s: %s is gone", key, result_path)
+                index["results"].pop(key)
+                self._write_index(index)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: ExperimentResult) -> None:
+        result_path = result.artifact_paths.get("result_json")
+        if not result_path:
+            return
+        index = self._read_index()
+        index["results"][key] = str(Path(result_path).resolve())
+        self._write_index(index)
+
+    def weights_fingerprint(self, checkpoint: str) -> str | None:
+        """The weights fingerprint recorded for ``checkpoint``, or ``None`` if it was never loaded."""
+
+        return self._read_index()["weights"].get(checkpoint)
+
+    def put_weights_fingerprint(self, checkpoint: str, fingerprint: str) -> None:
+        index = self._read_index()
+        if index["weights"].get(checkpoint) == fingerprint:
+            return
+        index["weights"][checkpoint] = fingerprint
+        self._write_index(index)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"index": str(self.index_path), "hits": self.hits, "misses": self.misses}
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self, result_path: Path) -> ExperimentResult | None:
+        try:
+            result = ExperimentResult.from_json(result_path)
+        except (FileNotFoundError, ValueError, KeyError, OSError):
+            return None
+        # Artifacts were recorded relative to the original run's working directory.
+        run_dir = result_path.parent
+        result.artifact_paths = {name: str(run_dir / Path(path).name) for name, path in result.artifact_paths.items()}
+        if not all(Path(path).is_file() for path in result.artifact_paths.values()):
+            return None
+        return result
+
+    def _read_index(self) -> Dict[str, Dict[str, str]]:
+        """``{"results": {key: result_json_path}, "weights": {checkpoint: fingerprint}}``."""
+
+        try:
+            index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError, OSError):
+            index = {}
+        if not isinstance(index, dict):
+            index = {}
+        return {section: dict(index.get(section) or {}) for section in ("results", "weights")}
+
+    def _write_index(self, index: Dict[str, Dict[str, str]]) -> None:
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            handle, staging = tempfile.mkstemp(prefix=f".{self.index_path.name}.", dir=self.index_path.parent)
+            with os.fdopen(handle, "w", encoding="utf-8") as fh:
+                json.dump(index, fh, indent=2, sort_keys=True)
+            os.replace(staging, self.index_path)
+        except OSError as exc:
+            logger.warning("Could not write result cache index %s: %s", self.index_path, exc)
+
+
+__all__ = ["ResultCache"]
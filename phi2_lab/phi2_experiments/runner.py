@@ -4,13 +4,12 @@ from __future__ import annotations
 import json
 import logging
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, is_dataclass, replace
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
-from statistics import mean
 import hashlib
 
 try:  # pragma: no cover - optional dependency guard
@@ -23,6 +22,7 @@ from ..phi2_atlas.storage import AtlasStorage
 from ..phi2_atlas.writer import AtlasWriter
 from ..phi2_core.hooks import AblationKind, AblationRequest, HookPoint, HookSpec, InterventionFn
 from ..phi2_core.model_manager import Phi2ModelManager
+from ..utils.tracing import Tracer, span, tracing
 from ..geometry_viz.integration import (
     GeometryTelemetryRecorder,
     GeometryTelemetrySettings,
@@ -32,26 +32,57 @@ from ..geometry_viz.integration import (
     finalize_geometry_run,
     log_model_geometry,
 )
-from .geometry import compute_pca, compute_svd, top_direction
-from .datasets import Record, load_dataset_with_limit
+from .activation_store import ActivationStore
+from .baseline_store import BaselineStore
+from .batching import EncodedBatch, IGNORE_INDEX, build_batches, resolve_pad_token_id
+from .checkpoint import SweepCheckpoint
+from .geometry import choose_algorithm, compute_pca, compute_svd, top_direction
+from .datasets import Record, iter_dataset
 from .metrics import (
     ExperimentResult,
-    compute_accuracy_delta,
-    compute_accuracy_from_predictions,
     compute_accuracy_metrics,
     compute_delta_metrics,
-    compute_loss_delta,
     compute_loss_metrics,
-    compute_task_correlations,
+    compute_task_correlations_array,
+    experiment_output_dir,
     log_experiment_result,
-    rank_heads_by_importance,
+    rank_heads_by_importance_array,
+    summarize_metric_array,
 )
-from .probes import evaluate_probe, train_linear_probe
-from .spec import ExperimentSpec, ExperimentType, GeometryConfig, HookDefinition, HookPointSpec, ProbeTaskSpec
+from .parallel import fork_map
+from .probes import evaluate_probe, train_linear_probe, train_linear_probe_cv
+from .residual_cache import ResidualCache
+from .result_cache import ResultCache
+from .sequential import SequentialEffectTest
+from .spec import (
+    EarlyStoppingSpec,
+    ExperimentSpec,
+    ExperimentType,
+    GeometryConfig,
+    HeadSearchSpec,
+    HookDefinition,
+    HookPointSpec,
+    ProbeTaskSpec,
+)
+from .token_cache import TokenizedDatasetCache
 
 logger = logging.getLogger(__name__)
 DEFAULT_HEAD_COUNT = 32
 MANIFEST_KEY = "run_manifest"
+ATTRIBUTION_MODE = "attribution"
+HIERARCHICAL_SEARCH = "hierarchical"
+FUSABLE_EXPERIMENT_TYPES = (ExperimentType.PROBE, ExperimentType.GEOMETRY)
+WORD_BATCH_SIZE = 64
+# Manifest entries that do not change what a run computes (see _result_identity).
+VOLATILE_MANIFEST_KEYS = (
+    "spec_path",
+    "dataset_path",
+    "workers",
+    "tokenized_cache",
+    "activation_store",
+    "baseline_store",
+    "baseline",
+)
 
 
 @dataclass
@@ -62,6 +93,22 @@ class BaselineMetrics:
     accuracy: float
 
 
+@dataclass
+class _HeadSweep:
+    """Per-run state shared by every layer of a head-ablation sweep."""
+
+    batches: List[EncodedBatch]
+    batch_order: List[int]
+    model: Any
+    heads: List[int]
+    total_heads: int
+    records: int
+    baseline_losses: np.ndarray
+    residual_cache: ResidualCache | None
+    stopping: EarlyStoppingSpec | None
+    search: HeadSearchSpec | None
+
+
 class ExperimentRunner:
     """Executes experiment specifications with the shared model manager."""
 
@@ -90,6 +137,25 @@ class ExperimentRunner:
         self.head_limit: int | None = None
         self.max_length: int | None = None
         self.batch_size: int | None = None
+        self.shard_index = 0
+        self.num_shards = 1
+        self.multi_head_ablation = True
+        self.gather_label_logits = True
+        self.ablation_memory_mb = 1024
+        self.residual_cache_mb = 2048
+        self.token_cache: TokenizedDatasetCache | None = None
+        self.activation_store: ActivationStore | None = None
+        self.baseline_store: BaselineStore | None = None
+        self.tracer: Tracer | None = None
+        self.checkpointing = True
+        self.workers = 1
+        self.threads_per_worker: int | None = None
+        self.resume_dir: Path | None = None
+        self._run_timestamp: datetime | None = None
+        self._fused_activations: Dict[str, Tuple[int, Dict[str, np.ndarray]]] = {}
+        self._fused_spec_ids: Dict[str, List[str]] = {}
+        self._file_digests: Dict[Tuple[str, int, int], str] = {}
+        self._baseline_report: Dict[str, Any] | None = None
 
     @staticmethod
     def _sha256_file(path: Path) -> str:
@@ -99,45 +165,128 @@ class ExperimentRunner:
                 digest.update(chunk)
         return digest.hexdigest()
 
+    def _file_sha256(self, path: Path) -> str:
+        """Memoized :meth:`_sha256_file`, invalidated when the file's size or mtime changes."""
+
+        stat = path.stat()
+        memo_key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        digest = self._file_digests.get(memo_key)
+        if digest is None:
+            digest = self._sha256_file(path)
+            self._file_digests[memo_key] = digest
+        return digest
+
     def run(self, spec: ExperimentSpec) -> ExperimentResult:
+        with tracing(self.tracer), span("run", spec=spec.id, type=spec.type.value):
+            return self._run_spec(spec)
+
+    def _run_spec(self, spec: ExperimentSpec) -> ExperimentResult:
+        trace_start = len(self.tracer.events) if self.tracer is not None else 0
         logger.info("Running experiment %s of type %s", spec.id, spec.type.value)
+        self._run_timestamp = self._resolve_run_timestamp()
+        self._baseline_report = None
+        if self.resume_dir is not None and (
+            spec.type != ExperimentType.HEAD_ABLATION or spec.ablation_mode == ATTRIBUTION_MODE
+        ):
+            logger.warning("Resume only applies to exact head-ablation sweeps; running %s from scratch", spec.id)
         self._record_geometry(step=0, spec=spec)
+        if self.token_cache is not None:
+            self.token_cache.reset_stats()
+        if self.activation_store is not None:
+            self.activation_store.reset_stats()
+        if self.baseline_store is not None:
+            self.baseline_store.reset_stats()
         try:
-            if spec.type == ExperimentType.HEAD_ABLATION:
-                summary, per_head_metrics, metadata, npz_payloads = self._run_head_ablation(spec)
-            elif spec.type == ExperimentType.PROBE:
-                summary, per_head_metrics, metadata, npz_payloads = self._run_probe(spec)
-            elif spec.type == ExperimentType.DIRECTION_INTERVENTION:
-                summary, per_head_metrics, metadata, npz_payloads = self._run_direction_intervention(spec)
-            elif spec.type == ExperimentType.GEOMETRY:
-                summary, per_head_metrics, metadata, npz_payloads = self._run_geometry(spec)
-            elif spec.type == ExperimentType.SEMANTIC_GEOMETRY:
-                summary, per_head_metrics, metadata, npz_payloads = self._run_semantic_geometry(spec)
-            else:
-                raise NotImplementedError(f"Experiment type {spec.type} is not implemented yet")
+            with self.model_manager.persistent_hooks():
+                if spec.type == ExperimentType.HEAD_ABLATION and spec.ablation_mode == ATTRIBUTION_MODE:
+                    summary, per_head_metrics, metadata, npz_payloads = self._run_head_attribution(spec)
+                elif spec.type == ExperimentType.HEAD_ABLATION:
+                    summary, per_head_metrics, metadata, npz_payloads = self._run_head_ablation(spec)
+                elif spec.type == ExperimentType.PROBE:
+                    summary, per_head_metrics, metadata, npz_payloads = self._run_probe(spec)
+                elif spec.type == ExperimentType.DIRECTION_INTERVENTION:
+                    summary, per_head_metrics, metadata, npz_payloads = self._run_direction_intervention(spec)
+                elif spec.type == ExperimentType.GEOMETRY:
+                    summary, per_head_metrics, metadata, npz_payloads = self._run_geometry(spec)
+                elif spec.type == ExperimentType.SEMANTIC_GEOMETRY:
+                    summary, per_head_metrics, metadata, npz_payloads = self._run_semantic_geometry(spec)
+                else:
+                    raise NotImplementedError(f"Experiment type {spec.type} is not implemented yet")
 
             # Attach manifest
             metadata[MANIFEST_KEY] = self._build_manifest(spec)
+            if self.tracer is not None:
+                metadata[MANIFEST_KEY]["trace"] = self.tracer.summary(since=trace_start)
 
             result = ExperimentResult(
                 spec=spec,
-                timestamp=datetime.now(UTC).replace(microsecond=0),
+                timestamp=self._run_timestamp,
                 aggregated_metrics=summary,
                 per_head_metrics=per_head_metrics,
                 metadata=metadata,
             )
-            log_experiment_result(result, npz_payloads=npz_payloads)
+            with span("log_result"):
+                log_experiment_result(result, npz_payloads=npz_payloads)
             self._record_atlas_experiment(result)
             self._record_geometry(step=1, spec=spec)
             return result
         finally:
             self._finalize_geometry()
 
+    def run_fused(self, specs: Sequence[ExperimentSpec]) -> List[ExperimentResult]:
+        """Run ``specs`` in order, sharing one hooked pass per dataset among recording experiments.
+
+        Probe and geometry specs that read the same dataset have their hook
+        points unioned into a single :class:`HookSpec`; each record runs
+        through the model once and the captured activations are fanned out to
+        every spec's own aggregation. Other experiment types, and recording
+        specs with no partner on their dataset, run exactly as :meth:`run`
+        would. Results match sequential ``run`` calls.
+        """
+
+        self._ensure_torch_available()
+        groups: Dict[str, List[ExperimentSpec]] = defaultdict(list)
+        for spec in specs:
+            if spec.type in FUSABLE_EXPERIMENT_TYPES:
+                groups[self._dataset_identity(spec)].append(spec)
+        resources = self.model_manager.load()
+        model = resources.model
+        tokenizer = resources.tokenizer
+        try:
+            with self.model_manager.persistent_hooks():
+                for identity, group in groups.items():
+                    if len(group) < 2 or model is None or tokenizer is None:
+                        continue
+                    points: Dict[str, HookPoint] = {}
+                    for spec in group:
+                        self._expand_hooks(spec, model)
+                        for point in self._build_probe_hook_points(spec)[0]:
+                            points.setdefault(point.key(), point)
+                    records = self._load_records(group[0])
+                    if not records or not points:
+                        continue
+                    encoded_inputs = self._encode_records(group[0], records, tokenizer, resources.device)
+                    matrices = self._collect_activations(
+                        group[0], encoded_inputs, list(points.values()), {key: key for key in points}
+                    )
+                    self._fused_activations[identity] = (len(encoded_inputs), matrices)
+                    self._fused_spec_ids[identity] = [spec.id for spec in group]
+                    logger.info(
+                        "Fused %d specs over %d records into one pass recording %d hook points",
+                        len(group),
+                        len(encoded_inputs),
+                        len(points),
+                    )
+                return [self.run(spec) for spec in specs]
+        finally:
+            self._fused_activations.clear()
+            self._fused_spec_ids.clear()
+
     def _run_head_ablation(
         self, spec: ExperimentSpec
     ) -> tuple[Dict[str, Any], Dict[str, Dict[str, Dict[str, float]]], Dict[str, Any], Dict[str, Dict[str, np.ndarray]]]:
         self._ensure_torch_available()
-        records = load_dataset_with_limit(spec.dataset, max_records=self.record_limit)
+        records = self._load_records(spec)
         if not records:
             logger.warning("Experiment %s requested head ablation with empty dataset", spec.id)
             empty_summary = {
@@ -167,128 +316,505 @@ class ExperimentRunner:
         if not self._model_is_hookable(model):
             raise RuntimeError("Loaded model does not expose transformer blocks for hook registration")
 
-        encoded_inputs = [self._tokenize_record(record, tokenizer, resources.device) for record in records]
+        encoded_inputs = self._encode_records(spec, records, tokenizer, resources.device)
         self._prepare_residual_sampler(records, tokenizer, model)
-        baseline_stats = self._compute_baseline(encoded_inputs)
-        logger.info("Collected baseline metrics for %d records", len(baseline_stats))
-
-        per_example_results: List[Dict[str, Any]] = []
-        per_head_loss_deltas: Dict[str, List[float]] = defaultdict(list)
-        per_head_accuracy_deltas: Dict[str, List[float]] = defaultdict(list)
-        per_head_importance: Dict[str, List[float]] = defaultdict(list)
-
+        batches = self._build_batches(encoded_inputs, tokenizer)
         total_layers = self._resolve_total_layers(model)
         total_heads = self._resolve_total_heads(model)
+        layers = spec.iter_layers(total_layers=total_layers)
         head_indices = spec.resolve_heads(total_heads=total_heads)
-        for layer in spec.iter_layers(total_layers=total_layers):
-            for head in head_indices:
-                hook_spec = self._build_head_ablation_spec(layer, head)
-                for record_idx, encoded in enumerate(encoded_inputs):
-                    outputs = self._execute_forward(encoded, hook_spec)
-                    loss, accuracy = self._extract_metrics(outputs, encoded["labels"], encoded.get("attention_mask"))
-                    baseline = baseline_stats[record_idx]
-                    loss_delta = compute_loss_delta(baseline.loss, loss)
-                    accuracy_delta = compute_accuracy_delta(baseline.accuracy, accuracy)
-                    key = self._head_key(layer, head)
-                    per_head_loss_deltas[key].append(loss_delta)
-                    per_head_accuracy_deltas[key].append(accuracy_delta)
-                    per_head_importance[key].append(abs(loss_delta))
-                    per_example_results.append(
-                        {
-                            "record_index": record_idx,
-                            "layer": layer,
-                            "head": head,
-                            "baseline_loss": baseline.loss,
-                            "ablated_loss": loss,
-                            "loss_delta": loss_delta,
-                            "baseline_accuracy": baseline.accuracy,
-                            "ablated_accuracy": accuracy,
-                            "accuracy_delta": accuracy_delta,
-                        }
-                    )
-                logger.debug(
-                    "Layer %d head %d processed across %d records", layer, head, len(encoded_inputs)
+        checkpoint = self._open_checkpoint(spec, len(encoded_inputs), layers, head_indices)
+        completed = checkpoint.blocks if checkpoint is not None else {}
+        restored_baseline = checkpoint.baseline if checkpoint is not None else None
+        baseline_source = "checkpoint" if restored_baseline is not None else "computed"
+        baseline_entry = self._baseline_store_entry(spec, tokenizer)
+        if restored_baseline is None and baseline_entry is not None:
+            restored_baseline = self._load_stored_baseline(baseline_entry, len(encoded_inputs))
+            if restored_baseline is not None:
+                baseline_source = "baseline_store"
+        capture_layers = [layer for layer in layers if layer > 0 and layer not in completed]
+        residual_cache = ResidualCache(self.residual_cache_mb * 2**20) if self.residual_cache_mb > 0 else None
+        refill = restored_baseline is not None and residual_cache is not None and bool(capture_layers)
+        if restored_baseline is None:
+            with span("baseline", batches=len(batches)):
+                baseline_stats = self._compute_baseline(
+                    batches,
+                    residual_cache=residual_cache,
+                    capture_layers=capture_layers,
                 )
-
-        baseline_losses = [item.loss for item in baseline_stats]
-        baseline_accuracies = [item.accuracy for item in baseline_stats]
-        all_loss_deltas = [value for values in per_head_loss_deltas.values() for value in values]
-        all_accuracy_deltas = [value for values in per_head_accuracy_deltas.values() for value in values]
-        summary_metrics: Dict[str, Any] = {
-            "baseline": {
-                "loss": compute_loss_metrics(baseline_losses),
-                "accuracy": compute_accuracy_metrics(baseline_accuracies),
-            },
-            "delta": {
-                "loss": compute_delta_metrics(all_loss_deltas),
-                "accuracy": compute_delta_metrics(all_accuracy_deltas),
-            },
+            logger.info("Collected baseline metrics for %d records in %d batches", len(baseline_stats), len(batches))
+            if baseline_entry is not None:
+                self._store_baseline(
+                    spec,
+                    baseline_entry,
+                    [item.loss for item in baseline_stats],
+                    [item.accuracy for item in baseline_stats],
+                )
+        else:
+            baseline_stats = [BaselineMetrics(loss=loss, accuracy=accuracy) for loss, accuracy in zip(*restored_baseline)]
+            if refill:
+                assert residual_cache is not None
+                with span("residual_refill", batches=len(batches)):
+                    self._fill_residual_cache(batches, residual_cache, capture_layers)
+        self._baseline_report = {
+            "source": baseline_source,
+            "baseline_pass": restored_baseline is None,
+            "residual_refill": refill,
         }
-
-        per_head_metrics: Dict[str, Dict[str, Dict[str, float]]] = {}
-        for key in sorted(per_head_loss_deltas.keys()):
-            per_head_metrics[key] = {
-                "loss_delta": compute_delta_metrics(per_head_loss_deltas[key]),
-                "accuracy_delta": compute_delta_metrics(per_head_accuracy_deltas[key]),
-                "importance": compute_delta_metrics(per_head_importance[key]),
-            }
-
-        importance_ranking = rank_heads_by_importance(
-            {key: metrics["importance"] for key, metrics in per_head_metrics.items()}
+        if checkpoint is not None and checkpoint.baseline is None:
+            checkpoint.write_baseline([item.loss for item in baseline_stats], [item.accuracy for item in baseline_stats])
+
+        baseline_losses = np.array([item.loss for item in baseline_stats], dtype=np.float64)
+        baseline_accuracies = np.array([item.accuracy for item in baseline_stats], dtype=np.float64)
+        stopping = spec.early_stopping
+        search = spec.search if spec.search is not None and spec.search.strategy == HIERARCHICAL_SEARCH else None
+        # Dense [layers, heads, records] results, one [heads, records] block per swept layer. With
+        # early stopping or hierarchical search, cells that were never evaluated stay NaN.
+        shape = (len(layers), len(head_indices), len(encoded_inputs))
+        partial = stopping is not None or search is not None
+        ablated_losses = np.full(shape, np.nan if partial else 0.0)
+        ablated_accuracies = np.full(shape, np.nan if partial else 0.0)
+        batch_order = list(range(len(batches)))
+        if stopping is not None:
+            # Batches are length-sorted; a shuffled visit order keeps early samples representative.
+            batch_order = np.random.default_rng(stopping.seed).permutation(len(batches)).tolist()
+        sweep = _HeadSweep(
+            batches=batches,
+            batch_order=batch_order,
+            model=model,
+            heads=head_indices,
+            total_heads=total_heads,
+            records=len(encoded_inputs),
+            baseline_losses=baseline_losses,
+            residual_cache=residual_cache,
+            stopping=stopping,
+            search=search,
         )
+        pending: List[Tuple[int, int]] = []
+        for layer_pos, layer in enumerate(layers):
+            if layer in completed:
+                ablated_losses[layer_pos], ablated_accuracies[layer_pos] = completed[layer]
+                logger.debug("Layer %d restored from checkpoint", layer)
+            else:
+                pending.append((layer_pos, layer))
+        layer_groups: Dict[int, List[Dict[str, Any]]] = {}
+        for (layer_pos, layer), (losses, accuracies, groups) in self._sweep_layers(sweep, pending, resources.device):
+            # Workers finish in any order; results are placed by layer position.
+            ablated_losses[layer_pos], ablated_accuracies[layer_pos] = losses, accuracies
+            layer_groups[layer_pos] = groups
+            logger.debug("Layer %d: %d heads processed across %d records", layer, len(head_indices), len(encoded_inputs))
+            if checkpoint is not None:
+                checkpoint.write_block(layer, losses, accuracies)
+        search_groups = [group for layer_pos in sorted(layer_groups) for group in layer_groups[layer_pos]]
+
+        with span("aggregate"):
+            loss_deltas = self._relative_loss_deltas(ablated_losses, baseline_losses)
+            accuracy_deltas = ablated_accuracies - baseline_accuracies
+            summary_metrics: Dict[str, Any] = {
+                "baseline": {
+                    "loss": compute_loss_metrics(baseline_losses.tolist()),
+                    "accuracy": compute_accuracy_metrics(baseline_accuracies.tolist()),
+                },
+                "delta": {
+                    "loss": self._array_metrics(loss_deltas),
+                    "accuracy": self._array_metrics(accuracy_deltas),
+                },
+            }
 
-        mean_loss_deltas = []
-        mean_accuracy_deltas = []
-        for key in sorted(per_head_loss_deltas.keys()):
-            loss_values = per_head_loss_deltas[key]
-            accuracy_values = per_head_accuracy_deltas.get(key, [])
-            if not loss_values or not accuracy_values:
-                continue
-            mean_loss_deltas.append(float(mean(loss_values)))
-            mean_accuracy_deltas.append(float(mean(accuracy_values)))
-        if mean_loss_deltas and mean_accuracy_deltas:
-            summary_metrics["correlations"] = compute_task_correlations(
+            per_head_metrics, importance = self._per_head_metric_dicts(
+                layers,
+                head_indices,
                 {
-                    "loss_delta": mean_loss_deltas,
-                    "accuracy_delta": mean_accuracy_deltas,
-                }
+                    "loss_delta": loss_deltas,
+                    "accuracy_delta": accuracy_deltas,
+                    "importance": np.abs(loss_deltas),
+                },
             )
+            importance_ranking = rank_heads_by_importance_array(importance, layers, head_indices)
+            if per_head_metrics:
+                order = self._sorted_head_order(layers, head_indices)
+                mean_loss_deltas = summarize_metric_array(loss_deltas)["mean"].reshape(-1)[order]
+                mean_accuracy_deltas = summarize_metric_array(accuracy_deltas)["mean"].reshape(-1)[order]
+                measured = ~np.isnan(mean_loss_deltas)
+                summary_metrics["correlations"] = compute_task_correlations_array(
+                    {"loss_delta": mean_loss_deltas[measured], "accuracy_delta": mean_accuracy_deltas[measured]}
+                )
 
         metadata = {
             "type": spec.type.value,
             "dataset": spec.dataset.name,
             "records": len(records),
-            "layers": spec.iter_layers(total_layers=total_layers),
+            "layers": layers,
             "heads": head_indices,
             "total_heads": total_heads,
             "importance_ranking": importance_ranking,
         }
-        if per_example_results:
-            metadata["per_example_preview"] = per_example_results[: min(5, len(per_example_results))]
+        if residual_cache is not None:
+            metadata["residual_cache"] = residual_cache.stats()
+            residual_cache.clear()
+        evaluated = None
+        if partial:
+            evaluated = ~np.isnan(ablated_losses)
+        if search is not None:
+            metadata["head_search"] = {
+                **search.to_dict(),
+                "forwards_per_record": len(search_groups),
+                "exhaustive_forwards_per_record": len(layers) * len(head_indices),
+                "heads_measured": int(evaluated.any(axis=-1).sum()),
+                "groups": search_groups,
+            }
+        if stopping is not None:
+            metadata["early_stopping"] = self._early_stopping_report(stopping, layers, head_indices, loss_deltas, evaluated)
 
         npz_payloads: Dict[str, Dict[str, np.ndarray]] = {}
-        if per_example_results:
-            per_example_payload = {
-                "record_index": np.array([item["record_index"] for item in per_example_results], dtype=np.int32),
-                "layer": np.array([item["layer"] for item in per_example_results], dtype=np.int32),
-                "head": np.array([item["head"] for item in per_example_results], dtype=np.int32),
-                "baseline_loss": np.array([item["baseline_loss"] for item in per_example_results], dtype=np.float32),
-                "ablated_loss": np.array([item["ablated_loss"] for item in per_example_results], dtype=np.float32),
-                "loss_delta": np.array([item["loss_delta"] for item in per_example_results], dtype=np.float32),
-                "baseline_accuracy": np.array(
-                    [item["baseline_accuracy"] for item in per_example_results], dtype=np.float32
-                ),
-                "ablated_accuracy": np.array(
-                    [item["ablated_accuracy"] for item in per_example_results], dtype=np.float32
-                ),
-                "accuracy_delta": np.array(
-                    [item["accuracy_delta"] for item in per_example_results], dtype=np.float32
-                ),
+        if loss_deltas.size:
+            per_example = {
+                "baseline_loss": np.broadcast_to(baseline_losses, shape),
+                "ablated_loss": ablated_losses,
+                "loss_delta": loss_deltas,
+                "baseline_accuracy": np.broadcast_to(baseline_accuracies, shape),
+                "ablated_accuracy": ablated_accuracies,
+                "accuracy_delta": accuracy_deltas,
             }
-            npz_payloads["per_example"] = per_example_payload
+            metadata["per_example_preview"] = self._per_example_preview(layers, head_indices, per_example, evaluated)
+            npz_payloads["per_example"] = self._per_example_arrays(layers, head_indices, per_example, evaluated)
 
         return summary_metrics, per_head_metrics, metadata, npz_payloads
 
+    def _sweep_layers(
+        self, sweep: _HeadSweep, pending: Sequence[Tuple[int, int]], device: Any
+    ) -> Iterator[Tuple[Tuple[int, int], Tuple[np.ndarray, np.ndarray, List[Dict[str, Any]]]]]:
+        """Yield ``((layer_pos, layer), _sweep_layer(...))`` for every pending layer.
+
+        With ``workers > 1`` on CPU, layers are swept by forked worker processes
+        that share the model weights; results arrive in completion order.
+        """
+
+        workers = min(self.workers, len(pending))
+        if workers > 1 and torch is not None and torch.device(device).type != "cpu":
+            logger.warning("Multi-process head ablation only runs on CPU; using one process on %s", device)
+            workers = 1
+        if workers <= 1:
+            for item in pending:
+                with span("sweep.layer", layer=item[1]):
+                    result = self._sweep_layer(sweep, item[1])
+                yield item, result
+            return
+        sweep.model.share_memory()
+        cache = sweep.residual_cache
+        for item, (result, hits, misses) in fork_map(
+            lambda item: self._sweep_layer_in_worker(sweep, item[1]), pending, workers, self.threads_per_worker
+        ):
+            if cache is not None:
+                cache.hits += hits
+                cache.misses += misses
+            yield item, result
+
+    def _sweep_layer_in_worker(
+        self, sweep: _HeadSweep, layer: int
+    ) -> Tuple[Tuple[np.ndarray, np.ndarray, List[Dict[str, Any]]], int, int]:
+        # Worker-side cache counters are lost with the process, so report them with the result.
+        cache = sweep.residual_cache
+        hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+        result = self._sweep_layer(sweep, layer)
+        if cache is None:
+            return result, 0, 0
+        return result, cache.hits - hits, cache.misses - misses
+
+    def _sweep_layer(self, sweep: _HeadSweep, layer: int) -> Tuple[np.ndarray, np.ndarray, List[Dict[str, Any]]]:
+        """Ablate every head of ``sweep.heads`` in ``layer``.
+
+        Returns ``[heads, records]`` losses and accuracies (NaN where early
+        stopping or hierarchical search skipped a cell) and, for hierarchical
+        search, the ablated groups.
+        """
+
+        shape = (len(sweep.heads), sweep.records)
+        fill = np.nan if sweep.stopping is not None or sweep.search is not None else 0.0
+        losses_out = np.full(shape, fill)
+        accuracies_out = np.full(shape, fill)
+        if sweep.search is not None:
+            groups = self._search_layer_heads(sweep, layer, losses_out, accuracies_out)
+            return losses_out, accuracies_out, groups
+        head_positions = {head: position for position, head in enumerate(sweep.heads)}
+        effect_test = None
+        if sweep.stopping is not None:
+            effect_test = SequentialEffectTest(
+                len(sweep.heads),
+                sweep.stopping.threshold,
+                sweep.stopping.confidence,
+                sweep.stopping.min_records,
+                records=sweep.records,
+                check_every=sweep.stopping.check_every,
+            )
+        active_heads = list(sweep.heads)
+        for batch_idx in sweep.batch_order:
+            if not active_heads:
+                break
+            batch = sweep.batches[batch_idx]
+            record_indices = np.asarray(batch.record_indices)
+            for head_chunk in self._head_chunks(active_heads, batch, sweep.model):
+                inputs, hook_spec = self._build_head_chunk_forward(batch, layer, head_chunk, sweep.total_heads)
+                outputs = self._execute_layer_forward(
+                    inputs, hook_spec, layer, sweep.residual_cache, batch_idx, repeats=len(head_chunk)
+                )
+                losses, accuracies = self._extract_metrics(outputs, inputs["labels"], inputs.get("attention_mask"))
+                cells = np.ix_([head_positions[head] for head in head_chunk], record_indices)
+                chunk_shape = (len(head_chunk), batch.size)
+                losses_out[cells] = np.reshape(losses, chunk_shape)
+                accuracies_out[cells] = np.reshape(accuracies, chunk_shape)
+            if effect_test is not None:
+                positions = [head_positions[head] for head in active_heads]
+                effect_test.update(
+                    positions,
+                    self._relative_loss_deltas(
+                        losses_out[np.ix_(positions, record_indices)], sweep.baseline_losses[record_indices]
+                    ),
+                )
+                decided = effect_test.check()
+                active_heads = [head for head in active_heads if not decided[head_positions[head]]]
+        return losses_out, accuracies_out, []
+
+    def _search_layer_heads(
+        self,
+        sweep: _HeadSweep,
+        layer: int,
+        losses_out: np.ndarray,
+        accuracies_out: np.ndarray,
+    ) -> List[Dict[str, Any]]:
+        """Coarse-to-fine ablation of ``heads`` in ``layer``.
+
+        Starts from one group holding every head and splits a group into
+        ``search.branching`` parts only while its importance (mean absolute
+        relative loss delta) exceeds ``search.threshold``. Single-head results are written into the
+        ``[heads, records]`` rows of ``losses_out``/``accuracies_out``; the
+        returned entries describe every group that was ablated.
+        """
+
+        search = sweep.search
+        assert search is not None
+        positions = {head: position for position, head in enumerate(sweep.heads)}
+        report: List[Dict[str, Any]] = []
+        frontier = [list(sweep.heads)] if sweep.heads else []
+        while frontier:
+            group_losses, group_accuracies = self._evaluate_head_groups(
+                sweep.batches, layer, frontier, sweep.total_heads, sweep.model, sweep.residual_cache
+            )
+            group_deltas = self._relative_loss_deltas(group_losses, sweep.baseline_losses)
+            refined: List[List[int]] = []
+            for group, losses, accuracies, deltas in zip(frontier, group_losses, group_accuracies, group_deltas):
+                importance = float(np.abs(deltas).mean()) if deltas.size else 0.0
+                split = len(group) > 1 and importance > search.threshold
+                report.append(
+                    {
+                        "layer": layer,
+                        "heads": list(group),
+                        "loss_delta": float(deltas.mean()) if deltas.size else 0.0,
+                        "importance": importance,
+                        "refined": split,
+                    }
+                )
+                if len(group) == 1:
+                    losses_out[positions[group[0]]] = losses
+                    accuracies_out[positions[group[0]]] = accuracies
+                elif split:
+                    refined.extend(part.tolist() for part in np.array_split(group, search.branching) if part.size)
+            frontier = refined
+        return report
+
+    def _evaluate_head_groups(
+        self,
+        batches: Sequence[EncodedBatch],
+        layer: int,
+        groups: Sequence[Sequence[int]],
+        total_heads: int,
+        model: Any,
+        residual_cache: ResidualCache | None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-record ``[groups, records]`` losses/accuracies with each group of ``layer`` ablated jointly."""
+
+        records = sum(batch.size for batch in batches)
+        losses_out = np.zeros((len(groups), records), dtype=np.float64)
+        accuracies_out = np.zeros((len(groups), records), dtype=np.float64)
+        for batch_idx, batch in enumerate(batches):
+            record_indices = np.asarray(batch.record_indices)
+            for chunk in self._head_chunks(list(range(len(groups))), batch, model):
+                inputs, hook_spec = self._build_head_group_forward(
+                    batch, layer, [groups[idx] for idx in chunk], total_heads
+                )
+                outputs = self._execute_layer_forward(
+                    inputs, hook_spec, layer, residual_cache, batch_idx, repeats=len(chunk)
+                )
+                losses, accuracies = self._extract_metrics(outputs, inputs["labels"], inputs.get("attention_mask"))
+                cells = np.ix_(chunk, record_indices)
+                losses_out[cells] = np.reshape(losses, (len(chunk), batch.size))
+                accuracies_out[cells] = np.reshape(accuracies, (len(chunk), batch.size))
+        return losses_out, accuracies_out
+
+    @staticmethod
+    def _relative_loss_deltas(ablated_losses: np.ndarray, baseline_losses: np.ndarray) -> np.ndarray:
+        """Vectorized :func:`compute_loss_delta`; NaN (unevaluated) entries stay NaN."""
+
+        safe_baseline = np.where(baseline_losses == 0, 1.0, baseline_losses)
+        deltas = (ablated_losses - baseline_losses) / safe_baseline
+        return np.where((baseline_losses == 0) & ~np.isnan(ablated_losses), 0.0, deltas)
+
+    def _early_stopping_report(
+        self,
+        stopping: EarlyStoppingSpec,
+        layers: Sequence[int],
+        heads: Sequence[int],
+        loss_deltas: np.ndarray,
+        evaluated: np.ndarray,
+    ) -> Dict[str, Any]:
+        """Per-head sample counts and stopping decisions for an early-stopped sweep."""
+
+        flat = loss_deltas.reshape(-1, loss_deltas.shape[-1])
+        effect_test = SequentialEffectTest(
+            len(flat),
+            stopping.threshold,
+            stopping.confidence,
+            stopping.min_records,
+            records=flat.shape[-1],
+            check_every=stopping.check_every,
+        )
+        effect_test.update(range(len(flat)), flat)
+        decisions = effect_test.decisions()
+        samples = evaluated.sum(axis=-1).reshape(-1).tolist()
+        order = self._sorted_head_order(layers, heads).tolist()
+        keys = [self._head_key(layer, head) for layer in layers for head in heads]
+        return {
+            **stopping.to_dict(),
+            "correction": "bonferroni",
+            "planned_looks": effect_test.looks,
+            "records_evaluated": int(evaluated.sum()),
+            "records_budget": int(evaluated.size),
+            "samples": {keys[position]: int(samples[position]) for position in order},
+            "decisions": {keys[position]: decisions[position] for position in order},
+        }
+
+    def _run_head_attribution(
+        self, spec: ExperimentSpec
+    ) -> tuple[Dict[str, Any], Dict[str, Dict[str, Dict[str, float]]], Dict[str, Any], Dict[str, Dict[str, np.ndarray]]]:
+        """Estimate head-ablation effects with attribution patching.
+
+        One forward and one backward pass per batch capture every swept
+        layer's ``self_attn`` output ``a`` and ``g = d loss / d a``. Zeroing a
+        head changes ``a`` by ``-a`` on that head's ``head_dim`` slice, so the
+        first-order loss change is ``-(g * a)`` summed over the slice and all
+        positions. Per-record losses are independent rows, so one backward on
+        their sum yields every record's gradient. Only loss deltas are
+        estimated; accuracy is not differentiable and is reported for the
+        baseline only.
+        """
+
+        self._ensure_torch_available()
+        records = self._load_records(spec)
+        if not records:
+            logger.warning("Experiment %s requested head attribution with empty dataset", spec.id)
+            empty_summary = {
+                "baseline": {
+                    "loss": compute_loss_metrics([]),
+                    "accuracy": compute_accuracy_metrics([]),
+                },
+                "delta": {"loss": compute_delta_metrics([])},
+            }
+            return empty_summary, {}, {
+                "type": spec.type.value,
+                "dataset": spec.dataset.name,
+                "records": 0,
+                "layers": [] if spec.layers == "all" else spec.iter_layers(),
+                "heads": [],
+                "importance_ranking": [],
+                "estimator": ATTRIBUTION_MODE,
+            }, {}
+
+        resources = self.model_manager.load()
+        model = resources.model
+        tokenizer = resources.tokenizer
+        if model is None or tokenizer is None:
+            raise RuntimeError("Model and tokenizer must be loaded for head attribution experiments")
+        if not self._model_is_hookable(model):
+            raise RuntimeError("Loaded model does not expose transformer blocks for hook registration")
+
+        encoded_inputs = self._encode_records(spec, records, tokenizer, resources.device)
+        self._prepare_residual_sampler(records, tokenizer, model)
+        batches = self._build_batches(encoded_inputs, tokenizer)
+        total_layers = self._resolve_total_layers(model)
+        total_heads = self._resolve_total_heads(model)
+        layers = spec.iter_layers(total_layers=total_layers)
+        head_indices = spec.resolve_heads(total_heads=total_heads)
+        points = [HookPoint(layer, "self_attn") for layer in layers]
+
+        baseline_losses = np.zeros(len(encoded_inputs), dtype=np.float64)
+        baseline_accuracies = np.zeros(len(encoded_inputs), dtype=np.float64)
+        # estimates[layer_pos, head_pos, record] holds the signed first-order loss change -(g * a)
+        # of zeroing that head; importance takes its absolute value.
+        estimates = np.zeros((len(layers), len(head_indices), len(encoded_inputs)), dtype=np.float64)
+        for batch in batches:
+            inputs = batch.inputs
+            metrics: Dict[str, Tensor] = {}
+
+            def loss_fn(outputs: Any) -> Tensor:
+                losses, accuracies = self._token_metrics(outputs.logits, inputs["labels"], inputs.get("attention_mask"))
+                metrics["losses"], metrics["accuracies"] = losses.detach(), accuracies.detach()
+                return losses.sum()
+
+            _, captured = self.model_manager.forward_with_gradients(self._model_inputs(inputs), points, loss_fn)
+            host = torch.stack([metrics["losses"], metrics["accuracies"]]).cpu().numpy()
+            baseline_losses[batch.record_indices] = host[0]
+            baseline_accuracies[batch.record_indices] = host[1]
+            for layer_pos, point in enumerate(points):
+                activation, grad = captured[point.key()]
+                rows, seq_len, hidden = activation.shape
+                head_dim = hidden // total_heads
+                per_head = -(grad.float() * activation.float()).view(rows, seq_len, total_heads, head_dim).sum(dim=(1, 3))
+                per_head = per_head[:, head_indices].cpu().numpy()
+                estimates[layer_pos][:, batch.record_indices] = per_head.T
+        logger.info(
+            "Attributed %d layers x %d heads over %d records in %d forward/backward passes",
+            len(layers),
+            len(head_indices),
+            len(encoded_inputs),
+            len(batches),
+        )
+
+        with span("aggregate"):
+            estimated_losses = baseline_losses + estimates
+            loss_deltas = self._relative_loss_deltas(estimated_losses, baseline_losses)
+            per_head_metrics, importance = self._per_head_metric_dicts(
+                layers, head_indices, {"loss_delta": loss_deltas, "importance": np.abs(loss_deltas)}
+            )
+            summary_metrics: Dict[str, Any] = {
+                "baseline": {
+                    "loss": compute_loss_metrics(baseline_losses.tolist()),
+                    "accuracy": compute_accuracy_metrics(baseline_accuracies.tolist()),
+                },
+                "delta": {"loss": self._array_metrics(loss_deltas)},
+            }
+        per_example = {
+            "baseline_loss": np.broadcast_to(baseline_losses, estimates.shape),
+            "estimated_loss": estimated_losses,
+            "loss_delta": loss_deltas,
+        }
+        metadata = {
+            "type": spec.type.value,
+            "dataset": spec.dataset.name,
+            "records": len(records),
+            "layers": layers,
+            "heads": head_indices,
+            "total_heads": total_heads,
+            "importance_ranking": rank_heads_by_importance_array(importance, layers, head_indices),
+            "estimator": ATTRIBUTION_MODE,
+            "forward_passes": len(batches),
+            "backward_passes": len(batches),
+            "per_example_preview": self._per_example_preview(layers, head_indices, per_example),
+        }
+        npz_payloads: Dict[str, Dict[str, np.ndarray]] = {
+            "per_example": self._per_example_arrays(layers, head_indices, per_example)
+        }
+        return summary_metrics, per_head_metrics, metadata, npz_payloads
+
     def _run_probe(
         self, spec: ExperimentSpec
     ) -> tuple[Dict[str, Any], Dict[str, Dict[str, Dict[str, float]]], Dict[str, Any], Dict[str, Dict[str, np.ndarray]]]:
@@ -302,7 +828,7 @@ class ExperimentRunner:
         self._expand_hooks(spec, model)
         if not spec.hooks:
             raise ValueError("Probe experiments require at least one hook definition")
-        records = load_dataset_with_limit(spec.dataset, max_records=self.record_limit)
+        records = self._load_records(spec)
         if not records:
             logger.warning("Experiment %s requested probe run with empty dataset", spec.id)
             return {"probe": {}}, {}, {
@@ -312,46 +838,39 @@ class ExperimentRunner:
                 "hooks": [hook.name for hook in spec.hooks],
             }, {}
 
-        encoded_inputs = [self._tokenize_record(record, tokenizer, resources.device) for record in records]
+        encoded_inputs = self._encode_records(spec, records, tokenizer, resources.device)
         hook_points, hook_aliases = self._build_probe_hook_points(spec)
-        hook_spec = HookSpec(record_points=hook_points)
+        activations_by_hook = self._collect_activations(spec, encoded_inputs, hook_points, hook_aliases)
 
-        per_record_activations: List[Dict[str, np.ndarray]] = []
         labels: List[float] = []
         label_encoder: Dict[str, float] = {}
-        for record, encoded in zip(records, encoded_inputs):
-            _outputs, activations = self._forward_with_spec(encoded, hook_spec)
+        for record in records:
             labels.append(self._encode_probe_label(record.label, label_encoder))
-            flattened: Dict[str, np.ndarray] = {}
-            for key, tensor in activations.items():
-                hook_name = hook_aliases.get(key)
-                if hook_name is None:
-                    continue
-                flattened[hook_name] = self._flatten_activation(tensor)
-            per_record_activations.append(flattened)
 
-        def _aggregate_vectors(indices: List[int]) -> Dict[str, List[np.ndarray]]:
-            vectors: Dict[str, List[np.ndarray]] = {alias: [] for alias in hook_aliases.values()}
-            for idx in indices:
-                for hook_name, activation in per_record_activations[idx].items():
-                    vectors[hook_name].append(activation)
-            return vectors
+        def _aggregate_vectors(indices: List[int]) -> Dict[str, np.ndarray]:
+            return {hook_name: matrix[indices] for hook_name, matrix in activations_by_hook.items()}
 
         def _train_and_evaluate(
-            activations_by_hook: Dict[str, List[np.ndarray]], label_values: np.ndarray
+            activations_by_hook: Dict[str, np.ndarray], label_values: np.ndarray, task: ProbeTaskSpec | None = None
         ) -> tuple[Dict[str, Any], Dict[str, Dict[str, np.ndarray]]]:
             summary: Dict[str, Any] = {}
             payloads: Dict[str, Dict[str, np.ndarray]] = {}
-            for hook_name, vectors in activations_by_hook.items():
-                if not vectors:
+            for hook_name, activations_array in activations_by_hook.items():
+                if len(activations_array) == 0:
                     continue
-                activations_array = np.stack(vectors, axis=0)
                 train_end, test_start = self._probe_split_indices(activations_array.shape[0])
                 train_acts = activations_array[:train_end]
                 train_labels = label_values[:train_end]
                 test_acts = activations_array[test_start:]
                 test_labels = label_values[test_start:]
-                probe = train_linear_probe(train_acts, train_labels)
+                ridge_path = None
+                with span("probe.fit", hook=hook_name):
+                    if task is not None and task.penalties and train_acts.shape[0] >= 2:
+                        probe, ridge_path = train_linear_probe_cv(
+                            train_acts, train_labels, task.penalties, task.cv_folds
+                        )
+                    else:
+                        probe = train_linear_probe(train_acts, train_labels)
                 train_mse, train_corr = evaluate_probe(probe, train_acts, train_labels)
                 if test_acts.shape[0] >= 2:
                     test_mse, test_corr = evaluate_probe(probe, test_acts, test_labels)
@@ -367,6 +886,9 @@ class ExperimentRunner:
                     "test_mse": test_mse,
                     "test_corr": test_corr,
                 }
+                if ridge_path is not None:
+                    summary[hook_name]["penalty"] = ridge_path.best_penalty
+                    summary[hook_name]["ridge_path"] = ridge_path.to_dict()
                 payloads[hook_name] = {
                     "activations": activations_array.astype(np.float32),
                     "labels": label_values.astype(np.float32),
@@ -395,7 +917,7 @@ class ExperimentRunner:
                     continue
                 task_vectors = _aggregate_vectors(task_indices)
                 task_label_array = np.asarray(task_labels, dtype=np.float32)
-                task_summary, task_payloads = _train_and_evaluate(task_vectors, task_label_array)
+                task_summary, task_payloads = _train_and_evaluate(task_vectors, task_label_array, task)
                 task_results[task.name] = task_summary
                 for hook_name, payload in task_payloads.items():
                     npz_payloads[f"{task.name}:{hook_name}"] = payload
@@ -418,7 +940,7 @@ class ExperimentRunner:
         self._ensure_torch_available()
         if not spec.interventions:
             raise ValueError("direction_intervention specs require at least one intervention definition")
-        records = load_dataset_with_limit(spec.dataset, max_records=self.record_limit)
+        records = self._load_records(spec)
         if not records:
             logger.warning("Experiment %s requested intervention run with empty dataset", spec.id)
             empty_summary = {
@@ -448,61 +970,52 @@ class ExperimentRunner:
         if tokenizer is None:
             raise RuntimeError("Tokenizer must be available for intervention experiments")
 
-        encoded_inputs = [self._tokenize_record(record, tokenizer, resources.device) for record in records]
-        intervention_spec, intervention_details = self._build_intervention_hook_spec(spec)
-        baseline_spec = HookSpec()
-
-        baseline_losses: List[float] = []
-        baseline_accuracies: List[float] = []
-        intervention_losses: List[float] = []
-        intervention_accuracies: List[float] = []
-        loss_deltas: List[float] = []
-        accuracy_deltas: List[float] = []
-        per_example_results: List[Dict[str, Any]] = []
-
-        for record_idx, encoded in enumerate(encoded_inputs):
-            baseline_outputs, _ = self._forward_with_spec(encoded, baseline_spec)
-            base_loss, base_accuracy = self._extract_metrics(
-                baseline_outputs, encoded["labels"], encoded.get("attention_mask")
-            )
-            intervention_outputs, _ = self._forward_with_spec(encoded, intervention_spec)
-            perturbed_loss, perturbed_accuracy = self._extract_metrics(
-                intervention_outputs, encoded["labels"], encoded.get("attention_mask")
-            )
-            baseline_losses.append(base_loss)
-            baseline_accuracies.append(base_accuracy)
-            intervention_losses.append(perturbed_loss)
-            intervention_accuracies.append(perturbed_accuracy)
-            loss_delta = compute_loss_delta(base_loss, perturbed_loss)
-            accuracy_delta = compute_accuracy_delta(base_accuracy, perturbed_accuracy)
-            loss_deltas.append(loss_delta)
-            accuracy_deltas.append(accuracy_delta)
-            per_example_results.append(
-                {
-                    "record_index": record_idx,
-                    "baseline_loss": base_loss,
-                    "intervention_loss": perturbed_loss,
-                    "loss_delta": loss_delta,
-                    "baseline_accuracy": base_accuracy,
-                    "intervention_accuracy": perturbed_accuracy,
-                    "accuracy_delta": accuracy_delta,
-                }
-            )
+        encoded_inputs = self._encode_records(spec, records, tokenizer, resources.device)
+        batches = self._build_batches(encoded_inputs, tokenizer)
+        points, deltas, scale_rows, intervention_details = self._prepare_interventions(spec, resources.model)
+        baseline_entry = self._baseline_store_entry(spec, tokenizer)
+        stored = self._load_stored_baseline(baseline_entry, len(encoded_inputs)) if baseline_entry else None
+        # Row 0 is the baseline; rows 1..K apply the interventions at each swept scale.
+        losses, accuracies = self._run_intervention_rows(
+            batches, points, deltas, scale_rows, resources.model, baseline=stored
+        )
+        baseline_losses, baseline_accuracies = losses[0], accuracies[0]
+        if stored is None and baseline_entry is not None:
+            self._store_baseline(spec, baseline_entry, baseline_losses, baseline_accuracies)
+        self._baseline_report = {
+            "source": "computed" if stored is None else "baseline_store",
+            "baseline_pass": stored is None,
+            "residual_refill": False,
+        }
+        loss_deltas = self._relative_loss_deltas(losses[1:], baseline_losses)
+        accuracy_deltas = accuracies[1:] - baseline_accuracies
+
+        def _row_metrics(row: int) -> Dict[str, Any]:
+            return {
+                "intervention": {
+                    "loss": compute_loss_metrics(losses[row + 1].tolist()),
+                    "accuracy": compute_accuracy_metrics(accuracies[row + 1].tolist()),
+                },
+                "delta": {
+                    "loss": compute_delta_metrics(loss_deltas[row].tolist()),
+                    "accuracy": compute_delta_metrics(accuracy_deltas[row].tolist()),
+                },
+            }
 
-        summary_metrics = {
+        sweep = len(scale_rows) > 1
+        summary_metrics: Dict[str, Any] = {
             "baseline": {
-                "loss": compute_loss_metrics(baseline_losses),
-                "accuracy": compute_accuracy_metrics(baseline_accuracies),
-            },
-            "intervention": {
-                "loss": compute_loss_metrics(intervention_losses),
-                "accuracy": compute_accuracy_metrics(intervention_accuracies),
-            },
-            "delta": {
-                "loss": compute_delta_metrics(loss_deltas),
-                "accuracy": compute_delta_metrics(accuracy_deltas),
+                "loss": compute_loss_metrics(baseline_losses.tolist()),
+                "accuracy": compute_accuracy_metrics(baseline_accuracies.tolist()),
             },
         }
+        if sweep:
+            names = [definition.name for definition in spec.interventions]
+            summary_metrics["sweep"] = [
+                {"scales": dict(zip(names, scales)), **_row_metrics(row)} for row, scales in enumerate(scale_rows)
+            ]
+        else:
+            summary_metrics.update(_row_metrics(0))
 
         metadata = {
             "type": spec.type.value,
@@ -510,28 +1023,38 @@ class ExperimentRunner:
             "records": len(records),
             "interventions": intervention_details,
         }
-        if per_example_results:
-            metadata["per_example_preview"] = per_example_results[: min(5, len(per_example_results))]
-
-        npz_payloads: Dict[str, Dict[str, np.ndarray]] = {}
-        if per_example_results:
-            npz_payloads["direction_intervention"] = {
-                "record_index": np.array([item["record_index"] for item in per_example_results], dtype=np.int32),
-                "baseline_loss": np.array([item["baseline_loss"] for item in per_example_results], dtype=np.float32),
-                "intervention_loss": np.array(
-                    [item["intervention_loss"] for item in per_example_results], dtype=np.float32
-                ),
-                "baseline_accuracy": np.array(
-                    [item["baseline_accuracy"] for item in per_example_results], dtype=np.float32
-                ),
-                "intervention_accuracy": np.array(
-                    [item["intervention_accuracy"] for item in per_example_results], dtype=np.float32
-                ),
-                "loss_delta": np.array([item["loss_delta"] for item in per_example_results], dtype=np.float32),
-                "accuracy_delta": np.array(
-                    [item["accuracy_delta"] for item in per_example_results], dtype=np.float32
-                ),
+        # A single scale keeps the historical 1-D per-record layout; sweeps add a leading scale axis.
+        per_scale = slice(None) if sweep else 0
+        per_example = {
+            "intervention_loss": losses[1:][per_scale],
+            "loss_delta": loss_deltas[per_scale],
+            "intervention_accuracy": accuracies[1:][per_scale],
+            "accuracy_delta": accuracy_deltas[per_scale],
+        }
+        preview_count = min(5, len(records))
+        metadata["per_example_preview"] = [
+            {
+                "record_index": record_idx,
+                "baseline_loss": float(baseline_losses[record_idx]),
+                "intervention_loss": per_example["intervention_loss"][..., record_idx].tolist(),
+                "loss_delta": per_example["loss_delta"][..., record_idx].tolist(),
+                "baseline_accuracy": float(baseline_accuracies[record_idx]),
+                "intervention_accuracy": per_example["intervention_accuracy"][..., record_idx].tolist(),
+                "accuracy_delta": per_example["accuracy_delta"][..., record_idx].tolist(),
+            }
+            for record_idx in range(preview_count)
+        ]
+
+        npz_payloads: Dict[str, Dict[str, np.ndarray]] = {
+            "direction_intervention": {
+                "record_index": np.arange(len(records), dtype=np.int32),
+                "baseline_loss": baseline_losses.astype(np.float32),
+                "baseline_accuracy": baseline_accuracies.astype(np.float32),
+                **{key: np.asarray(values, dtype=np.float32) for key, values in per_example.items()},
             }
+        }
+        if sweep:
+            npz_payloads["direction_intervention"]["scales"] = np.asarray(scale_rows, dtype=np.float32)
 
         return summary_metrics, {}, metadata, npz_payloads
 
@@ -545,7 +1068,7 @@ class ExperimentRunner:
             raise RuntimeError("Model must be loaded for geometry experiments")
         # Expand hooks from template or auto-generate
         self._expand_hooks(spec, model)
-        records = load_dataset_with_limit(spec.dataset, max_records=self.record_limit)
+        records = self._load_records(spec)
         if not records:
             logger.warning("Experiment %s requested geometry run with empty dataset", spec.id)
             return {"geometry": {}}, {}, {
@@ -560,31 +1083,29 @@ class ExperimentRunner:
         if tokenizer is None:
             raise RuntimeError("Tokenizer must be available for geometry experiments")
 
-        encoded_inputs = [self._tokenize_record(record, tokenizer, resources.device) for record in records]
+        encoded_inputs = self._encode_records(spec, records, tokenizer, resources.device)
         hook_points, hook_aliases = self._build_probe_hook_points(spec)
-        hook_spec = HookSpec(record_points=hook_points)
-
-        activations_by_hook: Dict[str, List[np.ndarray]] = {alias: [] for alias in hook_aliases.values()}
-        for encoded in encoded_inputs:
-            _outputs, activations = self._forward_with_spec(encoded, hook_spec)
-            for key, tensor in activations.items():
-                hook_name = hook_aliases.get(key)
-                if hook_name is None:
-                    continue
-                activations_by_hook[hook_name].append(self._flatten_activation(tensor))
+        activations_by_hook = self._collect_activations(spec, encoded_inputs, hook_points, hook_aliases)
 
         config: GeometryConfig = spec.geometry or GeometryConfig()
         summary_metrics: Dict[str, Any] = {"geometry": {}}
         npz_payloads: Dict[str, Dict[str, np.ndarray]] = {}
+        algorithms: Dict[str, str] = {}
 
-        for hook_name, vectors in activations_by_hook.items():
-            if len(vectors) < 2:
+        for hook_name, matrix in activations_by_hook.items():
+            if len(matrix) < 2:
                 logger.warning("Geometry hook %s skipped due to insufficient samples", hook_name)
                 continue
-            matrix = np.stack(vectors, axis=0)
+            algorithm = config.algorithm
+            if algorithm == "auto":
+                algorithm = choose_algorithm(matrix.shape, config.components)
+            algorithms[hook_name] = algorithm
             hook_summary: Dict[str, Any] = {}
             if "pca" in config.methods:
-                pca_result = compute_pca(matrix, components=config.components, center=config.center)
+                with span("geometry.pca", hook=hook_name, algorithm=algorithm):
+                    pca_result = compute_pca(
+                        matrix, components=config.components, center=config.center, algorithm=algorithm
+                    )
                 hook_summary["pca"] = pca_result.summary()
                 npz_payloads[f"{hook_name}:pca"] = {
                     "activations": matrix.astype(np.float32),
@@ -593,7 +1114,10 @@ class ExperimentRunner:
                 }
                 self._persist_direction(spec, hook_name, "pca", pca_result)
             if "svd" in config.methods:
-                svd_result = compute_svd(matrix, components=config.components, center=config.center)
+                with span("geometry.svd", hook=hook_name, algorithm=algorithm):
+                    svd_result = compute_svd(
+                        matrix, components=config.components, center=config.center, algorithm=algorithm
+                    )
                 hook_summary["svd"] = svd_result.summary()
                 npz_payloads[f"{hook_name}:svd"] = {
                     "activations": matrix.astype(np.float32),
@@ -609,6 +1133,7 @@ class ExperimentRunner:
             "records": len(records),
             "hooks": list(activations_by_hook.keys()),
             "components": config.components,
+            "algorithms": algorithms,
         }
         return summary_metrics, {}, metadata, npz_payloads
 
@@ -634,64 +1159,81 @@ class ExperimentRunner:
         self._expand_hooks(spec, model)
 
         hook_points, hook_aliases = self._build_probe_hook_points(spec)
-        hook_spec = HookSpec(record_points=hook_points)
-
-        # Collect activations for each word in the pairs
-        pair_activations: Dict[str, List[Dict[str, np.ndarray]]] = {}
-        for pair in spec.word_pairs:
-            word1, word2 = pair[0], pair[1]
-            pair_key = f"{word1}_{word2}"
-            pair_activations[pair_key] = []
-            for word in [word1, word2]:
-                tokenized = tokenizer(word, return_tensors="pt", truncation=True, padding=False)
-                inputs = {key: value.to(resources.device) for key, value in tokenized.items()}
-                _outputs, activations = self._forward_with_spec(inputs, hook_spec)
-                word_acts = {}
-                for key, tensor in activations.items():
-                    hook_name = hook_aliases.get(key)
-                    if hook_name:
-                        word_acts[hook_name] = self._flatten_activation(tensor)
-                pair_activations[pair_key].append(word_acts)
-
-        # Compute geometric metrics for each pair at each layer
-        summary_metrics: Dict[str, Any] = {"semantic_geometry": {}}
-        npz_payloads: Dict[str, Dict[str, np.ndarray]] = {}
 
-        for pair_key, word_acts_list in pair_activations.items():
-            if len(word_acts_list) != 2:
-                continue
-            acts1, acts2 = word_acts_list[0], word_acts_list[1]
-            pair_metrics: Dict[str, Dict[str, float]] = {}
-            for hook_name in acts1.keys():
-                if hook_name not in acts2:
-                    continue
-                v1, v2 = acts1[hook_name], acts2[hook_name]
-                # Compute cosine similarity
-                norm1, norm2 = np.linalg.norm(v1), np.linalg.norm(v2)
-                cosine_sim = float(np.dot(v1, v2) / (norm1 * norm2 + 1e-8))
-                # Compute euclidean distance
-                euclidean_dist = float(np.linalg.norm(v1 - v2))
-                pair_metrics[hook_name] = {
-                    "cosine_similarity": cosine_sim,
-                    "euclidean_distance": euclidean_dist,
-                    "norm_word1": float(norm1),
-                    "norm_word2": float(norm2),
+        # Encode every distinct word once, then index pairs into the [vocab, dim] tables.
+        vocab = list(dict.fromkeys(word for pair in spec.word_pairs for word in (pair[0], pair[1])))
+        tables = self._encode_word_table(vocab, tokenizer, resources.device, hook_points, hook_aliases)
+        word_index = {word: position for position, word in enumerate(vocab)}
+        pair_keys = [f"{pair[0]}_{pair[1]}" for pair in spec.word_pairs]
+        first = np.array([word_index[pair[0]] for pair in spec.word_pairs], dtype=np.int64)
+        second = np.array([word_index[pair[1]] for pair in spec.word_pairs], dtype=np.int64)
+
+        # Compute geometric metrics for every pair at each hook in one pass per hook
+        summary_metrics: Dict[str, Any] = {"semantic_geometry": {key: {} for key in pair_keys}}
+        npz_payloads: Dict[str, Dict[str, np.ndarray]] = {}
+        for hook_name, table in tables.items():
+            norms = np.linalg.norm(table, axis=1)
+            v1, v2 = table[first], table[second]
+            cosine = np.einsum("ij,ij->i", v1, v2) / (norms[first] * norms[second] + 1e-8)
+            euclidean = np.linalg.norm(v1 - v2, axis=1)
+            for row, pair_key in enumerate(pair_keys):
+                summary_metrics["semantic_geometry"][pair_key][hook_name] = {
+                    "cosine_similarity": float(cosine[row]),
+                    "euclidean_distance": float(euclidean[row]),
+                    "norm_word1": float(norms[first[row]]),
+                    "norm_word2": float(norms[second[row]]),
                 }
                 npz_payloads[f"{pair_key}:{hook_name}"] = {
-                    "word1_activation": v1.astype(np.float32),
-                    "word2_activation": v2.astype(np.float32),
+                    "word1_activation": v1[row].astype(np.float32),
+                    "word2_activation": v2[row].astype(np.float32),
                 }
-            summary_metrics["semantic_geometry"][pair_key] = pair_metrics
 
         metadata = {
             "type": spec.type.value,
             "relation": spec.relation,
             "word_pairs": len(spec.word_pairs),
+            "unique_words": len(vocab),
             "hooks": [hook.name for hook in spec.hooks],
             "metrics": list(spec.metrics) if spec.metrics else ["cosine_similarity", "euclidean_distance"],
         }
         return summary_metrics, {}, metadata, npz_payloads
 
+    def _encode_word_table(
+        self,
+        words: Sequence[str],
+        tokenizer: Any,
+        device: Any,
+        hook_points: Sequence[HookPoint],
+        hook_aliases: Dict[str, str],
+    ) -> Dict[str, np.ndarray]:
+        """Return ``{hook_name: [len(words), dim]}`` sequence-mean activations of ``words``.
+
+        Words run through the model in right-padded batches and are
+        mean-pooled inside the hooks with padded positions masked out, so each
+        row matches an unpadded forward.
+        """
+
+        assert torch is not None
+        words_sha256 = hashlib.sha256(json.dumps(list(words), ensure_ascii=False).encode("utf-8")).hexdigest()
+        encoded = self._encode_texts(words, tokenizer, device, words_sha256, None)
+        batches = build_batches(encoded, self.batch_size or WORD_BATCH_SIZE, resolve_pad_token_id(tokenizer))
+        pooled_points = {replace(point, reduction="mean").key(): point.key() for point in hook_points}
+        tables: Dict[str, np.ndarray] = {}
+        for batch in batches:
+            hook_spec = HookSpec(
+                record_points=[replace(point, reduction="mean") for point in hook_points],
+                attention_mask=batch.inputs["attention_mask"],
+            )
+            activations = self._record_with_spec(batch.inputs, hook_spec)
+            for key, pooled in activations.items():
+                hook_name = hook_aliases.get(pooled_points.get(key, key))
+                if not hook_name:
+                    continue
+                if hook_name not in tables:
+                    tables[hook_name] = np.zeros((len(words), pooled.shape[-1]), dtype=np.float32)
+                tables[hook_name][batch.record_indices] = pooled.reshape(batch.size, -1).numpy()
+        return tables
+
     def _ensure_torch_available(self) -> None:
         if torch is None:  # pragma: no cover - dependency guard
             raise RuntimeError("PyTorch is required to run head ablation experiments")
@@ -745,61 +1287,366 @@ class ExperimentRunner:
                 )
                 spec.hooks.append(hook)
 
+    def _load_records(self, spec: ExperimentSpec) -> List[Record]:
+        """Stream this runner's shard of the dataset, stopping at ``record_limit``."""
+
+        records = iter_dataset(
+            spec.dataset,
+            max_records=self.record_limit,
+            shard_index=self.shard_index,
+            num_shards=self.num_shards,
+        )
+        return list(records)
+
     def _tokenize_record(self, record: Record, tokenizer: Any, device: Any) -> Dict[str, Tensor]:
+        return self._tokenize_text(record.input_text, tokenizer, device, self.max_length)
+
+    @staticmethod
+    def _tokenize_text(text: str, tokenizer: Any, device: Any, max_length: int | None) -> Dict[str, Tensor]:
         tokenized = tokenizer(
-            record.input_text,
+            text,
             return_tensors="pt",
             truncation=True,
             padding=False,
-            max_length=self.max_length,
+            max_length=max_length,
         )
         inputs: Dict[str, Tensor] = {key: value.to(device) for key, value in tokenized.items()}
         inputs["labels"] = inputs["input_ids"].clone()
         return inputs
 
-    def _compute_baseline(self, encoded_inputs: Sequence[Dict[str, Tensor]]) -> List[BaselineMetrics]:
-        baseline_metrics: List[BaselineMetrics] = []
-        empty_spec = HookSpec()
-        batch_size = self.batch_size or 1
-        for start in range(0, len(encoded_inputs), batch_size):
-            batch = encoded_inputs[start : start + batch_size]
-            for encoded in batch:
-                outputs = self._execute_forward(encoded, empty_spec)
-                loss, accuracy = self._extract_metrics(outputs, encoded["labels"], encoded.get("attention_mask"))
-                baseline_metrics.append(BaselineMetrics(loss=loss, accuracy=accuracy))
+    def _encode_records(
+        self, spec: ExperimentSpec, records: Sequence[Record], tokenizer: Any, device: Any
+    ) -> List[Dict[str, Tensor]]:
+        texts = [record.input_text for record in records]
+        return self._encode_texts(texts, tokenizer, device, self._dataset_content_sha256(spec), self.max_length)
+
+    def _dataset_identity(self, spec: ExperimentSpec) -> str:
+        content_sha256 = self._dataset_content_sha256(spec)
+        if content_sha256 is not None:
+            return content_sha256
+        return json.dumps(spec.dataset.to_dict(), sort_keys=True)
+
+    def _dataset_content_sha256(self, spec: ExperimentSpec) -> str | None:
+        """Identify the records this runner reads: dataset file hash plus shard, if any."""
+
+        if not spec.dataset.path or not Path(spec.dataset.path).is_file():
+            return None
+        content_sha256 = self._file_sha256(Path(spec.dataset.path))
+        if self.num_shards > 1:
+            content_sha256 = f"{content_sha256}:shard{self.shard_index}of{self.num_shards}"
+        return content_sha256
+
+    def _encode_texts(
+        self,
+        texts: Sequence[str],
+        tokenizer: Any,
+        device: Any,
+        content_sha256: str | None,
+        max_length: int | None,
+    ) -> List[Dict[str, Tensor]]:
+        """Tokenize ``texts``, serving them from the tokenized-dataset cache when possible.
+
+        ``content_sha256`` identifies the source the texts were read from, in
+        order; without it (e.g. HuggingFace datasets) the cache is bypassed.
+        """
+
+        with span("tokenize", records=len(texts)):
+            return self._encode_texts_cached(texts, tokenizer, device, content_sha256, max_length)
+
+    def _encode_texts_cached(
+        self,
+        texts: Sequence[str],
+        tokenizer: Any,
+        device: Any,
+        content_sha256: str | None,
+        max_length: int | None,
+    ) -> List[Dict[str, Tensor]]:
+        cache = self.token_cache
+        if cache is None or content_sha256 is None:
+            return [self._tokenize_text(text, tokenizer, device, max_length) for text in texts]
+        key = cache.key(content_sha256, tokenizer, max_length)
+        rows = cache.load(key, len(texts))
+        if rows is not None:
+            assert torch is not None
+            encoded: List[Dict[str, Tensor]] = []
+            for ids, attention_length in rows:
+                input_ids = torch.from_numpy(ids.astype(np.int64)).unsqueeze(0).to(device)
+                positions = torch.arange(input_ids.shape[-1], device=input_ids.device).unsqueeze(0)
+                encoded.append(
+                    {
+                        "input_ids": input_ids,
+                        "attention_mask": (positions < attention_length).long(),
+                        "labels": input_ids.clone(),
+                    }
+                )
+            return encoded
+        encoded = [self._tokenize_text(text, tokenizer, device, max_length) for text in texts]
+        rows = []
+        for inputs in encoded:
+            ids = inputs["input_ids"].reshape(-1).cpu().numpy().astype(np.int32)
+            mask = inputs.get("attention_mask")
+            rows.append((ids, int(mask.sum()) if mask is not None else len(ids)))
+        cache.store(key, rows, meta={"content_sha256": content_sha256, "max_length": max_length})
+        return encoded
+
+    def _build_batches(self, encoded_inputs: Sequence[Dict[str, Tensor]], tokenizer: Any) -> List[EncodedBatch]:
+        return build_batches(encoded_inputs, self.batch_size or 1, resolve_pad_token_id(tokenizer))
+
+    def _compute_baseline(
+        self,
+        batches: Sequence[EncodedBatch],
+        hook_spec: HookSpec | None = None,
+        *,
+        residual_cache: ResidualCache | None = None,
+        capture_layers: Sequence[int] = (),
+    ) -> List[BaselineMetrics]:
+        """Return per-record metrics, optionally caching residual states for ``capture_layers``."""
+
+        total = sum(batch.size for batch in batches)
+        baseline_metrics: List[BaselineMetrics] = [BaselineMetrics(loss=0.0, accuracy=0.0)] * total
+        spec = hook_spec or HookSpec()
+        capture = residual_cache is not None and bool(capture_layers)
+        for batch_idx, batch in enumerate(batches):
+            if capture:
+                assert torch is not None and residual_cache is not None
+                with torch.no_grad():
+                    outputs, _, hidden_by_layer = self.model_manager.capture_block_inputs(
+                        self._model_inputs(batch.inputs), self._scored_spec(batch.inputs, spec), capture_layers
+                    )
+                for layer_idx, hidden_states in hidden_by_layer.items():
+                    if not residual_cache.put(batch_idx, layer_idx, hidden_states):
+                        capture = False
+                        break
+            else:
+                outputs = self._execute_forward(batch.inputs, spec)
+            losses, accuracies = self._extract_metrics(
+                outputs, batch.inputs["labels"], batch.inputs.get("attention_mask")
+            )
+            for record_idx, loss, accuracy in zip(batch.record_indices, losses, accuracies):
+                baseline_metrics[record_idx] = BaselineMetrics(loss=loss, accuracy=accuracy)
         return baseline_metrics
 
+    def _fill_residual_cache(
+        self, batches: Sequence[EncodedBatch], residual_cache: ResidualCache, capture_layers: Sequence[int]
+    ) -> None:
+        """Cache the residual stream entering ``capture_layers`` without computing baseline metrics.
+
+        Used when the baselines come from a checkpoint or the baseline store:
+        each forward stops on entering the deepest of ``capture_layers``, so
+        later blocks, the LM head and the metrics never run.
+        """
+
+        assert torch is not None
+        for batch_idx, batch in enumerate(batches):
+            with torch.no_grad():
+                hidden_by_layer = self.model_manager.record_block_inputs(
+                    self._model_inputs(batch.inputs), capture_layers
+                )
+            for layer_idx, hidden_states in hidden_by_layer.items():
+                if not residual_cache.put(batch_idx, layer_idx, hidden_states):
+                    return
+
+    def _baseline_store_entry(self, spec: ExperimentSpec, tokenizer: Any) -> Tuple[str, str, str] | None:
+        """Return the ``(scope, key, dataset_sha256)`` of this run's baselines in the baseline store, if it applies.
+
+        Like the activation store, the baseline store is bypassed for datasets
+        without a content hash (e.g. HuggingFace datasets).
+        """
+
+        store = self.baseline_store
+        content_sha256 = self._dataset_content_sha256(spec)
+        if store is None or content_sha256 is None:
+            return None
+        cfg = getattr(self.model_manager, "cfg", None)
+        scope = store.scope(
+            model=getattr(cfg, "model_name_or_path", ""),
+            dataset=str(Path(spec.dataset.path).resolve()),
+            shard=[self.shard_index, self.num_shards],
+        )
+        key = store.key(
+            weights=self.model_manager.weights_fingerprint(),
+            adapters=self.adapter_ids,
+            tokenizer=tokenizer,
+            max_length=self.max_length,
+        )
+        return scope, key, content_sha256
+
+    def _load_stored_baseline(
+        self, entry: Tuple[str, str, str], records: int
+    ) -> Tuple[List[float], List[float]] | None:
+        assert self.baseline_store is not None
+        stored = self.baseline_store.get(*entry, records)
+        if stored is None:
+            return None
+        logger.info("Loaded baseline metrics for %d records from %s", records, self.baseline_store.path)
+        return stored[0].tolist(), stored[1].tolist()
+
+    def _store_baseline(
+        self, spec: ExperimentSpec, entry: Tuple[str, str, str], losses: Sequence[float], accuracies: Sequence[float]
+    ) -> None:
+        assert self.baseline_store is not None
+        identity = {"spec_id": spec.id, "adapters": list(self.adapter_ids), "max_length": self.max_length}
+        self.baseline_store.put(*entry, losses, accuracies, identity=identity)
+
     def _execute_forward(self, inputs: Dict[str, Tensor], hook_spec: HookSpec) -> Any:
-        outputs, _ = self._forward_with_spec(inputs, hook_spec)
+        outputs, _ = self._forward_with_spec(inputs, self._scored_spec(inputs, hook_spec))
+        return outputs
+
+    def _scored_spec(self, inputs: Dict[str, Tensor], hook_spec: HookSpec) -> HookSpec:
+        """Restrict the LM head of a metric forward to the positions :meth:`_extract_metrics` scores."""
+
+        if not self.gather_label_logits or "labels" not in inputs:
+            return hook_spec
+        rows, columns, _targets = self._label_positions(inputs["labels"], inputs.get("attention_mask"))
+        return replace(hook_spec, logit_positions=(rows, columns))
+
+    @staticmethod
+    def _label_positions(labels: Tensor, attention_mask: Tensor | None) -> Tuple[Tensor, Tensor, Tensor]:
+        """``(rows, columns, targets)`` of every scored next-token prediction in a padded batch.
+
+        Position ``(row, column)`` predicts ``labels[row, column + 1]``; padded
+        and :data:`IGNORE_INDEX` targets are skipped.
+        """
+
+        assert torch is not None
+        if labels.ndim == 1:
+            labels = labels.unsqueeze(0)
+        shift_labels = labels[..., 1:]
+        valid = shift_labels != IGNORE_INDEX
+        if attention_mask is not None:
+            if attention_mask.ndim == 1:
+                attention_mask = attention_mask.unsqueeze(0)
+            valid = valid & attention_mask[..., 1:].to(device=labels.device, dtype=torch.bool)
+        rows, columns = valid.nonzero(as_tuple=True)
+        return rows, columns, shift_labels[rows, columns]
+
+    def _execute_layer_forward(
+        self,
+        inputs: Dict[str, Tensor],
+        hook_spec: HookSpec,
+        layer_idx: int,
+        residual_cache: ResidualCache | None,
+        batch_idx: int,
+        *,
+        repeats: int = 1,
+    ) -> Any:
+        """Run a forward whose hooks only touch ``layer_idx`` and deeper blocks.
+
+        When the baseline pass cached the residual stream entering
+        ``layer_idx`` for this batch, only blocks ``layer_idx..N`` run.
+        """
+
+        hidden_states = residual_cache.get(batch_idx, layer_idx) if residual_cache is not None else None
+        if hidden_states is None:
+            return self._execute_forward(inputs, hook_spec)
+        if repeats > 1:
+            hidden_states = hidden_states.repeat(repeats, *([1] * (hidden_states.ndim - 1)))
+        assert torch is not None
+        with torch.no_grad():
+            outputs, _ = self.model_manager.forward_from_layer(
+                self._model_inputs(inputs), layer_idx, hidden_states, self._scored_spec(inputs, hook_spec)
+            )
         return outputs
 
+    def _record_with_spec(self, inputs: Dict[str, Tensor], hook_spec: HookSpec) -> Dict[str, Any]:
+        """Return the activations ``hook_spec`` records, stopping after the deepest recorded block."""
+
+        assert torch is not None
+        with torch.no_grad():
+            return self.model_manager.record_activations(self._model_inputs(inputs), hook_spec)
+
     def _forward_with_spec(self, inputs: Dict[str, Tensor], hook_spec: HookSpec) -> Tuple[Any, Dict[str, Any]]:
-        cloned_inputs = self._clone_inputs(inputs)
+        cloned_inputs = self._model_inputs(inputs)
         assert torch is not None  # for mypy / type checkers
         with torch.no_grad():
             return self.model_manager.forward_with_hooks(cloned_inputs, hook_spec)
 
+    def _model_inputs(self, inputs: Dict[str, Tensor]) -> Dict[str, Tensor]:
+        # Labels stay out of the model call: metrics are computed per record from the logits.
+        return self._clone_inputs({key: value for key, value in inputs.items() if key != "labels"})
+
     def _extract_metrics(
         self,
         outputs: Any,
         labels: Tensor,
         attention_mask: Tensor | None,
-    ) -> tuple[float, float]:
-        loss_tensor = getattr(outputs, "loss", None)
+    ) -> tuple[List[float], List[float]]:
+        """Return per-record (loss, accuracy) lists for a padded batch.
+
+        Next-token cross-entropy and accuracy are averaged over each row's
+        non-padded positions on the model device; a single small tensor is
+        transferred to the host per batch. Logits gathered at the label
+        positions (``[positions, vocab]``, see :meth:`_scored_spec`) and full
+        ``[batch, seq, vocab]`` logits give the same result.
+        """
+
         logits = getattr(outputs, "logits", None)
-        if loss_tensor is None or logits is None:
-            raise ValueError("Model outputs must include 'loss' and 'logits' for metric computation")
-        loss_value = float(loss_tensor.detach().cpu().item())
-        logits_tensor = logits.detach()
+        if logits is None:
+            raise ValueError("Model outputs must include 'logits' for metric computation")
+        with span("metrics"):
+            if logits.ndim == 2 and labels.ndim == 2:
+                losses, accuracies = self._position_metrics(logits.detach(), labels, attention_mask)
+            else:
+                losses, accuracies = self._token_metrics(logits.detach(), labels, attention_mask)
+            host = torch.stack([losses, accuracies]).cpu().tolist()
+        return [float(value) for value in host[0]], [float(value) for value in host[1]]
+
+    @staticmethod
+    def _token_metrics(logits_tensor: Tensor, labels: Tensor, attention_mask: Tensor | None) -> tuple[Tensor, Tensor]:
+        """Per-row mean next-token loss and accuracy over non-padded positions, on device."""
+
+        assert torch is not None
+        if logits_tensor.ndim == 2:
+            logits_tensor = logits_tensor.unsqueeze(0)
+        if labels.ndim == 1:
+            labels = labels.unsqueeze(0)
         shift_logits = logits_tensor[..., :-1, :]
-        shift_labels = labels[..., 1:]
+        shift_labels = labels[..., 1:].to(shift_logits.device)
+        valid = shift_labels != IGNORE_INDEX
         if attention_mask is not None:
-            shift_mask = attention_mask[..., 1:].to(dtype=torch.bool)
-        else:
-            shift_mask = torch.ones_like(shift_labels, dtype=torch.bool)
-        predictions = shift_logits.argmax(dim=-1)
-        accuracy = compute_accuracy_from_predictions(predictions, shift_labels, shift_mask)
-        return loss_value, accuracy
+            if attention_mask.ndim == 1:
+                attention_mask = attention_mask.unsqueeze(0)
+            valid = valid & attention_mask[..., 1:].to(device=shift_logits.device, dtype=torch.bool)
+        safe_labels = shift_labels.masked_fill(~valid, 0)
+        token_loss = torch.nn.functional.cross_entropy(
+            shift_logits.reshape(-1, shift_logits.shape[-1]).float(),
+            safe_labels.reshape(-1),
+            reduction="none",
+        ).view_as(safe_labels)
+        valid_f = valid.to(token_loss.dtype)
+        counts = valid_f.sum(dim=-1).clamp(min=1.0)
+        losses = (token_loss * valid_f).sum(dim=-1) / counts
+        matches = (shift_logits.argmax(dim=-1) == safe_labels) & valid
+        accuracies = matches.to(token_loss.dtype).sum(dim=-1) / counts
+        return losses, accuracies
+
+    @classmethod
+    def _position_metrics(
+        cls, logits: Tensor, labels: Tensor, attention_mask: Tensor | None
+    ) -> tuple[Tensor, Tensor]:
+        """Per-row mean loss and accuracy from ``[positions, vocab]`` logits at :meth:`_label_positions`.
+
+        One max/argmax pass and one exp-sum pass over the vocabulary give both
+        the cross-entropy (``logsumexp - target``) and the argmax match,
+        without materializing log-probabilities; rows are then reduced with
+        ``index_add_``.
+        """
+
+        assert torch is not None
+        rows, _columns, targets = cls._label_positions(labels, attention_mask)
+        if logits.shape[0] != rows.numel():
+            raise ValueError(f"Expected logits for {rows.numel()} label positions, got {logits.shape[0]}")
+        logits = logits.float()
+        rows, targets = rows.to(logits.device), targets.to(logits.device)
+        top, predicted = logits.max(dim=-1)
+        log_norm = top + torch.log(torch.exp(logits - top[:, None]).sum(dim=-1))
+        token_loss = log_norm - logits.gather(1, targets[:, None]).squeeze(1)
+        matches = (predicted == targets).to(token_loss.dtype)
+        batch = labels.shape[0]
+        counts = torch.bincount(rows, minlength=batch).to(token_loss.dtype).clamp(min=1.0)
+        losses = torch.zeros(batch, device=logits.device).index_add_(0, rows, token_loss) / counts
+        accuracies = torch.zeros(batch, device=logits.device).index_add_(0, rows, matches) / counts
+        return losses, accuracies
 
     def _clone_inputs(self, inputs: Dict[str, Tensor]) -> Dict[str, Tensor]:
         cloned: Dict[str, Tensor] = {}
@@ -825,14 +1672,293 @@ class ExperimentRunner:
             return fallback
         return DEFAULT_HEAD_COUNT
 
-    def _build_head_ablation_spec(self, layer_idx: int, head_idx: int) -> HookSpec:
+    def _build_head_ablation_spec(self, layer_idx: int, head_idx: int | Sequence[int]) -> HookSpec:
         point = HookPoint(layer_idx=layer_idx, submodule="self_attn")
-        request = AblationRequest(point=point, kind=AblationKind.ATTENTION_HEAD, indices=[head_idx])
+        indices = [head_idx] if isinstance(head_idx, int) else list(head_idx)
+        request = AblationRequest(point=point, kind=AblationKind.ATTENTION_HEAD, indices=indices)
         return HookSpec(ablate_points=[request])
 
+    def _build_head_chunk_forward(
+        self, batch: EncodedBatch, layer_idx: int, heads: Sequence[int], total_heads: int
+    ) -> Tuple[Dict[str, Tensor], HookSpec]:
+        """Return inputs and hooks ablating each of ``heads`` of ``layer_idx`` on its own for one batch."""
+
+        return self._build_head_group_forward(batch, layer_idx, [[head] for head in heads], total_heads)
+
+    def _build_head_group_forward(
+        self, batch: EncodedBatch, layer_idx: int, groups: Sequence[Sequence[int]], total_heads: int
+    ) -> Tuple[Dict[str, Tensor], HookSpec]:
+        """Return inputs and hooks ablating each head group of ``layer_idx`` jointly for one batch.
+
+        A single group uses a plain ``ATTENTION_HEAD`` ablation of its heads.
+        Several groups replicate the batch once per group (group-major rows)
+        and zero a different group in each replica through one
+        ``[rows, num_heads]`` mask on ``self_attn``.
+        """
+
+        if len(groups) == 1:
+            return batch.inputs, self._build_head_ablation_spec(layer_idx, groups[0])
+        assert torch is not None
+        repeats = len(groups)
+        inputs = {key: value.repeat(repeats, *([1] * (value.ndim - 1))) for key, value in batch.inputs.items()}
+        device = batch.inputs["input_ids"].device
+        head_mask = torch.ones(repeats * batch.size, total_heads, dtype=torch.bool, device=device)
+        for offset, group in enumerate(groups):
+            head_mask[offset * batch.size : (offset + 1) * batch.size, list(group)] = False
+        point = HookPoint(layer_idx=layer_idx, submodule="self_attn")
+        request = AblationRequest(
+            point=point,
+            kind=AblationKind.ATTENTION_HEAD_MASK,
+            indices=sorted({head for group in groups for head in group}),
+            head_mask=head_mask,
+        )
+        return inputs, HookSpec(ablate_points=[request])
+
+    def _head_chunks(self, heads: Sequence[int], batch: EncodedBatch, model: Any) -> List[List[int]]:
+        """Split ``heads`` into groups that can share one replicated forward."""
+
+        per_forward = self._heads_per_forward(batch, model) if self.multi_head_ablation else 1
+        per_forward = max(1, min(per_forward, len(heads)))
+        return [list(heads[start : start + per_forward]) for start in range(0, len(heads), per_forward)]
+
+    def _heads_per_forward(self, batch: EncodedBatch, model: Any) -> int:
+        """Estimate how many batch replicas fit in the ablation memory budget.
+
+        The dominant per-replica cost is the full-vocabulary logits (only at
+        the scored label positions when :attr:`gather_label_logits` is set)
+        plus a handful of hidden-size activations per position.
+        """
+
+        assert torch is not None
+        input_ids = batch.inputs["input_ids"]
+        seq_len = int(input_ids.shape[-1])
+        positions = batch.size * seq_len
+        scored = positions
+        if self.gather_label_logits and "labels" in batch.inputs:
+            scored = int(self._label_positions(batch.inputs["labels"], batch.inputs.get("attention_mask"))[0].numel())
+        lm_head = getattr(model, "lm_head", None)
+        config = getattr(model, "config", None)
+        vocab_size = getattr(lm_head, "out_features", None) or getattr(config, "vocab_size", None) or 51200
+        hidden_size = getattr(lm_head, "in_features", None) or getattr(config, "hidden_size", None) or 2560
+        param = next(iter(model.parameters()), None) if hasattr(model, "parameters") else None
+        itemsize = param.element_size() if param is not None and param.is_floating_point() else 4
+        # Logits are upcast to float32 for the loss; hidden activations stay in model precision.
+        replica_bytes = scored * vocab_size * max(itemsize, 4) + positions * 8 * hidden_size * itemsize
+        budget = float(self.ablation_memory_mb) * 1024 * 1024
+        if input_ids.is_cuda:
+            free_bytes, _total = torch.cuda.mem_get_info(input_ids.device)
+            budget = min(budget, 0.5 * free_bytes)
+        return int(budget // max(replica_bytes, 1))
+
+    def _resolve_run_timestamp(self) -> datetime:
+        """Start time of this run; a resumed run keeps the one encoded in its directory name."""
+
+        if self.resume_dir is None:
+            return datetime.now(UTC).replace(microsecond=0)
+        try:
+            return datetime.fromisoformat(Path(self.resume_dir).name)
+        except ValueError as exc:
+            raise ValueError(
+                f"Resume directory {self.resume_dir} is not a results/experiments/<spec_id>/<timestamp> run directory"
+            ) from exc
+
+    def _open_checkpoint(
+        self, spec: ExperimentSpec, records: int, layers: Sequence[int], heads: Sequence[int]
+    ) -> SweepCheckpoint | None:
+        """Create (or, with ``resume_dir``, reload) the sweep checkpoint in this run's directory."""
+
+        if not self.checkpointing and self.resume_dir is None:
+            return None
+        manifest = self._build_manifest(spec)
+        spec_payload = json.dumps(spec.to_dict(), sort_keys=True, default=str)
+        header = {
+            "spec_id": spec.id,
+            "spec_digest": hashlib.sha256(spec_payload.encode("utf-8")).hexdigest(),
+            "spec_sha256": manifest.get("spec_sha256"),
+            "dataset_sha256": manifest.get("dataset_sha256"),
+            "dataset": self._dataset_identity(spec),
+            "model": self.model_manager.weights_fingerprint(),
+            "adapters": list(self.adapter_ids),
+            "max_length": self.max_length,
+            "records": records,
+            "layers": list(layers),
+            "heads": list(heads),
+        }
+        if self.resume_dir is not None:
+            return SweepCheckpoint.resume(self.resume_dir, header)
+        assert self._run_timestamp is not None
+        return SweepCheckpoint.create(experiment_output_dir(spec.id, self._run_timestamp), header)
+
     def _head_key(self, layer_idx: int, head_idx: int) -> str:
         return f"layer{layer_idx}.head{head_idx}"
 
+    @staticmethod
+    def _array_metrics(values: np.ndarray) -> Dict[str, float]:
+        """:func:`compute_delta_metrics` over every entry of a dense array."""
+
+        if values.size == 0 or np.isnan(values).all():
+            return compute_delta_metrics([])
+        if np.isnan(values).any():
+            return {"mean": float(np.nanmean(values)), "min": float(np.nanmin(values)), "max": float(np.nanmax(values))}
+        return {"mean": float(values.mean()), "min": float(values.min()), "max": float(values.max())}
+
+    def _sorted_head_order(self, layers: Sequence[int], heads: Sequence[int]) -> np.ndarray:
+        """Flat ``[layers * heads]`` positions ordered by head key, matching ``sorted(per_head_metrics)``."""
+
+        keys = [self._head_key(layer, head) for layer in layers for head in heads]
+        return np.array(sorted(range(len(keys)), key=keys.__getitem__), dtype=np.int64)
+
+    def _per_head_metric_dicts(
+        self, layers: Sequence[int], heads: Sequence[int], arrays: Dict[str, np.ndarray]
+    ) -> tuple[Dict[str, Dict[str, Dict[str, float]]], np.ndarray]:
+        """Summarize dense ``[layers, heads, records]`` arrays into per-head metric dicts.
+
+        Returns the dicts keyed (and ordered) by head key, plus the
+        ``[layers, heads]`` mean of ``arrays["importance"]`` for ranking.
+        """
+
+        summaries = {name: summarize_metric_array(values) for name, values in arrays.items()}
+        lists = {
+            name: {stat: values.tolist() for stat, values in summary.items()} for name, summary in summaries.items()
+        }
+        per_head: Dict[str, Dict[str, Dict[str, float]]] = {}
+        if arrays and next(iter(arrays.values())).shape[-1]:
+            measured = ~np.isnan(summaries["importance"]["mean"])
+            for position in self._sorted_head_order(layers, heads).tolist():
+                layer_pos, head_pos = divmod(position, len(heads))
+                if not measured[layer_pos, head_pos]:
+                    continue
+                per_head[self._head_key(layers[layer_pos], heads[head_pos])] = {
+                    name: {stat: values[layer_pos][head_pos] for stat, values in stats.items()}
+                    for name, stats in lists.items()
+                }
+        return per_head, summaries["importance"]["mean"]
+
+    @staticmethod
+    def _per_example_arrays(
+        layers: Sequence[int],
+        heads: Sequence[int],
+        arrays: Dict[str, np.ndarray],
+        evaluated: np.ndarray | None = None,
+    ) -> Dict[str, np.ndarray]:
+        """Flatten dense ``[layers, heads, records]`` arrays into the per-example NPZ layout.
+
+        When ``evaluated`` is given, only the cells it marks are kept.
+        """
+
+        shape = next(iter(arrays.values())).shape
+        layer_grid, head_grid, record_grid = np.meshgrid(
+            np.asarray(layers, dtype=np.int32),
+            np.asarray(heads, dtype=np.int32),
+            np.arange(shape[-1], dtype=np.int32),
+            indexing="ij",
+        )
+        payload = {
+            "record_index": record_grid.reshape(-1),
+            "layer": layer_grid.reshape(-1),
+            "head": head_grid.reshape(-1),
+        }
+        for name, values in arrays.items():
+            payload[name] = np.asarray(values, dtype=np.float32).reshape(-1)
+        if evaluated is not None:
+            keep = evaluated.reshape(-1)
+            payload = {name: values[keep] for name, values in payload.items()}
+        return payload
+
+    @staticmethod
+    def _per_example_preview(
+        layers: Sequence[int],
+        heads: Sequence[int],
+        arrays: Dict[str, np.ndarray],
+        evaluated: np.ndarray | None = None,
+        limit: int = 5,
+    ) -> List[Dict[str, Any]]:
+        shape = next(iter(arrays.values())).shape
+        positions = np.flatnonzero(evaluated) if evaluated is not None else np.arange(int(np.prod(shape)))
+        preview: List[Dict[str, Any]] = []
+        for position in positions[:limit].tolist():
+            layer_pos, head_pos, record_idx = np.unravel_index(position, shape)
+            entry: Dict[str, Any] = {
+                "record_index": int(record_idx),
+                "layer": layers[layer_pos],
+                "head": heads[head_pos],
+            }
+            for name, values in arrays.items():
+                entry[name] = float(values[layer_pos, head_pos, record_idx])
+            preview.append(entry)
+        return preview
+
+    def _collect_activations(
+        self,
+        spec: ExperimentSpec,
+        encoded_inputs: Sequence[Dict[str, Tensor]],
+        hook_points: Sequence[HookPoint],
+        hook_aliases: Dict[str, str],
+    ) -> Dict[str, np.ndarray]:
+        """Return ``{hook_name: [records, dim]}`` sequence-mean activations.
+
+        Hook points found in the activation store are read from disk; the
+        model only runs (recording just the missing points) when at least one
+        is absent, and the new activations are written back. Values are cast
+        through the store dtype on both paths so cold and warm runs agree.
+        """
+
+        fused = self._fused_activations.get(self._dataset_identity(spec)) if self._fused_activations else None
+        if fused is not None and fused[0] == len(encoded_inputs):
+            if all(point.key() in fused[1] for point in hook_points):
+                return {hook_aliases[key]: fused[1][key] for key in hook_aliases if key in fused[1]}
+
+        store = self.activation_store
+        content_sha256 = self._dataset_content_sha256(spec)
+        store_keys: Dict[str, str] = {}
+        if store is not None and content_sha256 is not None:
+            cfg = getattr(self.model_manager, "cfg", None)
+            identity = {
+                "model": getattr(cfg, "model_name_or_path", ""),
+                "tokenizer": getattr(cfg, "tokenizer_name_or_path", None),
+                "weights": self.model_manager.weights_fingerprint(),
+                "adapters": sorted(self.adapter_ids),
+                "dataset_sha256": content_sha256,
+                "max_length": self.max_length,
+            }
+            store_keys = {point.key(): store.key(hook=point.key(), **identity) for point in hook_points}
+
+        matrices: Dict[str, np.ndarray] = {}
+        missing: List[HookPoint] = []
+        for point in hook_points:
+            key = point.key()
+            cached = store.get(store_keys[key], len(encoded_inputs)) if store is not None and key in store_keys else None
+            if cached is None:
+                missing.append(point)
+            elif key in hook_aliases:
+                matrices[hook_aliases[key]] = cached
+        if missing:
+            # Pool on the model device unless the store keeps whole sequences.
+            full_sequences = store is not None and store.pooling == "full"
+            recorded = {point.key(): point if full_sequences else replace(point, reduction="mean") for point in missing}
+            collected: Dict[str, List[Any]] = {point.key(): [] for point in missing}
+            for encoded in encoded_inputs:
+                mask = encoded.get("attention_mask")
+                hook_spec = HookSpec(record_points=list(recorded.values()), attention_mask=mask)
+                activations = self._record_with_spec(encoded, hook_spec)
+                for key, tensors in collected.items():
+                    tensors.append(activations[recorded[key].key()])
+            for key, tensors in collected.items():
+                if store is not None and key in store_keys:
+                    if store.pooling == "full":
+                        sequences = [np.asarray(tensor.float()).reshape(-1, tensor.shape[-1]) for tensor in tensors]
+                        store.put(store_keys[key], sequences, meta={"hook": key, "spec_id": spec.id})
+                        vectors = np.stack([store.round_trip(sequence).mean(axis=0) for sequence in sequences])
+                    else:
+                        vectors = np.stack([self._flatten_activation(tensor) for tensor in tensors])
+                        store.put(store_keys[key], list(vectors), meta={"hook": key, "spec_id": spec.id})
+                        vectors = store.round_trip(vectors)
+                else:
+                    vectors = np.stack([self._flatten_activation(tensor) for tensor in tensors])
+                if key in hook_aliases:
+                    matrices[hook_aliases[key]] = vectors
+        return {alias: matrices[alias] for alias in hook_aliases.values() if alias in matrices}
+
     def _build_probe_hook_points(self, spec: ExperimentSpec) -> Tuple[List[HookPoint], Dict[str, str]]:
         hook_points: List[HookPoint] = []
         alias_map: Dict[str, str] = {}
@@ -848,7 +1974,10 @@ class ExperimentRunner:
 
     def _flatten_activation(self, tensor: Any) -> np.ndarray:
         if torch is not None and isinstance(tensor, torch.Tensor):
-            arr = tensor.detach().cpu().numpy()
+            tensor = tensor.detach()
+            if tensor.dtype == torch.bfloat16:  # NumPy has no bfloat16
+                tensor = tensor.float()
+            arr = tensor.cpu().numpy()
         else:
             arr = np.asarray(tensor)
         # For 3D tensors (batch, seq, hidden), mean pool over sequence dimension
@@ -892,8 +2021,25 @@ class ExperimentRunner:
             return record.metadata.get(task.selector_key, record.label)
         return record.label
 
-    def _build_intervention_hook_spec(self, spec: ExperimentSpec) -> Tuple[HookSpec, List[Dict[str, Any]]]:
-        interventions: Dict[HookPoint, InterventionFn] = {}
+    def _prepare_interventions(
+        self, spec: ExperimentSpec, model: Any
+    ) -> Tuple[List[HookPoint], List[Tensor], List[List[float]], List[Dict[str, Any]]]:
+        """Resolve intervention deltas once per run and expand the scale sweep.
+
+        Deltas are built on the model's device and dtype. ``scale_rows[k][i]``
+        is the scale of intervention ``i`` in sweep row ``k``; an intervention
+        with a single scale applies it in every row.
+        """
+
+        assert torch is not None
+        param = next(iter(model.parameters()), None) if hasattr(model, "parameters") else None
+        device = param.device if param is not None else None
+        dtype = param.dtype if param is not None and param.is_floating_point() else torch.float32
+        scale_values = [definition.scale_values() for definition in spec.interventions]
+        rows = max(len(values) for values in scale_values)
+        scale_rows = [[values[row if len(values) > 1 else 0] for values in scale_values] for row in range(rows)]
+        points: List[HookPoint] = []
+        deltas: List[Tensor] = []
         details: List[Dict[str, Any]] = []
         for definition in spec.interventions:
             point = HookPoint(
@@ -901,28 +2047,91 @@ class ExperimentRunner:
                 submodule=definition.point.component,
                 head_idx=definition.point.head,
             )
-            delta_vector = self._resolve_direction_delta(definition)
-            interventions[point] = self._make_intervention_fn(tuple(delta_vector), definition.scale)
-            details.append(
-                {
-                    "name": definition.name,
-                    "layer": point.layer_idx,
-                    "component": point.submodule,
-                    "scale": definition.scale,
-                }
-            )
-        return HookSpec(interventions=interventions), details
+            points.append(point)
+            deltas.append(torch.tensor(self._resolve_direction_delta(definition), device=device, dtype=dtype))
+            detail = {
+                "name": definition.name,
+                "layer": point.layer_idx,
+                "component": point.submodule,
+                "scale": definition.scale,
+            }
+            if definition.scales:
+                detail["scales"] = list(definition.scales)
+            details.append(detail)
+        return points, deltas, scale_rows, details
+
+    def _run_intervention_rows(
+        self,
+        batches: Sequence[EncodedBatch],
+        points: Sequence[HookPoint],
+        deltas: List[Tensor],
+        scale_rows: Sequence[Sequence[float]],
+        model: Any,
+        baseline: Tuple[Sequence[float], Sequence[float]] | None = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-record ``[1 + scales, records]`` losses/accuracies: baseline row, then one row per scale.
+
+        Rows share forwards by replicating each batch once per row (up to the
+        ablation memory budget) with a per-row scale vector in the hooks. A
+        known ``(losses, accuracies)`` ``baseline`` fills row 0 without running it.
+        """
+
+        assert torch is not None
+        records = sum(batch.size for batch in batches)
+        # The baseline row applies every intervention at scale 0.
+        table = torch.tensor(
+            [[0.0] * len(points)] + [list(row) for row in scale_rows], device=deltas[0].device, dtype=deltas[0].dtype
+        )
+        positions_by_point: Dict[HookPoint, List[int]] = defaultdict(list)
+        for position, point in enumerate(points):
+            positions_by_point[point].append(position)
+        losses_out = np.zeros((len(table), records), dtype=np.float64)
+        accuracies_out = np.zeros((len(table), records), dtype=np.float64)
+        rows = list(range(len(table)))
+        if baseline is not None:
+            losses_out[0], accuracies_out[0] = baseline
+            rows = rows[1:]
+        for batch in batches:
+            record_indices = np.asarray(batch.record_indices)
+            for chunk in self._head_chunks(rows, batch, model):
+                inputs = batch.inputs
+                if len(chunk) > 1:
+                    inputs = {key: value.repeat(len(chunk), *([1] * (value.ndim - 1))) for key, value in inputs.items()}
+                # Chunk-major rows: every record of the batch at table row chunk[0], then chunk[1], ...
+                row_scales = table[chunk].repeat_interleave(batch.size, dim=0)
+                hook_spec = HookSpec(
+                    interventions={
+                        point: self._make_intervention_fn(deltas, positions, row_scales)
+                        for point, positions in positions_by_point.items()
+                    }
+                )
+                outputs = self._execute_forward(inputs, hook_spec)
+                losses, accuracies = self._extract_metrics(outputs, inputs["labels"], inputs.get("attention_mask"))
+                cells = np.ix_(chunk, record_indices)
+                losses_out[cells] = np.reshape(losses, (len(chunk), batch.size))
+                accuracies_out[cells] = np.reshape(accuracies, (len(chunk), batch.size))
+        return losses_out, accuracies_out
+
+    def _make_intervention_fn(self, deltas: List[Tensor], positions: Sequence[int], row_scales: Tensor) -> InterventionFn:
+        """Add ``row_scales[row, i] * deltas[i]`` for each intervention ``i`` in ``positions`` to every row.
+
+        A delta is zero-padded or truncated to the activation width the first
+        time its point fires and stored back in ``deltas``, so it is resized
+        at most once per run.
+        """
 
-    def _make_intervention_fn(self, delta: Tuple[float, ...], scale: float) -> InterventionFn:
         def hook(_module: Any, tensor: Tensor) -> Tensor:
             assert torch is not None
-            delta_tensor = torch.tensor(delta, device=tensor.device, dtype=tensor.dtype)
-            if delta_tensor.shape[-1] < tensor.shape[-1]:
-                pad = tensor.shape[-1] - delta_tensor.shape[-1]
-                delta_tensor = torch.nn.functional.pad(delta_tensor, (0, pad))
-            elif delta_tensor.shape[-1] > tensor.shape[-1]:
-                delta_tensor = delta_tensor[..., : tensor.shape[-1]]
-            return tensor + scale * delta_tensor
+            width = tensor.shape[-1]
+            scales = row_scales.to(dtype=tensor.dtype).view(tensor.shape[0], *([1] * (tensor.ndim - 2)), -1)
+            for position in positions:
+                delta = deltas[position]
+                if delta.shape[-1] != width or delta.dtype != tensor.dtype or delta.device != tensor.device:
+                    if delta.shape[-1] < width:
+                        delta = torch.nn.functional.pad(delta, (0, width - delta.shape[-1]))
+                    delta = deltas[position] = delta[..., :width].to(device=tensor.device, dtype=tensor.dtype)
+                tensor = tensor + scales[..., position : position + 1] * delta
+            return tensor
 
         return hook
 
@@ -1065,7 +2274,7 @@ class ExperimentRunner:
             manifest["spec_sha256"] = self._sha256_file(Path(spec_path))
         if dataset_path and Path(dataset_path).exists():
             manifest["dataset_path"] = str(dataset_path)
-            manifest["dataset_sha256"] = self._sha256_file(Path(dataset_path))
+            manifest["dataset_sha256"] = self._file_sha256(Path(dataset_path))
         cfg = getattr(self.model_manager, "cfg", None)
         if cfg:
             manifest["model"] = {
@@ -1080,9 +2289,53 @@ class ExperimentRunner:
             "layer_limit": self.layer_limit,
             "head_limit": self.head_limit,
         }
+        if self.num_shards > 1:
+            manifest["shard"] = {"index": self.shard_index, "count": self.num_shards}
         manifest["adapters"] = list(self.adapter_ids)
+        if self.workers > 1:
+            manifest["workers"] = {"count": self.workers, "threads_per_worker": self.threads_per_worker}
+        if self.resume_dir is not None:
+            manifest["resumed_from"] = str(self.resume_dir)
+        if self.token_cache is not None:
+            manifest["tokenized_cache"] = self.token_cache.stats()
+        if self.activation_store is not None:
+            manifest["activation_store"] = self.activation_store.stats()
+        if self.baseline_store is not None:
+            manifest["baseline_store"] = self.baseline_store.stats()
+        if self._baseline_report is not None:
+            manifest["baseline"] = dict(self._baseline_report)
+        if self._fused_spec_ids and spec.type in FUSABLE_EXPERIMENT_TYPES:
+            fused_with = self._fused_spec_ids.get(self._dataset_identity(spec))
+            if fused_with:
+                manifest["fused_with"] = list(fused_with)
         return manifest
 
+    def _result_identity(self, spec: ExperimentSpec, weights: str | None = None) -> Dict[str, Any]:
+        """Everything a finished run's result depends on, for :class:`ResultCache` keys.
+
+        The run manifest minus file locations, cache statistics and the
+        worker layout, plus the (limit-clipped) spec, the full model config and
+        weights fingerprint (``weights``, computed by loading the model when
+        omitted), the tokenization and batching settings, and the activation
+        store's dtype and pooling, since stored activations are rounded to it.
+        """
+
+        manifest = self._build_manifest(spec)
+        for volatile in VOLATILE_MANIFEST_KEYS:
+            manifest.pop(volatile, None)
+        cfg = getattr(self.model_manager, "cfg", None)
+        store = self.activation_store
+        return {
+            "manifest": manifest,
+            "spec": spec.to_dict(),
+            "dataset": self._dataset_identity(spec),
+            "model_config": asdict(cfg) if is_dataclass(cfg) else None,
+            "weights": weights or self.model_manager.weights_fingerprint(),
+            "max_length": self.max_length,
+            "batch_size": self.batch_size,
+            "activation_store": None if store is None else {"dtype": store.dtype.name, "pooling": store.pooling},
+        }
+
     def _prepare_residual_sampler(self, records: Sequence[Record], tokenizer: Any, model: Any) -> None:
         if self._residual_sampler is not None:
             return
@@ -1111,7 +2364,26 @@ def load_and_run(
     max_length: int | None = None,
     batch_size: int | None = None,
     adapter_ids: Sequence[str] | None = None,
+    shard_index: int = 0,
+    num_shards: int = 1,
+    token_cache: TokenizedDatasetCache | None = None,
+    activation_store: ActivationStore | None = None,
+    baseline_store: BaselineStore | None = None,
+    result_cache: ResultCache | None = None,
+    tracer: Tracer | None = None,
+    resume_dir: str | Path | None = None,
+    workers: int = 1,
+    threads_per_worker: int | None = None,
 ) -> ExperimentResult:
+    """Load the spec at ``spec_path``, apply the limits and run it.
+
+    With a ``result_cache``, a run identical to an earlier one (same spec and
+    dataset contents, model, adapters, limits and batching) returns the
+    earlier result and its artifacts instead of recomputing; for a local
+    checkpoint seen before, a hit does not load the model. Resumed runs and
+    runs recording geometry telemetry always execute.
+    """
+
     spec = ExperimentSpec.from_yaml(spec_path)
     resolved_path = Path(spec_path).resolve()
     if spec.dataset and spec.dataset.path:
@@ -1137,6 +2409,15 @@ def load_and_run(
     runner.head_limit = head_limit
     runner.max_length = max_length
     runner.batch_size = batch_size
+    runner.shard_index = shard_index
+    runner.num_shards = num_shards
+    runner.token_cache = token_cache
+    runner.activation_store = activation_store
+    runner.baseline_store = baseline_store
+    runner.tracer = tracer
+    runner.resume_dir = Path(resume_dir) if resume_dir is not None else None
+    runner.workers = workers
+    runner.threads_per_worker = threads_per_worker
     runner._spec_path = resolved_path  # type: ignore[attr-defined]
     if spec.dataset and spec.dataset.path:
         runner._dataset_path = Path(spec.dataset.path)  # type: ignore[attr-defined]
@@ -1152,4 +2433,21 @@ def load_and_run(
             spec.heads = list(range(head_limit))
         else:
             spec.heads = list(spec.heads)[:head_limit]
-    return runner.run(spec)
+    cache_key = None
+    if result_cache is not None and runner.resume_dir is None and not runner.geometry_settings.enabled:
+        # A local checkpoint fingerprinted by an earlier run is keyed without loading it again.
+        checkpoint = None if model_manager.loaded else model_manager.checkpoint_identity()
+        weights = result_cache.weights_fingerprint(checkpoint) if checkpoint is not None else None
+        if weights is None:
+            weights = model_manager.weights_fingerprint()
+            if checkpoint is not None and model_manager.checkpoint_identity() == checkpoint:
+                result_cache.put_weights_fingerprint(checkpoint, weights)
+        cache_key = result_cache.key(**runner._result_identity(spec, weights=weights))
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Reusing result of %s from %s", spec.id, cached.artifact_paths.get("result_json"))
+            return cached
+    result = runner.run(spec)
+    if result_cache is not None and cache_key is not None:
+        result_cache.put(cache_key, result)
+    return result
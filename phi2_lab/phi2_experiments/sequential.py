@@ -0,0 +1,110 @@
+"""Sequential, Bonferroni-corrected confidence-interval tests for stopping per-head ablation sweeps early."""
+from __future__ import annotations
+
+from statistics import NormalDist
+from typing import List, Sequence
+
+import numpy as np
+
+NEGLIGIBLE = "negligible"
+SIGNIFICANT = "significant"
+UNDECIDED = "undecided"
+
+
+class SequentialEffectTest:
+    """Running mean/variance of per-record effects for a set of heads.
+
+    Batches of per-record values are merged with Chan et al.'s parallel
+    variance update. Once a head has ``min_records`` samples, a Student-t
+    confidence interval of its mean decides it: entirely inside
+    ``(-threshold, threshold)`` is negligible, entirely outside is
+    significant. NaN values (records not evaluated) are ignored.
+
+    :meth:`check` looks at a head on a fixed schedule of sample counts,
+    ``min_records`` and every ``check_every`` after it, with the last look
+    at the ``records`` budget, however the records are batched. The
+    interval is Bonferroni-corrected for those ``looks``: each uses error
+    rate ``(1 - confidence) / looks``, which keeps the chance that *any*
+    look misclassifies a head within ``1 - confidence``.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        threshold: float,
+        confidence: float,
+        min_records: int,
+        records: int,
+        check_every: int = 1,
+    ) -> None:
+        self.threshold = float(threshold)
+        self.min_records = int(min_records)
+        self.records = int(records)
+        self.check_every = max(1, int(check_every))
+        self.looks = self.planned_looks(self.records, self.min_records, self.check_every)
+        self.z = NormalDist().inv_cdf(1 - (1 - confidence) / (2 * self.looks))
+        self.count = np.zeros(size, dtype=np.int64)
+        self.mean = np.zeros(size, dtype=np.float64)
+        self.m2 = np.zeros(size, dtype=np.float64)
+        self.next_look = np.full(size, min(self.min_records, self.records), dtype=np.int64)
+
+    @staticmethod
+    def planned_looks(records: int, min_records: int, check_every: int) -> int:
+        """Number of scheduled looks at a head over a budget of ``records``."""
+
+        if records <= min_records:
+            return 1
+        return 1 + -(-(records - min_records) // check_every)
+
+    def update(self, positions: Sequence[int], values: np.ndarray) -> None:
+        """Merge ``values`` (``[len(positions), records]``) into the running statistics."""
+
+        values = np.asarray(values, dtype=np.float64)
+        valid = ~np.isnan(values)
+        batch_count = valid.sum(axis=-1)
+        filled = np.where(valid, values, 0.0)
+        batch_mean = filled.sum(axis=-1) / np.maximum(batch_count, 1)
+        batch_m2 = (np.where(valid, values - batch_mean[:, None], 0.0) ** 2).sum(axis=-1)
+        index = np.asarray(positions, dtype=np.int64)
+        count = self.count[index]
+        total = count + batch_count
+        delta = batch_mean - self.mean[index]
+        weight = np.divide(batch_count, total, out=np.zeros(len(index)), where=total > 0)
+        self.mean[index] += delta * weight
+        self.m2[index] += batch_m2 + delta**2 * count * weight
+        self.count[index] = total
+
+    def interval(self) -> tuple[np.ndarray, np.ndarray]:
+        dof = np.maximum(self.count - 1, 1)
+        variance = self.m2 / dof
+        # Cornish-Fisher expansion of the t quantile: the normal one under-covers at a few dozen samples.
+        z = self.z
+        quantile = z + (z**3 + z) / (4 * dof) + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * dof**2)
+        half_width = quantile * np.sqrt(variance / np.maximum(self.count, 1))
+        return self.mean - half_width, self.mean + half_width
+
+    def check(self) -> np.ndarray:
+        """Look at the heads whose sample count reached their next scheduled look; return which are decided.
+
+        Heads between looks are reported undecided whatever their interval.
+        """
+
+        due = self.count >= self.next_look
+        decided = due & np.array([decision != UNDECIDED for decision in self.decisions()], dtype=bool)
+        passed = (self.count - self.min_records) // self.check_every + 1
+        following = np.minimum(self.min_records + passed * self.check_every, self.records)
+        self.next_look = np.where(due, np.maximum(following, self.count + 1), self.next_look)
+        return decided
+
+    def decisions(self) -> List[str]:
+        low, high = self.interval()
+        enough = self.count >= self.min_records
+        negligible = enough & (low > -self.threshold) & (high < self.threshold)
+        significant = enough & ((low > self.threshold) | (high < -self.threshold))
+        return [
+            NEGLIGIBLE if small else SIGNIFICANT if large else UNDECIDED
+            for small, large in zip(negligible.tolist(), significant.tolist())
+        ]
+
+
+__all__ = ["NEGLIGIBLE", "SIGNIFICANT", "UNDECIDED", "SequentialEffectTest"]
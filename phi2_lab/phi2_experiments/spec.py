@@ -102,12 +102,18 @@ class HookDefinition:
 
 @dataclass
 class ProbeTaskSpec:
-    """Captures task-specific probing configuration."""
+    """Captures task-specific probing configuration.
+
+    A non-empty ``penalties`` grid selects the ridge penalty of the task's
+    probes by ``cv_folds``-fold cross-validation on the training split.
+    """
 
     name: str
     selector_key: str | None = None
     selector_value: str | int | float | None = None
     label_key: str | None = None
+    penalties: List[float] = field(default_factory=list)
+    cv_folds: int = 5
 
     def to_dict(self) -> Dict[str, Any]:
         data: Dict[str, Any] = {"name": self.name}
@@ -117,40 +123,63 @@ class ProbeTaskSpec:
             data["selector_value"] = self.selector_value
         if self.label_key is not None:
             data["label_key"] = self.label_key
+        if self.penalties:
+            data["penalties"] = list(self.penalties)
+            data["cv_folds"] = self.cv_folds
         return data
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "ProbeTaskSpec":
-        return cls(
+        spec = cls(
             name=payload["name"],
             selector_key=payload.get("selector_key"),
             selector_value=payload.get("selector_value"),
             label_key=payload.get("label_key"),
+            penalties=[float(value) for value in payload.get("penalties", [])],
+            cv_folds=int(payload.get("cv_folds", 5)),
         )
+        if any(value <= 0 for value in spec.penalties):
+            raise ValueError("probe_tasks penalties must be positive")
+        if spec.cv_folds < 2:
+            raise ValueError("probe_tasks cv_folds must be at least 2")
+        return spec
 
 
 @dataclass
 class GeometryConfig:
-    """Configuration for PCA/SVD geometry experiments."""
+    """Configuration for PCA/SVD geometry experiments.
+
+    ``algorithm`` selects the decomposition: ``exact`` (full SVD),
+    ``randomized`` (range finder), ``incremental`` (streamed row chunks) or
+    ``auto``, which picks by matrix shape and ``components``.
+    """
 
     components: int = 3
     center: bool = True
     methods: Sequence[str] = field(default_factory=lambda: ["pca", "svd"])
+    algorithm: str = "auto"
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        data: Dict[str, Any] = {
             "components": int(self.components),
             "center": bool(self.center),
             "methods": list(self.methods),
         }
+        if self.algorithm != "auto":
+            data["algorithm"] = self.algorithm
+        return data
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "GeometryConfig":
-        return cls(
+        config = cls(
             components=int(payload.get("components", 3)),
             center=bool(payload.get("center", True)),
             methods=payload.get("methods", ["pca", "svd"]),
+            algorithm=str(payload.get("algorithm", "auto")),
         )
+        if config.algorithm not in {"auto", "exact", "randomized", "incremental"}:
+            raise ValueError(f"Unknown geometry algorithm '{config.algorithm}'")
+        return config
 
 
 @dataclass
@@ -188,22 +217,33 @@ class AblationSpec:
 
 @dataclass
 class InterventionSpec:
-    """Declaratively defines a directional intervention for a hook point."""
+    """Declaratively defines a directional intervention for a hook point.
+
+    ``scales`` sweeps the intervention over several strengths in one run; when
+    it is empty the single ``scale`` is used.
+    """
 
     name: str
     point: HookPointSpec
     delta: List[float]
     scale: float = 1.0
     direction: str | None = None
+    scales: List[float] = field(default_factory=list)
+
+    def scale_values(self) -> List[float]:
+        return list(self.scales) or [self.scale]
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        data: Dict[str, Any] = {
             "name": self.name,
             "point": self.point.to_dict(),
             "delta": list(self.delta),
             "scale": self.scale,
             "direction": self.direction,
         }
+        if self.scales:
+            data["scales"] = list(self.scales)
+        return data
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "InterventionSpec":
@@ -213,6 +253,7 @@ class InterventionSpec:
             delta=[float(value) for value in payload.get("delta", [])],
             scale=float(payload.get("scale", 1.0)),
             direction=payload.get("direction"),
+            scales=[float(value) for value in payload.get("scales", [])],
         )
 
 
@@ -265,6 +306,89 @@ class HookTemplate:
         )
 
 
+@dataclass
+class EarlyStoppingSpec:
+    """Sequential stopping rule for per-head ablation sweeps.
+
+    A head stops being evaluated once the confidence interval of its mean
+    relative loss delta lies entirely within ``±threshold`` (negligible) or
+    entirely outside it (significant). The interval is checked on a fixed
+    schedule, at ``min_records`` records and every ``check_every`` records
+    after that, independent of the batch size, and is Bonferroni-corrected
+    over those planned looks to keep the overall error rate within
+    ``1 - confidence``. Batches are visited in an order shuffled with
+    ``seed``.
+    """
+
+    threshold: float = 0.01
+    confidence: float = 0.95
+    min_records: int = 16
+    check_every: int = 16
+    seed: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "threshold": float(self.threshold),
+            "confidence": float(self.confidence),
+            "min_records": int(self.min_records),
+            "check_every": int(self.check_every),
+            "seed": int(self.seed),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "EarlyStoppingSpec":
+        spec = cls(
+            threshold=float(payload.get("threshold", 0.01)),
+            confidence=float(payload.get("confidence", 0.95)),
+            min_records=int(payload.get("min_records", 16)),
+            check_every=int(payload.get("check_every", 16)),
+            seed=int(payload.get("seed", 0)),
+        )
+        if spec.threshold < 0:
+            raise ValueError("early_stopping.threshold must be non-negative")
+        if not 0.0 < spec.confidence < 1.0:
+            raise ValueError("early_stopping.confidence must be in (0, 1)")
+        if spec.min_records < 2:
+            raise ValueError("early_stopping.min_records must be at least 2")
+        if spec.check_every < 1:
+            raise ValueError("early_stopping.check_every must be at least 1")
+        return spec
+
+
+@dataclass
+class HeadSearchSpec:
+    """How a head-ablation sweep chooses which ablations to run.
+
+    ``exhaustive`` ablates every selected head on its own. ``hierarchical``
+    first ablates each layer's selected heads together, then splits any
+    group whose importance (mean absolute relative loss delta) exceeds
+    ``threshold`` into ``branching`` parts, down to single heads. Heads inside groups
+    below the threshold are never ablated individually.
+    """
+
+    strategy: str = "exhaustive"
+    threshold: float = 0.01
+    branching: int = 2
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"strategy": self.strategy, "threshold": float(self.threshold), "branching": int(self.branching)}
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "HeadSearchSpec":
+        spec = cls(
+            strategy=str(payload.get("strategy", "exhaustive")),
+            threshold=float(payload.get("threshold", 0.01)),
+            branching=int(payload.get("branching", 2)),
+        )
+        if spec.strategy not in {"exhaustive", "hierarchical"}:
+            raise ValueError(f"Unsupported head search strategy '{spec.strategy}'")
+        if spec.threshold < 0:
+            raise ValueError("search.threshold must be non-negative")
+        if spec.branching < 2:
+            raise ValueError("search.branching must be at least 2")
+        return spec
+
+
 @dataclass
 class ExperimentSpec:
     """Declarative specification for an experiment run."""
@@ -287,6 +411,8 @@ class ExperimentSpec:
     word_pairs: List[List[str]] = field(default_factory=list)
     relation: str | None = None
     hook_template: HookTemplate | None = None
+    early_stopping: EarlyStoppingSpec | None = None
+    search: HeadSearchSpec | None = None
 
     def iter_layers(self, total_layers: int | None = None) -> List[int]:
         """Return the layers that should be visited."""
@@ -330,6 +456,10 @@ class ExperimentSpec:
             data["relation"] = self.relation
         if self.hook_template:
             data["hook_template"] = self.hook_template.to_dict()
+        if self.early_stopping:
+            data["early_stopping"] = self.early_stopping.to_dict()
+        if self.search:
+            data["search"] = self.search.to_dict()
         return data
 
     @classmethod
@@ -364,6 +494,9 @@ class ExperimentSpec:
         hooks = [HookDefinition.from_dict(item) for item in data.get("hooks", [])]
         ablations = [AblationSpec.from_dict(item) for item in data.get("ablations", [])]
         interventions = [InterventionSpec.from_dict(item) for item in data.get("interventions", [])]
+        sweep_lengths = {len(item.scale_values()) for item in interventions} - {1}
+        if len(sweep_lengths) > 1:
+            raise ValueError("Intervention 'scales' lists must all have the same length (or a single scale)")
         logging_targets = [LoggingTarget.from_dict(item) for item in data.get("logging", [])]
         probe_tasks = [ProbeTaskSpec.from_dict(item) for item in data.get("probe_tasks", [])]
         geometry_config = None
@@ -372,6 +505,14 @@ class ExperimentSpec:
         hook_template = None
         if "hook_template" in data and data.get("hook_template") is not None:
             hook_template = HookTemplate.from_dict(data["hook_template"])
+        early_stopping = None
+        if data.get("early_stopping") is not None:
+            early_stopping = EarlyStoppingSpec.from_dict(data["early_stopping"])
+        search = None
+        if data.get("search") is not None:
+            search = HeadSearchSpec.from_dict(data["search"])
+            if search.strategy == "hierarchical" and early_stopping is not None:
+                raise ValueError("early_stopping cannot be combined with hierarchical head search")
         adapters = data.get("adapters", [])
         if not isinstance(adapters, list):
             raise TypeError("'adapters' must be a list of adapter IDs")
@@ -396,6 +537,8 @@ class ExperimentSpec:
             word_pairs=data.get("word_pairs", []),
             relation=data.get("relation"),
             hook_template=hook_template,
+            early_stopping=early_stopping,
+            search=search,
         )
 
     def to_yaml(self, path: str | Path) -> None:
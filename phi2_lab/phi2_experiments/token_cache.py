@@ -0,0 +1,203 @@
+"""On-disk cache of pre-tokenized datasets shared across runs and experiment types."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ..phi2_core.config import TokenizedCacheConfig
+
+logger = logging.getLogger(__name__)
+
+TOKENS_FILE = "tokens.int32"
+INDEX_FILE = "index.npy"
+META_FILE = "meta.json"
+FORMAT_VERSION = 1
+
+TokenizedRow = Tuple[np.ndarray, int]
+"""``(input_ids, attention_length)`` for one record; ids are int32."""
+
+
+def tokenizer_fingerprint(tokenizer: Any) -> Dict[str, str]:
+    """Identify a tokenizer by class, name and a hash of its vocabulary."""
+
+    name = str(getattr(tokenizer, "name_or_path", "") or "")
+    kind = f"{type(tokenizer).__module__}.{type(tokenizer).__qualname__}"
+    digest = hashlib.sha256(kind.encode("utf-8"))
+    get_vocab = getattr(tokenizer, "get_vocab", None)
+    if callable(get_vocab):
+        vocab = get_vocab()
+        digest.update(json.dumps(sorted(vocab.items()), ensure_ascii=False).encode("utf-8"))
+    for attribute in ("bos_token", "eos_token", "pad_token", "padding_side", "truncation_side"):
+        digest.update(f"{attribute}={getattr(tokenizer, attribute, None)!r}".encode("utf-8"))
+    return {"name": name, "class": kind, "vocab_sha256": digest.hexdigest()}
+
+
+class TokenizedDatasetCache:
+    """Stores tokenized records as one memory-mapped int32 array plus an offsets index.
+
+    Each entry lives in ``root/<key>/``: ``tokens.int32`` holds every
+    record's ``input_ids`` back to back and ``index.npy`` holds one
+    ``(offset, length, attention_length)`` row per record. Labels are the
+    runner's copy of ``input_ids``, so they share the same offsets. Keys
+    combine the content hash of the source (dataset file or word list), the
+    tokenizer fingerprint and ``max_length``; an entry covering at least the
+    requested number of records is a hit.
+
+    Like :class:`~phi2_lab.phi2_experiments.activation_store.ActivationStore`,
+    the cache is bounded by ``max_bytes``: after each write the least
+    recently used entries (by ``meta.json`` mtime, refreshed on every hit)
+    are deleted until the total size fits.
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int) -> None:
+        self.root = Path(root)
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = 0
+        self._fingerprints: Dict[int, Tuple[Any, Dict[str, str]]] = {}
+
+    @classmethod
+    def from_config(cls, config: TokenizedCacheConfig, base: Path | None = None) -> "TokenizedDatasetCache":
+        return cls(config.resolve_root(base), max_bytes=config.max_size_mb * 2**20)
+
+    def key(self, content_sha256: str, tokenizer: Any, max_length: int | None) -> str:
+        fingerprint = self._fingerprint(tokenizer)
+        payload = json.dumps(
+            {
+                "version": FORMAT_VERSION,
+                "content_sha256": content_sha256,
+                "tokenizer": fingerprint,
+                "max_length": max_length,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def load(self, key: str, count: int) -> List[TokenizedRow] | None:
+        """Return the first ``count`` rows of entry ``key``, or ``None`` on a miss."""
+
+        entry = self.root / key
+        try:
+            index = np.load(entry / INDEX_FILE)
+        except (FileNotFoundError, ValueError, OSError):
+            self.misses += 1
+            return None
+        if index.ndim != 2 or index.shape[0] < count:
+            self.misses += 1
+            return None
+        total = int(index[-1, 0] + index[-1, 1]) if len(index) else 0
+        tokens = np.memmap(entry / TOKENS_FILE, dtype=np.int32, mode="r", shape=(total,)) if total else None
+        rows: List[TokenizedRow] = []
+        for offset, length, attention_length in index[:count].tolist():
+            ids = np.array(tokens[offset : offset + length]) if tokens is not None else np.zeros(0, np.int32)
+            rows.append((ids, int(attention_length)))
+        self._touch(entry)
+        self.hits += 1
+        return rows
+
+    def store(self, key: str, rows: Sequence[TokenizedRow], meta: Dict[str, Any] | None = None) -> None:
+        """Write ``rows`` as entry ``key``, replacing any shorter entry atomically."""
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        index = np.zeros((len(rows), 3), dtype=np.int64)
+        offset = 0
+        for position, (ids, attention_length) in enumerate(rows):
+            index[position] = (offset, len(ids), attention_length)
+            offset += len(ids)
+        if offset * np.dtype(np.int32).itemsize + index.nbytes > self.max_bytes:
+            logger.info("Tokenized entry %s exceeds the cache budget; not cached", key)
+            return
+        staging = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=self.root))
+        try:
+            if offset:
+                tokens = np.memmap(staging / TOKENS_FILE, dtype=np.int32, mode="w+", shape=(offset,))
+                for (start, length, _), (ids, _) in zip(index.tolist(), rows):
+                    tokens[start : start + length] = ids
+                tokens.flush()
+                del tokens
+            else:
+                (staging / TOKENS_FILE).touch()
+            np.save(staging / INDEX_FILE, index)
+            info = {"version": FORMAT_VERSION, "records": len(rows), "tokens": offset, **(meta or {})}
+            (staging / META_FILE).write_text(json.dumps(info, indent=2, sort_keys=True), encoding="utf-8")
+            target = self.root / key
+            if target.exists():
+                shutil.rmtree(target, ignore_errors=True)
+            os.replace(staging, target)
+        except OSError as exc:
+            logger.warning("Could not write tokenized cache entry %s: %s", key, exc)
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        self._touch(target)
+        self._evict(keep=key)
+
+    def size_bytes(self) -> int:
+        return sum(size for _, _, size in self._entries())
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "root": str(self.root),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "budget_bytes": self.max_bytes,
+        }
+
+    def _fingerprint(self, tokenizer: Any) -> Dict[str, str]:
+        cached = self._fingerprints.get(id(tokenizer))
+        if cached is None or cached[0] is not tokenizer:
+            cached = (tokenizer, tokenizer_fingerprint(tokenizer))
+            self._fingerprints[id(tokenizer)] = cached
+        return cached[1]
+
+    def _touch(self, entry: Path) -> None:
+        # Strictly increasing timestamps, as in ActivationStore._touch.
+        self._clock = max(time.time_ns(), self._clock + 1)
+        try:
+            os.utime(entry / META_FILE, ns=(self._clock, self._clock))
+        except OSError:
+            pass
+
+    def _entries(self) -> List[Tuple[int, Path, int]]:
+        if not self.root.is_dir():
+            return []
+        entries = []
+        for entry in self.root.iterdir():
+            meta_path = entry / META_FILE
+            if entry.name.startswith(".") or not meta_path.is_file():
+                continue
+            size = sum(path.stat().st_size for path in entry.iterdir() if path.is_file())
+            entries.append((meta_path.stat().st_mtime_ns, entry, size))
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        entries = sorted(self._entries(), key=lambda item: item[0])
+        total = sum(size for _, _, size in entries)
+        for _, entry, size in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            self.evictions += 1
+            logger.debug("Evicted tokenized cache entry %s (%d bytes)", entry.name, size)
+
+
+__all__ = ["TokenizedDatasetCache", "TokenizedRow", "tokenizer_fingerprint"]
@@ -0,0 +1,64 @@
+"""Time the baseline stage of a head-ablation or intervention run with and without the baseline store.
+
+Builds a randomly initialised ``PhiForCausalLM`` (``--layers`` blocks with
+Phi-2's hidden and vocabulary sizes) and tokenizes the dataset with random
+ids, then reports the wall time of computing every record's baseline with
+:meth:`ExperimentRunner._compute_baseline` and of writing and reading it
+back through :class:`BaselineStore`.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import torch
+
+from phi2_lab.phi2_experiments.baseline_store import BaselineStore
+from phi2_lab.phi2_experiments.batching import build_batches
+from phi2_lab.scripts.bench_common import DATASET, build_model, build_runner, dataset_texts, random_token_records, timed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dataset", type=Path, default=DATASET)
+    parser.add_argument("--layers", type=int, default=4)
+    parser.add_argument("--hidden-size", type=int, default=2560)
+    parser.add_argument("--heads", type=int, default=32)
+    parser.add_argument("--vocab-size", type=int, default=51200)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    torch.manual_seed(args.seed)
+    runner = build_runner(build_model(args.hidden_size, args.layers, args.heads, vocab_size=args.vocab_size))
+    manager = runner.model_manager
+    encoded = random_token_records(dataset_texts(args.dataset), args.vocab_size)
+    batches = build_batches(encoded, args.batch_size, 0)
+
+    with tempfile.TemporaryDirectory() as root, torch.no_grad(), manager.persistent_hooks():
+        store = BaselineStore(Path(root) / "baselines.sqlite")
+        weights = manager.weights_fingerprint()
+        key = store.key(weights=weights, adapters=[], tokenizer=manager.load().tokenizer, max_length=None)
+        entry = ("bench", key, runner._sha256_file(args.dataset))
+        baseline, computed = timed(lambda: runner._compute_baseline(batches))
+        _, written = timed(
+            lambda: store.put(*entry, [item.loss for item in baseline], [item.accuracy for item in baseline])
+        )
+        stored, read = timed(lambda: store.get(*entry, len(baseline)))
+        assert stored is not None
+
+    print(f"PhiForCausalLM: layers={args.layers} hidden={args.hidden_size} records={len(encoded)}")
+    print(f"{'baseline':<24} {'seconds':>9}")
+    print(f"{'computed (forwards)':<24} {computed:>9.3f}")
+    print(f"{'store write':<24} {written:>9.4f}")
+    print(f"{'store read':<24} {read:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark padded, batched experiment forwards on the mock Phi-2 model (CPU).
+
+Reports forward calls per second and records per second for each batch size
+so the effect of ``--batch-size`` on head-ablation sweeps can be checked
+without real weights.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import torch
+
+from phi2_lab.phi2_experiments.datasets import Record
+from phi2_lab.scripts.bench_common import build_model, build_runner, time_per_call
+
+_WORDS = [f"w{idx}" for idx in range(96)]
+
+
+def _synthetic_records(count: int, min_words: int, max_words: int, seed: int) -> list[Record]:
+    rng = random.Random(seed)
+    records = []
+    for _ in range(count):
+        length = rng.randint(min_words, max_words)
+        records.append(Record(" ".join(rng.choice(_WORDS) for _ in range(length)), None, {}))
+    return records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=256)
+    parser.add_argument("--batch-sizes", type=str, default="1,2,4,8,16,32")
+    parser.add_argument("--hidden-size", type=int, default=256)
+    parser.add_argument("--layers", type=int, default=4)
+    parser.add_argument("--heads", type=int, default=8)
+    parser.add_argument("--min-words", type=int, default=8)
+    parser.add_argument("--max-words", type=int, default=48)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=None, help="Optional torch intra-op thread count.")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    torch.manual_seed(0)
+    runner = build_runner(build_model(args.hidden_size, args.layers, args.heads, mock=True))
+    resources = runner.model_manager.load()
+    records = _synthetic_records(args.records, args.min_words, args.max_words, seed=0)
+    encoded = [runner._tokenize_record(record, resources.tokenizer, resources.device) for record in records]
+
+    print(f"mock model: hidden={args.hidden_size} layers={args.layers} heads={args.heads} records={len(records)}")
+    print(f"{'batch':>6} {'forwards/s':>12} {'records/s':>12} {'speedup':>8}")
+    reference = None
+    for batch_size in [int(item) for item in args.batch_sizes.split(",") if item.strip()]:
+        runner.batch_size = batch_size
+        batches = runner._build_batches(encoded, resources.tokenizer)
+        elapsed = time_per_call(lambda: runner._compute_baseline(batches), args.repeats)
+        forwards_per_s = len(batches) / elapsed
+        records_per_s = len(records) / elapsed
+        reference = reference or records_per_s
+        print(f"{batch_size:>6} {forwards_per_s:>12.1f} {records_per_s:>12.1f} {records_per_s / reference:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Shared setup for the ``bench_*.py`` scripts.
+
+Model and runner builders import torch lazily so the numpy-only benchmarks
+(ridge probe, geometry solvers) run without it.
+"""
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    import torch
+
+    from phi2_lab.phi2_core.model_manager import Phi2ModelManager
+    from phi2_lab.phi2_experiments.runner import ExperimentRunner
+    from phi2_lab.phi2_experiments.spec import ExperimentSpec
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DATASET = REPO_ROOT / "phi2_lab" / "data" / "ablation_dataset_extended.jsonl"
+
+
+def timed(fn: Callable[[], Any]) -> Tuple[Any, float]:
+    """Call ``fn`` once and return its value with the wall time in seconds."""
+
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def time_per_call(fn: Callable[[], Any], iterations: int, warmup: int = 1) -> float:
+    """Mean wall time of ``fn`` over ``iterations`` calls, after ``warmup`` untimed calls."""
+
+    for _ in range(warmup):
+        fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def dataset_texts(path: Path) -> List[str]:
+    """The ``input`` field of every record in a JSONL dataset."""
+
+    with path.open(encoding="utf-8") as handle:
+        return [json.loads(line)["input"] for line in handle]
+
+
+def random_token_records(texts: List[str], vocab_size: int, labels: bool = True) -> List[Dict[str, "torch.Tensor"]]:
+    """Encode each text as random ids, two per word (at least four), for models without a real tokenizer."""
+
+    import torch
+
+    records = []
+    for text in texts:
+        ids = torch.randint(1, vocab_size, (1, max(4, 2 * len(text.split()))))
+        record = {"input_ids": ids, "attention_mask": torch.ones_like(ids)}
+        if labels:
+            record["labels"] = ids.clone()
+        records.append(record)
+    return records
+
+
+def build_model(
+    hidden_size: int,
+    layers: int,
+    heads: int,
+    mock: bool = False,
+    vocab_size: int = 128,
+    max_position_embeddings: int = 2048,
+) -> "torch.nn.Module":
+    """A randomly initialised ``PhiForCausalLM`` (or the mock model with ``mock``) of the given shape."""
+
+    if mock:
+        from phi2_lab.phi2_core.model_manager import _MockPhi2Model
+
+        return _MockPhi2Model(hidden_size=hidden_size, num_layers=layers, num_heads=heads)
+    from transformers import PhiConfig, PhiForCausalLM
+
+    config = PhiConfig(
+        vocab_size=vocab_size,
+        hidden_size=hidden_size,
+        intermediate_size=4 * hidden_size,
+        num_hidden_layers=layers,
+        num_attention_heads=heads,
+        max_position_embeddings=max_position_embeddings,
+    )
+    return PhiForCausalLM(config)
+
+
+def build_manager(model: "torch.nn.Module | None" = None, **config: Any) -> "Phi2ModelManager":
+    """A loaded mock-tokenizer manager serving ``model`` (the default mock model when omitted).
+
+    ``config`` is passed to :class:`ModelConfig`.
+    """
+
+    from phi2_lab.phi2_core.config import ModelConfig
+    from phi2_lab.phi2_core.model_manager import Phi2ModelManager
+
+    manager = Phi2ModelManager(ModelConfig(use_mock=True, **config))
+    manager.load()
+    if model is not None:
+        manager.replace_model(model.eval())
+    return manager
+
+
+def build_runner(model: "torch.nn.Module | None" = None, **settings: Any) -> "ExperimentRunner":
+    """An :class:`ExperimentRunner` over :func:`build_manager` with ``settings`` assigned as attributes."""
+
+    from phi2_lab.phi2_experiments.runner import ExperimentRunner
+
+    runner = ExperimentRunner(build_manager(model))
+    for name, value in settings.items():
+        if not hasattr(runner, name):
+            raise AttributeError(f"ExperimentRunner has no setting {name!r}")
+        setattr(runner, name, value)
+    return runner
+
+
+def head_sweep_spec(spec_id: str, dataset: Path, **fields: Any) -> "ExperimentSpec":
+    """A head-ablation spec over every layer and head of ``dataset``; ``fields`` override or extend it."""
+
+    from phi2_lab.phi2_experiments.spec import ExperimentSpec
+
+    payload = {
+        "id": spec_id,
+        "type": "head_ablation",
+        "dataset": {"name": dataset.stem, "path": str(dataset)},
+        "layers": "all",
+        "heads": "all",
+    }
+    return ExperimentSpec.from_dict({**payload, **fields})
@@ -0,0 +1,96 @@
+"""Forward latency and accuracy drift of the CPU execution modes against float32.
+
+Builds a small randomly initialised ``PhiForCausalLM`` (or the mock model with
+``--mock``) once per mode in ``ModelConfig.cpu_mode``/``compile`` and runs a
+fixed prompt set taken from the ablation dataset. For every mode it reports
+the median forward latency, the first-pass (warmup/compile) time, the largest
+logit error relative to the float32 logit range, top-1 token agreement with
+float32 and the change in mean next-token loss.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import torch
+
+from phi2_lab.phi2_core.hooks import HookSpec
+from phi2_lab.scripts.bench_common import DATASET, build_manager, build_model, dataset_texts, timed
+
+MODES = {
+    "float32": {},
+    "dynamic_int8": {"cpu_mode": "dynamic_int8"},
+    "bfloat16_autocast": {"cpu_mode": "bfloat16_autocast"},
+    "compile": {"compile": True},
+}
+
+
+def _run_mode(args: argparse.Namespace, prompts: list[str], cfg: dict) -> tuple[list[torch.Tensor], float, float]:
+    manager = build_manager(**cfg)
+    resources = manager.load()
+    torch.manual_seed(args.seed)
+    model = build_model(args.hidden_size, args.layers, args.heads, mock=args.mock, max_position_embeddings=512)
+    manager.replace_model(manager._apply_cpu_mode(model.eval(), resources.device))
+    inputs = [resources.tokenizer(prompt, return_tensors="pt") for prompt in prompts]
+    timings: list[float] = []
+    with torch.no_grad():
+        logits, warmup = timed(
+            lambda: [manager.forward_with_hooks(item, HookSpec())[0].logits.float() for item in inputs]
+        )
+        for _ in range(args.repeats):
+            for item in inputs:
+                timings.append(timed(lambda: manager.forward_with_hooks(item, HookSpec()))[1])
+    return logits, warmup, statistics.median(timings)
+
+
+def _mean_loss(logits: list[torch.Tensor], prompts_ids: list[torch.Tensor]) -> float:
+    losses = [
+        torch.nn.functional.cross_entropy(item[0, :-1], ids[0, 1:]).item()
+        for item, ids in zip(logits, prompts_ids)
+        if ids.shape[-1] > 1
+    ]
+    return statistics.fmean(losses)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dataset", type=Path, default=DATASET)
+    parser.add_argument("--prompts", type=int, default=32)
+    parser.add_argument("--modes", nargs="+", choices=sorted(MODES), default=list(MODES))
+    parser.add_argument("--layers", type=int, default=8)
+    parser.add_argument("--heads", type=int, default=16)
+    parser.add_argument("--hidden-size", type=int, default=512)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mock", action="store_true", help="Use the mock model instead of PhiForCausalLM.")
+    args = parser.parse_args()
+
+    prompts = dataset_texts(args.dataset)[: args.prompts]
+    tokenizer = build_manager().load().tokenizer
+    prompt_ids = [tokenizer(prompt, return_tensors="pt")["input_ids"] for prompt in prompts]
+
+    reference, _, _ = _run_mode(args, prompts, MODES["float32"])
+    reference_loss = _mean_loss(reference, prompt_ids)
+    kind = "mock" if args.mock else "PhiForCausalLM"
+    print(f"{kind}: layers={args.layers} heads={args.heads} hidden={args.hidden_size} prompts={len(prompts)}")
+    print(f"{'mode':<18} {'median ms':>10} {'warmup s':>9} {'max rel err':>12} {'top-1 agree':>12} {'loss delta':>11}")
+    for name in args.modes:
+        logits, warmup, median = _run_mode(args, prompts, MODES[name])
+        error = max(float((ref - out).abs().max() / (ref.max() - ref.min())) for ref, out in zip(reference, logits))
+        agree = sum(int((ref.argmax(-1) == out.argmax(-1)).sum()) for ref, out in zip(reference, logits))
+        total = sum(ref.shape[1] for ref in reference)
+        loss_delta = _mean_loss(logits, prompt_ids) - reference_loss
+        print(
+            f"{name:<18} {median * 1000:>10.2f} {warmup:>9.2f} {error:>12.5f} "
+            f"{agree / total:>12.4f} {loss_delta:>+11.5f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Time the exact, randomized and incremental PCA solvers on activation-sized matrices.
+
+Builds synthetic ``[rows, --dims]`` float32 activations (a decaying low-rank
+signal plus isotropic noise and a constant offset, like pooled hidden states)
+for each ``--rows`` value and runs :func:`compute_pca` with every solver,
+reporting wall time and the smallest principal-angle cosine between each
+approximate subspace and the exact one. The exact SVD is skipped above
+``--exact-max-rows`` rows, where it takes minutes.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np
+
+from phi2_lab.phi2_experiments.geometry import GEOMETRY_ALGORITHMS, choose_algorithm, compute_pca
+from phi2_lab.scripts.bench_common import timed
+
+
+def _activations(rows: int, dims: int, rank: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    latent = rng.standard_normal((rows, rank), dtype=np.float32) * np.linspace(20.0, 5.0, rank, dtype=np.float32)
+    basis = np.linalg.qr(rng.standard_normal((dims, rank)))[0].T.astype(np.float32)
+    noise = rng.standard_normal((rows, dims), dtype=np.float32)
+    return latent @ basis + 0.5 * noise + 3.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--dims", type=int, default=2560)
+    parser.add_argument("--components", type=int, default=3)
+    parser.add_argument("--signal-rank", type=int, default=8)
+    parser.add_argument("--exact-max-rows", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"d={args.dims} components={args.components}")
+    print(f"{'rows':>8} {'algorithm':<12} {'seconds':>9} {'min cos vs exact':>17} {'auto':>6}")
+    for rows in args.rows:
+        matrix = _activations(rows, args.dims, args.signal_rank, args.seed)
+        auto = choose_algorithm(matrix.shape, args.components)
+        reference = None
+        for algorithm in GEOMETRY_ALGORITHMS:
+            if algorithm == "exact" and rows > args.exact_max_rows:
+                print(f"{rows:>8} {algorithm:<12} {'skipped':>9} {'-':>17} {'':>6}")
+                continue
+            result, seconds = timed(lambda: compute_pca(matrix, components=args.components, algorithm=algorithm))
+            if algorithm == "exact":
+                reference = result.components
+            agreement = "-"
+            if reference is not None and algorithm != "exact":
+                agreement = f"{np.linalg.svd(reference @ result.components.T, compute_uv=False).min():.6f}"
+            marker = "*" if algorithm == auto else ""
+            print(f"{rows:>8} {algorithm:<12} {seconds:>9.2f} {agreement:>17} {marker:>6}")
+
+
+if __name__ == "__main__":
+    main()
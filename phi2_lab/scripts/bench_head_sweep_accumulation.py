@@ -0,0 +1,78 @@
+"""Measure peak RSS and wall time of a full mock head-ablation sweep.
+
+Writes a synthetic JSONL dataset, runs an all-layer/all-head sweep on the
+mock model and prints wall time plus the process peak resident set size
+(``ru_maxrss``). Each measurement runs in a fresh subprocess so the peak is
+not inherited from earlier runs. Intended for comparing how per-example
+results are accumulated across ``layers x heads x records``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from phi2_lab.scripts.bench_common import build_model, build_runner, head_sweep_spec, timed
+
+
+def _write_dataset(path: Path, records: int) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        for idx in range(records):
+            handle.write(json.dumps({"input": f"record {idx} alpha beta gamma", "label": idx % 2}) + "\n")
+
+
+def _sweep(args: argparse.Namespace) -> None:
+    import torch
+
+    torch.manual_seed(args.seed)
+    runner = build_runner(build_model(args.hidden_size, args.layers, args.heads, mock=True), batch_size=args.batch_size)
+    spec = head_sweep_spec("bench_head_sweep_accumulation", args.dataset)
+    result, seconds = timed(lambda: runner.run(spec))
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        json.dumps(
+            {"seconds": seconds, "peak_rss_mib": peak_kib / 1024, "records": result.metadata["records"]}
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--layers", type=int, default=32)
+    parser.add_argument("--heads", type=int, default=32)
+    parser.add_argument("--hidden-size", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dataset", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.dataset is not None:
+        _sweep(args)
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        dataset = Path(workdir) / "synthetic.jsonl"
+        _write_dataset(dataset, args.records)
+        command = [sys.executable, str(Path(__file__).resolve()), "--dataset", str(dataset)]
+        for flag in ("records", "layers", "heads", "hidden_size", "batch_size", "seed"):
+            command += [f"--{flag.replace('_', '-')}", str(getattr(args, flag))]
+        output = subprocess.run(command, cwd=workdir, check=True, capture_output=True, text=True, env=os.environ)
+    report = json.loads(output.stdout.strip().splitlines()[-1])
+    cells = args.layers * args.heads * report["records"]
+    print(f"mock sweep: layers={args.layers} heads={args.heads} records={report['records']} cells={cells}")
+    print(f"wall time: {report['seconds']:.2f}s")
+    print(f"peak RSS:  {report['peak_rss_mib']:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
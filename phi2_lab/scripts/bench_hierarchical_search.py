@@ -0,0 +1,95 @@
+"""Compare hierarchical (coarse-to-fine) head search against an exhaustive sweep.
+
+Builds a small randomly initialised ``PhiForCausalLM`` (or the mock model with
+``--mock``) and plants ``--planted`` important heads by shrinking the
+attention output rows of every other head, so their ablation effect is close
+to zero. Runs the same all-layer/all-head sweep with ``search.strategy``
+``exhaustive`` and ``hierarchical`` and reports ablation forwards per record,
+wall time and whether the planted heads top the importance ranking.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import torch
+
+from phi2_lab.phi2_experiments.metrics import ExperimentResult
+from phi2_lab.scripts.bench_common import DATASET, build_model, build_runner, head_sweep_spec, timed
+
+
+def _planted_model(args: argparse.Namespace, planted: set[tuple[int, int]]) -> torch.nn.Module:
+    model = build_model(args.hidden_size, args.layers, args.heads, mock=args.mock, max_position_embeddings=256)
+    if args.mock:
+        output_projections = [block.self_attn.proj for block in model.layers]
+    else:
+        output_projections = [block.self_attn.dense for block in model.model.layers]
+    head_dim = args.hidden_size // args.heads
+    with torch.no_grad():
+        for layer_idx, projection in enumerate(output_projections):
+            for head in range(args.heads):
+                if (layer_idx, head) not in planted:
+                    rows = slice(head * head_dim, (head + 1) * head_dim)
+                    projection.weight[rows] *= args.background_scale
+                    projection.bias[rows] *= args.background_scale
+    return model
+
+
+def _run(args: argparse.Namespace, planted: set[tuple[int, int]], strategy: str) -> tuple[ExperimentResult, float]:
+    torch.manual_seed(args.seed)
+    runner = build_runner(_planted_model(args, planted), batch_size=args.batch_size)
+    search = {"strategy": strategy, "threshold": args.threshold, "branching": args.branching}
+    spec = head_sweep_spec(f"bench_search_{strategy}", args.dataset, search=search)
+    return timed(lambda: runner.run(spec))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dataset", type=Path, default=DATASET)
+    parser.add_argument("--layers", type=int, default=32)
+    parser.add_argument("--heads", type=int, default=32)
+    parser.add_argument("--hidden-size", type=int, default=128)
+    parser.add_argument("--planted", type=int, default=4, help="Number of important heads to plant.")
+    parser.add_argument("--background-scale", type=float, default=1e-3)
+    parser.add_argument("--threshold", type=float, default=1e-4)
+    parser.add_argument("--branching", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mock", action="store_true", help="Use the mock model instead of PhiForCausalLM.")
+    args = parser.parse_args()
+    args.dataset = args.dataset.resolve()
+
+    cells = [(layer, head) for layer in range(args.layers) for head in range(args.heads)]
+    planted = set(random.Random(args.seed).sample(cells, args.planted))
+    planted_keys = {f"layer{layer}.head{head}" for layer, head in planted}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        exhaustive, exhaustive_seconds = _run(args, planted, "exhaustive")
+        hierarchical, hierarchical_seconds = _run(args, planted, "hierarchical")
+
+    report = hierarchical.metadata["head_search"]
+    kind = "mock" if args.mock else "PhiForCausalLM"
+    print(
+        f"{kind}: layers={args.layers} heads={args.heads} hidden={args.hidden_size} "
+        f"records={exhaustive.metadata['records']} planted={sorted(planted_keys)}"
+    )
+    print(f"{'strategy':<14} {'forwards/record':>16} {'seconds':>9} {'planted in top-k':>17}")
+    for name, result, forwards, seconds in (
+        ("exhaustive", exhaustive, report["exhaustive_forwards_per_record"], exhaustive_seconds),
+        ("hierarchical", hierarchical, report["forwards_per_record"], hierarchical_seconds),
+    ):
+        top = {item["head"] for item in result.metadata["importance_ranking"][: len(planted)]}
+        print(f"{name:<14} {forwards:>16} {seconds:>9.2f} {len(top & planted_keys):>13}/{len(planted)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Microbenchmark hook overhead per forward: per-forward HookManager vs HookRegistry.
+
+Overhead is measured against a hook-free forward of the same mock model, so
+the numbers isolate registration/removal and dispatch cost. The ``mean``
+scenario records the same points pooled inside the hook, so only
+``[batch, hidden]`` is copied off the model's tensors instead of
+``[batch, seq, hidden]``.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import torch
+
+from phi2_lab.phi2_core.hooks import AblationKind, AblationRequest, HookPoint, HookSpec
+from phi2_lab.scripts.bench_common import build_manager, build_model, time_per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--layers", type=int, default=32)
+    parser.add_argument("--hidden-size", type=int, default=64)
+    parser.add_argument("--seq-len", type=int, default=16)
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    model = build_model(args.hidden_size, args.layers, 4, mock=True)
+    manager = build_manager(model)
+    inputs = {"input_ids": torch.randint(1, 100, (1, args.seq_len))}
+    record_points = [HookPoint(layer, sub) for layer in range(args.layers) for sub in ("self_attn", "mlp")]
+    pooled_points = [HookPoint(point.layer_idx, point.submodule, reduction="mean") for point in record_points]
+    ablation = AblationRequest(HookPoint(args.layers // 2, "self_attn"), AblationKind.ATTENTION_HEAD, [0])
+    scenarios = {
+        "ablate 1 head": HookSpec(ablate_points=[ablation]),
+        f"record {len(record_points)} + ablate": HookSpec(record_points=record_points, ablate_points=[ablation]),
+        f"mean {len(record_points)} + ablate": HookSpec(record_points=pooled_points, ablate_points=[ablation]),
+    }
+
+    print(f"mock model: layers={args.layers} hidden={args.hidden_size} seq={args.seq_len}")
+    print(f"{'spec':<22} {'mode':<22} {'ms/forward':>11} {'overhead ms':>12}")
+    with torch.no_grad():
+        bare = time_per_call(lambda: model(**inputs), args.iterations, warmup=10)
+        print(f"{'-':<22} {'no hooks':<22} {bare * 1e3:>11.3f} {0.0:>12.3f}")
+        for name, spec in scenarios.items():
+            per_forward = time_per_call(lambda: manager.forward_with_hooks(inputs, spec), args.iterations, warmup=10)
+            with manager.persistent_hooks():
+                persistent = time_per_call(lambda: manager.forward_with_hooks(inputs, spec), args.iterations, warmup=10)
+            for mode, elapsed in (("HookManager (before)", per_forward), ("HookRegistry (after)", persistent)):
+                print(f"{name:<22} {mode:<22} {elapsed * 1e3:>11.3f} {(elapsed - bare) * 1e3:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Time metric extraction per batch with full-sequence logits vs label-position-only logits.
+
+Builds a randomly initialised ``PhiForCausalLM`` with Phi-2's hidden and
+vocabulary sizes (``--layers`` decoder blocks, 2 by default, so the LM head
+is a realistic share of the forward) and a right-padded batch of random
+prompts. For ``gather_label_logits`` off and on it reports, per batch, the
+forward plus metric time and the metric time alone (loss/accuracy from
+already computed logits), and the size of the logits tensor.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import torch
+
+from phi2_lab.phi2_core.hooks import HookSpec
+from phi2_lab.phi2_experiments.batching import collate_encoded
+from phi2_lab.scripts.bench_common import build_model, build_runner, time_per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--layers", type=int, default=2)
+    parser.add_argument("--hidden-size", type=int, default=2560)
+    parser.add_argument("--heads", type=int, default=32)
+    parser.add_argument("--vocab-size", type=int, default=51200)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--min-tokens", type=int, default=6)
+    parser.add_argument("--max-tokens", type=int, default=24)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    torch.manual_seed(args.seed)
+    model = build_model(
+        args.hidden_size,
+        args.layers,
+        args.heads,
+        vocab_size=args.vocab_size,
+        max_position_embeddings=max(256, args.max_tokens),
+    )
+    runner = build_runner(model)
+    manager = runner.model_manager
+
+    lengths = torch.randint(args.min_tokens, args.max_tokens + 1, (args.batch_size,)).tolist()
+    encoded = []
+    for length in lengths:
+        ids = torch.randint(1, args.vocab_size, (1, length))
+        encoded.append({"input_ids": ids, "attention_mask": torch.ones_like(ids), "labels": ids.clone()})
+    inputs = collate_encoded(encoded, pad_token_id=0)
+    labels, mask = inputs["labels"], inputs.get("attention_mask")
+
+    print(
+        f"PhiForCausalLM: layers={args.layers} hidden={args.hidden_size} vocab={args.vocab_size} "
+        f"batch={args.batch_size} tokens={min(lengths)}..{max(lengths)} (padded to {labels.shape[1]})"
+    )
+    print(f"{'logits':<16} {'shape':>16} {'forward+metrics ms':>19} {'metrics ms':>11}")
+    with torch.no_grad(), manager.persistent_hooks():
+        for name, gather in (("full sequence", False), ("label positions", True)):
+            runner.gather_label_logits = gather
+            logits = runner._execute_forward(inputs, HookSpec()).logits
+
+            def forward_and_metrics() -> None:
+                runner._extract_metrics(runner._execute_forward(inputs, HookSpec()), labels, mask)
+
+            total = time_per_call(forward_and_metrics, args.iterations)
+            outputs = SimpleNamespace(logits=logits)
+            metrics = time_per_call(lambda: runner._extract_metrics(outputs, labels, mask), args.iterations)
+            shape = "x".join(str(size) for size in logits.shape)
+            print(f"{name:<16} {shape:>16} {total * 1e3:>19.1f} {metrics * 1e3:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Measure head-ablation sweep throughput with 1..N forked CPU workers.
+
+Runs the same all-layer/all-head sweep on the mock model with ``workers`` set
+to each value of ``--workers`` and reports wall time, records x heads x layers
+cells per second and speedup over the first entry. Per-example results of
+every pooled run are checked against the first run.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np
+import torch
+
+from phi2_lab.phi2_experiments.parallel import available_cpus
+from phi2_lab.scripts.bench_common import DATASET, build_model, build_runner, head_sweep_spec, timed
+
+
+def _run(args: argparse.Namespace, workers: int) -> tuple[dict, int, float]:
+    torch.manual_seed(args.seed)
+    runner = build_runner(
+        build_model(args.hidden_size, args.layers, args.heads, mock=True),
+        batch_size=args.batch_size,
+        workers=workers,
+        threads_per_worker=args.threads_per_worker,
+    )
+    spec = head_sweep_spec(f"bench_parallel_{workers}", args.dataset)
+    result, seconds = timed(lambda: runner.run(spec))
+    with np.load(result.artifact_paths["per_example"]) as data:
+        arrays = {key: data[key] for key in data.files}
+    return arrays, result.metadata["records"], seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dataset", type=Path, default=DATASET)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--threads-per-worker", type=int, default=1)
+    parser.add_argument("--layers", type=int, default=16)
+    parser.add_argument("--heads", type=int, default=16)
+    parser.add_argument("--hidden-size", type=int, default=256)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    args.dataset = args.dataset.resolve()
+
+    print(f"available CPUs: {len(available_cpus())}")
+    print(f"{'workers':>7} {'seconds':>9} {'cells/s':>10} {'speedup':>8} {'matches':>8}")
+    reference = None
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        for workers in args.workers:
+            arrays, records, seconds = _run(args, workers)
+            if reference is None:
+                reference = (arrays, seconds)
+            matches = all(
+                np.allclose(values, reference[0][key], rtol=1e-6, equal_nan=True) for key, values in arrays.items()
+            )
+            cells = args.layers * args.heads * records
+            print(
+                f"{workers:>7} {seconds:>9.2f} {cells / seconds:>10.1f} "
+                f"{reference[1] / seconds:>7.2f}x {str(matches):>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark prefix residual caching for head-ablation sweeps on CPU.
+
+Runs the same all-layer sweep with and without the baseline residual cache on
+a randomly initialised, Phi-2-shaped ``PhiForCausalLM`` (or the mock model
+with ``--mock``) and reports wall time. With a uniform layer sweep the blocks
+below each ablated layer are skipped, so roughly half of the block compute
+disappears and the expected speedup approaches 2x as depth grows.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import torch
+
+from phi2_lab.scripts.bench_common import DATASET, build_model, build_runner, head_sweep_spec, timed
+
+
+def _run(args: argparse.Namespace, residual_cache_mb: int) -> float:
+    torch.manual_seed(0)
+    model = build_model(args.hidden_size, args.layers, args.heads, mock=args.mock, max_position_embeddings=256)
+    runner = build_runner(model, batch_size=args.batch_size, residual_cache_mb=residual_cache_mb)
+    spec = head_sweep_spec("bench_residual_cache", DATASET, heads=list(range(args.sweep_heads)))
+    return timed(lambda: runner.run(spec))[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--layers", type=int, default=32)
+    parser.add_argument("--hidden-size", type=int, default=256)
+    parser.add_argument("--heads", type=int, default=32)
+    parser.add_argument("--sweep-heads", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--mock", action="store_true", help="Use the mock model instead of PhiForCausalLM.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        full = _run(args, residual_cache_mb=0)
+        cached = _run(args, residual_cache_mb=2048)
+    kind = "mock" if args.mock else "PhiForCausalLM"
+    print(f"{kind}: layers={args.layers} hidden={args.hidden_size} heads={args.heads} sweep_heads={args.sweep_heads}")
+    print(f"{'mode':<18} {'seconds':>9}")
+    print(f"{'full forward':<18} {full:>9.2f}")
+    print(f"{'residual cache':<18} {cached:>9.2f}")
+    print(f"speedup: {full / cached:.2f}x (ideal for a uniform sweep: {2 * args.layers / (args.layers + 1):.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
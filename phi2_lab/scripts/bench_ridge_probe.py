@@ -0,0 +1,79 @@
+"""Time the primal and dual ridge probe solves and closed-form lambda selection.
+
+For each record count ``n`` against ``--dims`` activation dimensions (2560 is
+Phi-2's hidden size), times one probe fit with the primal ``d×d`` system and
+with the dual ``n×n`` kernel form, then times choosing the penalty from a
+``--penalties`` grid by k-fold cross-validation two ways: refitting every
+fold for every penalty with the automatically chosen form, and the
+single-decomposition closed form used by :func:`train_linear_probe_cv`.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np
+
+from phi2_lab.phi2_experiments.probes import ridge_weights, train_linear_probe_cv
+from phi2_lab.scripts.bench_common import timed
+
+
+def _primal(activations: np.ndarray, labels: np.ndarray, penalty: float) -> np.ndarray:
+    dims = activations.shape[1]
+    return np.linalg.solve(activations.T @ activations + penalty * np.eye(dims), activations.T @ labels)
+
+
+def _dual(activations: np.ndarray, labels: np.ndarray, penalty: float) -> np.ndarray:
+    records = activations.shape[0]
+    return activations.T @ np.linalg.solve(activations @ activations.T + penalty * np.eye(records), labels)
+
+
+def _refit_cv(activations: np.ndarray, labels: np.ndarray, penalties: list[float], folds: int) -> list[float]:
+    records = activations.shape[0]
+    scores = []
+    for penalty in penalties:
+        squared = 0.0
+        for fold in range(folds):
+            held_out = np.arange(fold, records, folds)
+            kept = np.setdiff1d(np.arange(records), held_out)
+            weights = ridge_weights(activations[kept], labels[kept], penalty)
+            predictions = activations[held_out] @ weights + labels[kept].mean()
+            squared += float(np.sum((predictions - labels[held_out]) ** 2))
+        scores.append(squared / records)
+    return scores
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dims", type=int, default=2560)
+    parser.add_argument("--records", type=int, nargs="+", default=[256, 1024, 2560, 5120])
+    parser.add_argument("--penalties", type=float, nargs="+", default=[0.01, 0.1, 1.0, 10.0, 100.0, 1000.0])
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"dims={args.dims} penalties={len(args.penalties)} folds={args.folds}")
+    print(f"{'n':>6} {'n/d':>5} {'primal s':>9} {'dual s':>8} {'refit cv s':>11} {'closed cv s':>12} {'same pick':>10}")
+    for records in args.records:
+        activations = rng.normal(size=(records, args.dims))
+        labels = (activations[:, :8].sum(axis=1) + rng.normal(size=records) > 0).astype(np.float64)
+        primal, primal_seconds = timed(lambda: _primal(activations, labels, 1.0))
+        dual, dual_seconds = timed(lambda: _dual(activations, labels, 1.0))
+        assert np.allclose(primal, dual, atol=1e-6)
+        refit, refit_seconds = timed(lambda: _refit_cv(activations, labels, args.penalties, args.folds))
+        (_, path), closed_seconds = timed(lambda: train_linear_probe_cv(activations, labels, args.penalties, args.folds))
+        same = args.penalties[int(np.argmin(refit))] == path.best_penalty
+        print(
+            f"{records:>6} {records / args.dims:>5.2f} {primal_seconds:>9.3f} {dual_seconds:>8.3f} "
+            f"{refit_seconds:>11.3f} {closed_seconds:>12.3f} {str(same):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compare full hooked forwards against truncated recording forwards for shallow hook points.
+
+Builds a randomly initialised ``PhiForCausalLM`` (32 blocks and Phi-2's
+vocabulary by default; ``--hidden-size`` keeps it tractable on CPU) and
+records the MLP output of layers ``0..deepest`` for every record of the
+dataset, once with :meth:`Phi2ModelManager.forward_with_hooks` (all blocks
+plus the LM head) and once with :meth:`Phi2ModelManager.record_activations`
+(stops after the deepest recorded block), reporting wall time per record.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import torch
+
+from phi2_lab.phi2_core.hooks import HookPoint, HookSpec
+from phi2_lab.scripts.bench_common import DATASET, build_manager, build_model, dataset_texts, random_token_records
+from phi2_lab.scripts.bench_common import time_per_call
+
+
+def _per_record(fn, records: list, repeats: int) -> float:
+    return time_per_call(lambda: [fn(inputs) for inputs in records], repeats) / len(records)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dataset", type=Path, default=DATASET)
+    parser.add_argument("--layers", type=int, default=32)
+    parser.add_argument("--hidden-size", type=int, default=512)
+    parser.add_argument("--heads", type=int, default=8)
+    parser.add_argument("--vocab-size", type=int, default=51200)
+    parser.add_argument("--deepest", type=int, nargs="+", default=[0, 3, 7, 15, 31])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    torch.manual_seed(args.seed)
+    manager = build_manager(build_model(args.hidden_size, args.layers, args.heads, vocab_size=args.vocab_size))
+    records = random_token_records(dataset_texts(args.dataset), args.vocab_size, labels=False)
+
+    print(
+        f"PhiForCausalLM: layers={args.layers} hidden={args.hidden_size} "
+        f"vocab={args.vocab_size} records={len(records)}"
+    )
+    print(f"{'recorded layers':<16} {'full ms/record':>15} {'truncated ms/record':>20} {'speedup':>8}")
+    with torch.no_grad(), manager.persistent_hooks():
+        for deepest in args.deepest:
+            spec = HookSpec(record_points=[HookPoint(layer, "mlp") for layer in range(deepest + 1)])
+            full = _per_record(lambda inputs: manager.forward_with_hooks(inputs, spec), records, args.repeats)
+            truncated = _per_record(lambda inputs: manager.record_activations(inputs, spec), records, args.repeats)
+            print(f"{f'0..{deepest}':<16} {full * 1e3:>15.2f} {truncated * 1e3:>20.2f} {full / truncated:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Compare attribution-patching head estimates against exact head ablation.
+
+Runs the same head sweep twice on a small model — once with exact zero
+ablation (one forward per layer/head chunk and batch) and once with
+``ablation_mode: attribution`` (one forward + backward per batch) — and
+reports how well the estimated per-head loss deltas track the exact ones:
+Pearson and Spearman correlation of per-head mean relative loss deltas,
+top-k overlap of the importance rankings, and wall time of each mode.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np
+import torch
+
+from phi2_lab.phi2_core.config import ModelConfig
+from phi2_lab.phi2_core.model_manager import Phi2ModelManager, _MockPhi2Model
+from phi2_lab.phi2_experiments.metrics import ExperimentResult
+from phi2_lab.phi2_experiments.runner import ExperimentRunner
+from phi2_lab.phi2_experiments.spec import ExperimentSpec
+
+DATASET = REPO_ROOT / "phi2_lab" / "data" / "ablation_dataset_extended.jsonl"
+
+
+def _build_model(args: argparse.Namespace) -> torch.nn.Module:
+    if args.mock:
+        return _MockPhi2Model(hidden_size=args.hidden_size, num_layers=args.layers, num_heads=args.heads)
+    from transformers import PhiConfig, PhiForCausalLM
+
+    config = PhiConfig(
+        vocab_size=128,
+        hidden_size=args.hidden_size,
+        intermediate_size=4 * args.hidden_size,
+        num_hidden_layers=args.layers,
+        num_attention_heads=args.heads,
+        max_position_embeddings=256,
+    )
+    return PhiForCausalLM(config)
+
+
+def _run(args: argparse.Namespace, mode: str) -> tuple[ExperimentResult, float]:
+    torch.manual_seed(args.seed)
+    manager = Phi2ModelManager(ModelConfig(use_mock=True))
+    manager.load()
+    manager.replace_model(_build_model(args).eval())
+    runner = ExperimentRunner(manager)
+    runner.batch_size = args.batch_size
+    spec = ExperimentSpec.from_dict(
+        {
+            "id": f"compare_attribution_{mode}",
+            "type": "head_ablation",
+            "dataset": {"name": "ablation", "path": str(args.dataset)},
+            "layers": "all",
+            "heads": "all",
+            "ablation_mode": mode,
+        }
+    )
+    start = time.perf_counter()
+    result = runner.run(spec)
+    return result, time.perf_counter() - start
+
+
+def _ranks(values: np.ndarray) -> np.ndarray:
+    ranks = np.empty(len(values), dtype=float)
+    ranks[np.argsort(values, kind="stable")] = np.arange(len(values))
+    return ranks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dataset", type=Path, default=DATASET)
+    parser.add_argument("--layers", type=int, default=4)
+    parser.add_argument("--hidden-size", type=int, default=64)
+    parser.add_argument("--heads", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mock", action="store_true", help="Use the mock model instead of PhiForCausalLM.")
+    args = parser.parse_args()
+    args.dataset = args.dataset.resolve()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        exact, exact_seconds = _run(args, "zero")
+        estimated, estimated_seconds = _run(args, "attribution")
+
+    keys = sorted(exact.per_head_metrics)
+    exact_deltas = np.array([exact.per_head_metrics[key]["loss_delta"]["mean"] for key in keys])
+    estimated_deltas = np.array([estimated.per_head_metrics[key]["loss_delta"]["mean"] for key in keys])
+    pearson = float(np.corrcoef(exact_deltas, estimated_deltas)[0, 1])
+    spearman = float(np.corrcoef(_ranks(exact_deltas), _ranks(estimated_deltas))[0, 1])
+    top_k = min(args.top_k, len(keys))
+    exact_top = {item["head"] for item in exact.metadata["importance_ranking"][:top_k]}
+    estimated_top = {item["head"] for item in estimated.metadata["importance_ranking"][:top_k]}
+
+    kind = "mock" if args.mock else "PhiForCausalLM"
+    print(f"{kind}: layers={args.layers} hidden={args.hidden_size} heads={args.heads} records={exact.metadata['records']}")
+    print(f"{'mode':<14} {'seconds':>9}")
+    print(f"{'exact':<14} {exact_seconds:>9.2f}")
+    print(f"{'attribution':<14} {estimated_seconds:>9.2f}")
+    print(f"per-head mean loss delta: pearson={pearson:.4f} spearman={spearman:.4f}")
+    print(f"top-{top_k} importance overlap: {len(exact_top & estimated_top)}/{top_k}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,10 +19,15 @@ from phi2_lab.phi2_core.config import load_app_config
 from phi2_lab.phi2_core.model_manager import Phi2ModelManager
 from phi2_lab.phi2_core.adapter_manager import AdapterManager
 from phi2_lab.geometry_viz.integration import GeometryTelemetrySettings, build_geometry_recorder
+from phi2_lab.phi2_experiments.activation_store import ActivationStore
+from phi2_lab.phi2_experiments.baseline_store import BaselineStore
+from phi2_lab.phi2_experiments.result_cache import ResultCache
 from phi2_lab.phi2_experiments.runner import load_and_run
+from phi2_lab.phi2_experiments.token_cache import TokenizedDatasetCache
 from phi2_lab.phi2_atlas.storage import AtlasStorage
 from phi2_lab.phi2_atlas.writer import AtlasWriter
 from phi2_lab.phi2_atlas.query import fetch_semantic_codes, list_experiments, list_models
+from phi2_lab.utils.tracing import Tracer
 from phi2_lab.utils.validation import validate_runtime_config
 from phi2_lab.utils import load_yaml_data
 
@@ -124,7 +129,49 @@ def parse_args() -> argparse.Namespace:
         "--batch-size",
         type=int,
         default=None,
-        help="Optional batch size for baseline passes (reduces overhead).",
+        help="Records per padded forward pass for baseline, ablation, and intervention sweeps.",
+    )
+    parser.add_argument(
+        "--shard-index",
+        type=int,
+        default=0,
+        help="Index of the dataset shard this process reads (0-based, used with --num-shards).",
+    )
+    parser.add_argument(
+        "--num-shards",
+        type=int,
+        default=1,
+        help="Split local JSONL/CSV datasets into this many byte-range shards; each worker reads one.",
+    )
+    parser.add_argument(
+        "--resume",
+        type=Path,
+        default=None,
+        metavar="RUN_DIR",
+        help="Resume an interrupted head-ablation sweep from its results/experiments/<spec_id>/<timestamp> directory.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute even when an identical earlier run is in the result cache.",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Write a Chrome trace-event file (trace.json) of the run's stages next to its results; "
+        "implies --no-cache.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Sweep head-ablation layers in this many forked CPU processes sharing the model weights.",
+    )
+    parser.add_argument(
+        "--threads-per-worker",
+        type=int,
+        default=None,
+        help="Torch intra-op threads per --workers process (default: available CPUs split evenly).",
     )
     parser.add_argument(
         "--atlas-tags",
@@ -343,6 +390,7 @@ def main() -> None:
     semantic_tags = [t.strip() for t in (args.atlas_tags or "").split(",") if t.strip()] if args.atlas_tags else []
     if adapter_ids:
         semantic_tags.extend([f"adapter:{adapter_id}" for adapter_id in adapter_ids])
+    tracer = Tracer() if args.trace else None
     result = load_and_run(
         args.spec,
         model_manager,
@@ -357,12 +405,39 @@ def main() -> None:
         batch_size=preset_batch_size,
         semantic_tags=semantic_tags or None,
         adapter_ids=adapter_ids or None,
+        shard_index=args.shard_index,
+        num_shards=args.num_shards,
+        token_cache=(
+            TokenizedDatasetCache.from_config(app_cfg.tokenized_cache, base=root)
+            if app_cfg.tokenized_cache.enabled
+            else None
+        ),
+        activation_store=(
+            ActivationStore.from_config(app_cfg.activation_store, base=root)
+            if app_cfg.activation_store.enabled
+            else None
+        ),
+        baseline_store=(
+            BaselineStore.from_config(app_cfg.baseline_store, base=root) if app_cfg.baseline_store.enabled else None
+        ),
+        result_cache=(
+            ResultCache.from_config(app_cfg.result_cache, base=root)
+            if app_cfg.result_cache.enabled and not (args.no_cache or args.trace)
+            else None
+        ),
+        tracer=tracer,
+        resume_dir=args.resume,
+        workers=args.workers,
+        threads_per_worker=args.threads_per_worker,
     )
     saved_path = result.artifact_paths.get("result_json")
     if saved_path:
         print(f"Experiment {result.spec_id} saved to {saved_path}")
     else:
         print(f"Experiment {result.spec_id} completed (no artifact path recorded)")
+    if tracer is not None and saved_path:
+        trace_path = tracer.write_chrome_trace(Path(saved_path).parent / "trace.json")
+        print(f"Trace written to {trace_path} (open in chrome://tracing or ui.perfetto.dev)")
     if atlas_writer is not None:
         tags = []
         if args.atlas_tags:
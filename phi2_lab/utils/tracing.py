@@ -0,0 +1,133 @@
+"""Lightweight span tracer for experiment runs, exportable as a Chrome trace.
+
+Code marks stages with ``with span("forward"):``. Spans are only recorded
+while a :class:`Tracer` is active (see :func:`tracing`); otherwise
+:func:`span` returns a shared no-op context manager, so instrumented hot
+paths cost one global lookup per call when tracing is off.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List
+
+_NULL_SPAN = nullcontext()
+_active: "Tracer | None" = None
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer: "Tracer", name: str, args: Dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.tracer._record(self.name, self.start, time.perf_counter_ns(), self.args)
+
+
+class Tracer:
+    """Collects completed spans as Chrome trace-event ``"X"`` (complete) events.
+
+    Timestamps are microseconds since the tracer was created; events carry
+    the process and thread ids, so spans from helper threads land on their
+    own track in ``chrome://tracing`` or Perfetto.
+    """
+
+    def __init__(self) -> None:
+        self.events: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def span(self, name: str, **args: Any) -> ContextManager[Any]:
+        return _Span(self, name, args)
+
+    def summary(self, since: int = 0) -> Dict[str, Dict[str, float]]:
+        """Per-stage ``{calls, total_ms, mean_ms, max_ms}`` of spans recorded after event ``since``.
+
+        Stages are ordered slowest first. Nested spans are counted in full by
+        every enclosing stage, so totals of different stages overlap.
+        """
+
+        stages: Dict[str, List[float]] = {}
+        with self._lock:
+            for event in self.events[since:]:
+                stages.setdefault(event["name"], []).append(event["dur"] / 1e3)
+        table = {
+            name: {
+                "calls": len(durations),
+                "total_ms": round(sum(durations), 3),
+                "mean_ms": round(sum(durations) / len(durations), 3),
+                "max_ms": round(max(durations), 3),
+            }
+            for name, durations in stages.items()
+        }
+        return dict(sorted(table.items(), key=lambda item: -item[1]["total_ms"]))
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        with self._lock:
+            events = list(self.events)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str | Path) -> Path:
+        trace_path = Path(path)
+        trace_path.parent.mkdir(parents=True, exist_ok=True)
+        trace_path.write_text(json.dumps(self.chrome_trace(), default=str), encoding="utf-8")
+        return trace_path
+
+    def _record(self, name: str, start: int, end: int, args: Dict[str, Any]) -> None:
+        event: Dict[str, Any] = {
+            "name": name,
+            "cat": name.split(".", 1)[0],
+            "ph": "X",
+            "ts": (start - self._origin) / 1e3,
+            "dur": (end - start) / 1e3,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+
+def span(name: str, **args: Any) -> ContextManager[Any]:
+    """Time the enclosed block as stage ``name`` on the active tracer, if any."""
+
+    tracer = _active
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, args)
+
+
+def active_tracer() -> Tracer | None:
+    return _active
+
+
+@contextmanager
+def tracing(tracer: Tracer | None) -> Iterator[Tracer | None]:
+    """Make ``tracer`` the active tracer for the enclosed block; ``None`` leaves the current one."""
+
+    global _active
+    if tracer is None:
+        yield _active
+        return
+    previous = _active
+    _active = tracer
+    try:
+        yield tracer
+    finally:
+        _active = previous
+
+
+__all__ = ["Tracer", "active_tracer", "span", "tracing"]
@@ -0,0 +1,86 @@
+"""Shared fixtures for the experiment tests.
+
+Heavy imports stay inside the fixtures so suites that never request them (the
+platform and smoke tests) run without torch installed.
+"""
+from pathlib import Path
+
+import pytest
+
+DATASET = Path(__file__).resolve().parents[1] / "phi2_lab" / "data" / "ablation_dataset_extended.jsonl"
+
+
+@pytest.fixture
+def ablation_dataset() -> Path:
+    """The bundled ablation dataset used by the experiment tests."""
+
+    return DATASET
+
+
+@pytest.fixture
+def make_spec(ablation_dataset):
+    """Build an :class:`ExperimentSpec` over the ablation dataset; ``fields`` may override ``dataset``."""
+
+    from phi2_lab.phi2_experiments.spec import ExperimentSpec
+
+    def _make(spec_id: str, experiment_type: str, **fields):
+        dataset = {"name": "ablation", "path": str(ablation_dataset)}
+        return ExperimentSpec.from_dict({"id": spec_id, "type": experiment_type, "dataset": dataset, **fields})
+
+    return _make
+
+
+@pytest.fixture
+def make_manager():
+    """Build a seeded, loaded mock :class:`Phi2ModelManager`.
+
+    ``num_layers`` swaps in a mock model of that depth and ``model`` a model from
+    the given factory (built after the default mock, so seeding matches across
+    tests); ``config`` is passed to :class:`ModelConfig`.
+    """
+
+    torch = pytest.importorskip("torch")
+    from phi2_lab.phi2_core.config import ModelConfig
+    from phi2_lab.phi2_core.model_manager import Phi2ModelManager, _MockPhi2Model
+
+    def _make(num_layers: int | None = None, model=None, **config):
+        torch.manual_seed(0)
+        manager = Phi2ModelManager(ModelConfig(use_mock=True, **config))
+        manager.load()
+        if model is not None:
+            manager.replace_model(model().eval())
+        elif num_layers is not None:
+            manager.replace_model(_MockPhi2Model(num_layers=num_layers).eval())
+        return manager
+
+    return _make
+
+
+@pytest.fixture
+def make_runner(tmp_path, monkeypatch, make_manager):
+    """Build :class:`ExperimentRunner` instances over :func:`make_manager`, run from ``tmp_path``.
+
+    Keyword ``settings`` are assigned to runner attributes (``batch_size``,
+    ``residual_cache_mb``, ``baseline_store``, ...).
+    """
+
+    from phi2_lab.phi2_experiments.runner import ExperimentRunner
+
+    monkeypatch.chdir(tmp_path)
+
+    def _make(num_layers: int | None = None, model=None, **settings):
+        runner = ExperimentRunner(make_manager(num_layers, model))
+        for name, value in settings.items():
+            if not hasattr(runner, name):
+                raise AttributeError(f"ExperimentRunner has no setting {name!r}")
+            setattr(runner, name, value)
+        return runner
+
+    return _make
+
+
+@pytest.fixture
+def mock_runner(make_runner):
+    """A runner over the default mock model with default settings."""
+
+    return make_runner()
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_experiments.activation_store import ActivationStore
+from phi2_lab.phi2_experiments.runner import MANIFEST_KEY
+
+HOOKS = {"components": ["mlp"], "layers": [0, 1]}
+
+
+@pytest.mark.parametrize("pooling", ["mean", "full"])
+def test_probe_and_geometry_reuse_stored_activations(tmp_path, monkeypatch, make_runner, make_spec, pooling):
+    runner = make_runner(activation_store=ActivationStore(tmp_path / "store", max_bytes=2**24, pooling=pooling))
+    probe = make_spec("activation_store_probe", "probe", hook_template=HOOKS)
+
+    cold = runner.run(probe)
+    assert cold.metadata[MANIFEST_KEY]["activation_store"]["misses"] == 2
+
+    def _no_forward(*_args, **_kwargs):
+        raise AssertionError("activations should be served from the store")
+
+    monkeypatch.setattr(runner, "_record_with_spec", _no_forward)
+    warm = runner.run(probe)
+    geometry = runner.run(make_spec("activation_store_geometry", "geometry", hook_template=HOOKS))
+
+    assert warm.metadata[MANIFEST_KEY]["activation_store"]["hits"] == 2
+    assert warm.aggregated_metrics == cold.aggregated_metrics
+    assert cold.aggregated_metrics == make_runner().run(probe).aggregated_metrics  # float32 leaves values exact
+    assert geometry.metadata[MANIFEST_KEY]["activation_store"] == warm.metadata[MANIFEST_KEY]["activation_store"]
+    assert set(geometry.aggregated_metrics["geometry"]) == set(cold.aggregated_metrics["probe"])
+
+
+def test_store_evicts_least_recently_used_entries(tmp_path):
+    entry = [np.ones(256, dtype=np.float32)] * 4  # 4 x 256 float16 = 2 KiB per entry
+    store = ActivationStore(tmp_path, max_bytes=5 * 1024, dtype="float16")
+    store.put("a", entry)
+    store.put("b", entry)
+    assert store.get("a", 4) is not None  # refreshes "a", leaving "b" least recently used
+    store.put("c", entry)
+
+    assert store.get("b", 4) is None
+    assert store.get("a", 4) is not None and store.get("c", 4) is not None
+    assert store.evictions == 1
+    assert store.size_bytes() <= 5 * 1024
@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_core.model_manager import _MockPhi2Model
+from phi2_lab.phi2_experiments.baseline_store import BaselineStore
+from phi2_lab.phi2_experiments.runner import MANIFEST_KEY
+
+RUNNER = {"num_layers": 3, "batch_size": 4, "residual_cache_mb": 0}
+INTERVENTIONS = [{"name": "push", "point": {"layer": 1, "component": "mlp"}, "delta": [0.5, -0.25]}]
+
+
+@pytest.fixture
+def heads(make_spec):
+    return make_spec("baseline_store_heads", "head_ablation", layers=[1], heads=[0, 1])
+
+
+def test_baselines_are_reused_across_runs_and_experiment_types(tmp_path, monkeypatch, make_runner, make_spec, heads):
+    intervention = make_spec("baseline_store_intervention", "direction_intervention", interventions=INTERVENTIONS)
+    runner = make_runner(**RUNNER, baseline_store=BaselineStore(tmp_path / "baselines.sqlite"))
+    cold_heads = runner.run(heads)
+    cold_intervention = make_runner(**RUNNER).run(intervention)
+    assert cold_heads.metadata[MANIFEST_KEY]["baseline_store"]["misses"] == 1
+
+    def _no_baseline(*_args, **_kwargs):
+        raise AssertionError("baseline metrics should be served from the store")
+
+    monkeypatch.setattr(runner, "_compute_baseline", _no_baseline)
+    warm_heads = runner.run(heads)
+    warm_intervention = runner.run(intervention)
+
+    assert warm_heads.metadata[MANIFEST_KEY]["baseline_store"]["hits"] == 1
+    assert warm_heads.aggregated_metrics == cold_heads.aggregated_metrics
+    assert warm_heads.per_head_metrics == cold_heads.per_head_metrics
+    assert warm_intervention.metadata[MANIFEST_KEY]["baseline_store"]["hits"] == 1
+    for section in ("baseline", "intervention", "delta"):
+        for metric, values in cold_intervention.aggregated_metrics[section].items():
+            assert warm_intervention.aggregated_metrics[section][metric] == pytest.approx(values, rel=1e-4, abs=1e-6)
+
+
+def test_stored_baseline_refills_residual_cache_without_baseline_pass(tmp_path, monkeypatch, make_runner, heads):
+    runner = make_runner(**RUNNER, baseline_store=BaselineStore(tmp_path / "baselines.sqlite"))
+    runner.residual_cache_mb = 64
+    cold = runner.run(heads)
+    assert cold.metadata[MANIFEST_KEY]["baseline"] == {
+        "source": "computed",
+        "baseline_pass": True,
+        "residual_refill": False,
+    }
+
+    def _no_baseline(*_args, **_kwargs):
+        raise AssertionError("a stored baseline should only trigger a truncated refill forward")
+
+    monkeypatch.setattr(runner, "_compute_baseline", _no_baseline)
+    warm = runner.run(heads)
+
+    assert warm.metadata[MANIFEST_KEY]["baseline"] == {
+        "source": "baseline_store",
+        "baseline_pass": False,
+        "residual_refill": True,
+    }
+    assert warm.metadata["residual_cache"]["hits"] == cold.metadata["residual_cache"]["hits"] > 0
+    assert warm.aggregated_metrics == cold.aggregated_metrics
+    assert warm.per_head_metrics == cold.per_head_metrics
+
+
+def test_key_components_keep_separate_baselines(tmp_path, make_runner, heads):
+    store = BaselineStore(tmp_path / "baselines.sqlite")
+    runner = make_runner(**RUNNER, baseline_store=store)
+    runner.run(heads)
+
+    runner.max_length = 4
+    truncated = runner.run(heads)
+    assert truncated.metadata[MANIFEST_KEY]["baseline_store"] == {
+        "path": str(store.path),
+        "hits": 0,
+        "misses": 1,
+        "invalidations": 0,
+    }
+    runner.max_length = None
+    restored = runner.run(heads)
+    assert restored.metadata[MANIFEST_KEY]["baseline_store"]["hits"] == 1
+
+    runner.model_manager.replace_model(_MockPhi2Model(num_layers=3).eval())  # new weights
+    runner.run(heads)
+    assert store.misses == 1 and store.invalidations == 0
+
+
+def test_changed_dataset_contents_invalidate_stored_baselines(tmp_path, make_runner, make_spec, ablation_dataset):
+    dataset = tmp_path / "dataset.jsonl"
+    lines = ablation_dataset.read_text(encoding="utf-8").splitlines(keepends=True)
+    dataset.write_text("".join(lines), encoding="utf-8")
+    spec = make_spec("baseline_store_data", "head_ablation", layers=[1], heads=[0], dataset={"path": str(dataset)})
+    store = BaselineStore(tmp_path / "baselines.sqlite")
+    runner = make_runner(**RUNNER, baseline_store=store)
+    runner.run(spec)
+    runner.max_length = 4
+    runner.run(spec)
+
+    dataset.write_text("".join(reversed(lines)), encoding="utf-8")
+    runner.run(spec)
+    assert store.stats()["invalidations"] == 2  # both max_length variants of the old contents
+
+
+def test_store_round_trips_and_serves_record_prefixes(tmp_path):
+    store = BaselineStore(tmp_path / "baselines.sqlite")
+    losses, accuracies = np.random.default_rng(0).random((2, 6))
+    store.put("scope", "key", "data", losses, accuracies)
+    store.put("scope", "key", "data", losses[:3], accuracies[:3])  # shorter rows never replace longer ones
+
+    cached = store.get("scope", "key", "data", 4)
+    assert cached is not None
+    np.testing.assert_array_equal(cached[0], losses[:4])
+    np.testing.assert_array_equal(cached[1], accuracies[:4])
+    assert store.get("scope", "key", "data", 7) is None
+    assert store.get("other", "key", "data", 1) is None
+    assert store.stats()["hits"] == 1 and store.stats()["misses"] == 2
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_core.config import ModelConfig
+from phi2_lab.phi2_core.hooks import AblationKind, AblationRequest, HookPoint, HookSpec
+from phi2_lab.phi2_core.model_manager import _cpu_supports_bfloat16
+
+
+@pytest.fixture
+def logits(make_manager, ablation_dataset):
+    """Build a manager with the given ``ModelConfig`` fields and return it with its logits for 16 prompts."""
+
+    with ablation_dataset.open(encoding="utf-8") as handle:
+        prompts = [json.loads(line)["input"] for line in handle][:16]
+
+    def _logits(**cfg):
+        manager = make_manager(**cfg)
+        tokenizer = manager.load().tokenizer
+        outputs = []
+        with torch.no_grad():
+            for prompt in prompts:
+                result, _ = manager.forward_with_hooks(tokenizer(prompt, return_tensors="pt"), HookSpec())
+                outputs.append(result.logits.float())
+        return manager, outputs
+
+    return _logits
+
+
+def _drift(reference: list, candidate: list) -> tuple[float, float]:
+    """Return (max |logit error| relative to the logit range, top-1 agreement) over all prompt tokens."""
+
+    errors, agree, total = [], 0, 0
+    for ref, out in zip(reference, candidate):
+        errors.append(float((ref - out).abs().max() / (ref.max() - ref.min())))
+        agree += int((ref.argmax(-1) == out.argmax(-1)).sum())
+        total += ref.shape[0] * ref.shape[1]
+    return max(errors), agree / total
+
+
+@pytest.mark.parametrize(
+    "cfg, max_error, min_agreement",
+    [
+        ({"cpu_mode": "dynamic_int8"}, 0.03, 0.95),
+        ({"cpu_mode": "bfloat16_autocast"}, 0.03, 0.95),
+        ({"compile": True}, 1e-5, 1.0),
+    ],
+)
+def test_cpu_mode_drift_against_float32(logits, cfg, max_error, min_agreement):
+    _, reference = logits()
+    _, candidate = logits(**cfg)
+    error, agreement = _drift(reference, candidate)
+    assert error <= max_error
+    assert agreement >= min_agreement
+
+
+def test_dynamic_int8_keeps_hook_points(logits):
+    manager, _ = logits(cpu_mode="dynamic_int8")
+    model = manager.load().model
+    assert isinstance(model.layers[0].self_attn.proj, torch.ao.nn.quantized.dynamic.Linear)
+    point = HookPoint(layer_idx=1, submodule="self_attn")
+    spec = HookSpec(record_points=[point], ablate_points=[AblationRequest(point, AblationKind.ATTENTION_HEAD, [0])])
+    inputs = {"input_ids": torch.randint(1, 128, (2, 8))}
+    with torch.no_grad():
+        _, activations = manager.forward_with_hooks(inputs, spec)
+    assert activations[point.key()].shape == (2, 8, 32)
+    with pytest.raises(RuntimeError, match="no gradients"):
+        manager.forward_with_gradients(inputs, [point], lambda outputs: outputs.logits.sum())
+
+
+def test_compiled_model_sees_hooks_installed_after_first_compile(make_manager):
+    manager = make_manager(compile=True)
+    eager = make_manager()
+    point = HookPoint(layer_idx=1, submodule="self_attn")
+    spec = HookSpec(record_points=[point])
+    inputs = {"input_ids": torch.randint(1, 128, (2, 8))}
+    with torch.no_grad():
+        manager.forward_with_hooks(inputs, HookSpec())  # one shape, so the hook-free graph stays compiled
+        _, expected = eager.forward_with_hooks(inputs, spec)
+        with manager.persistent_hooks():
+            _, activations = manager.forward_with_hooks(inputs, spec)
+    assert activations.keys() == expected.keys()
+    torch.testing.assert_close(activations[point.key()], expected[point.key()])
+    assert torch._dynamo.config.skip_nnmodule_hook_guards  # only patched around this model's forwards
+
+
+def test_bfloat16_autocast_only_when_supported(logits, make_manager):
+    manager, _ = logits(cpu_mode="bfloat16_autocast")
+    assert (manager._autocast_dtype is torch.bfloat16) == _cpu_supports_bfloat16()
+    assert manager.weights_fingerprint() != make_manager().weights_fingerprint()
+
+
+def test_cpu_mode_requires_float32_weights():
+    with pytest.raises(ValueError, match="float32"):
+        ModelConfig(cpu_mode="dynamic_int8", dtype="bfloat16")
+    with pytest.raises(ValueError, match="cpu_mode"):
+        ModelConfig(cpu_mode="int4")
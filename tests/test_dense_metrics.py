@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from phi2_lab.phi2_experiments.metrics import (
+    compute_delta_metrics,
+    compute_task_correlations,
+    compute_task_correlations_array,
+    rank_heads_by_importance,
+    rank_heads_by_importance_array,
+    summarize_metric_array,
+)
+
+
+def test_array_metrics_match_scalar_versions():
+    rng = np.random.default_rng(0)
+    layers, heads = [0, 2, 10], [0, 1, 11]
+    values = rng.normal(size=(len(layers), len(heads), 7))
+    values[1, 2] = values[0, 0]  # tied scores are ordered by head name
+
+    summary = summarize_metric_array(np.abs(values))
+    per_head = {}
+    for layer_pos, layer in enumerate(layers):
+        for head_pos, head in enumerate(heads):
+            expected = compute_delta_metrics(np.abs(values[layer_pos, head_pos]).tolist())
+            actual = {stat: float(means[layer_pos, head_pos]) for stat, means in summary.items()}
+            assert actual == pytest.approx(expected)
+            per_head[f"layer{layer}.head{head}"] = actual
+
+    assert rank_heads_by_importance_array(summary["mean"], layers, heads) == rank_heads_by_importance(per_head)
+    assert rank_heads_by_importance_array(summary["mean"], layers, heads, top_k=4) == rank_heads_by_importance(
+        per_head, top_k=4
+    )
+
+    series = {"a": values[0, 0], "b": values[1, 1], "constant": np.ones(7)}
+    vectorized = compute_task_correlations_array(series)
+    scalar = compute_task_correlations({name: list(value) for name, value in series.items()})
+    assert vectorized.keys() == scalar.keys()
+    assert np.allclose(list(vectorized.values()), list(scalar.values()))
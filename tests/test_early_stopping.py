@@ -0,0 +1,85 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_experiments.sequential import SIGNIFICANT, SequentialEffectTest
+
+
+def _write_dataset(path: Path, records: int) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        for idx in range(records):
+            words = " ".join(f"w{(idx * 7 + offset) % 23}" for offset in range(3 + idx % 5))
+            handle.write(json.dumps({"input": words, "label": idx % 2}) + "\n")
+
+
+def test_running_statistics_match_batch_statistics():
+    values = np.random.default_rng(0).normal(size=(3, 40))
+    values[1, 5:9] = np.nan
+    effect_test = SequentialEffectTest(3, threshold=0.1, confidence=0.95, min_records=2, records=40)
+    for start in range(0, 40, 7):
+        effect_test.update([0, 1, 2], values[:, start : start + 7])
+
+    assert effect_test.count.tolist() == [40, 36, 40]
+    np.testing.assert_allclose(effect_test.mean, np.nanmean(values, axis=1))
+    np.testing.assert_allclose(effect_test.m2 / (effect_test.count - 1), np.nanvar(values, axis=1, ddof=1))
+
+
+@pytest.mark.parametrize("batch_size", [1, 4, 16])
+def test_repeated_checks_keep_the_error_rate_within_confidence(batch_size):
+    # Zero-effect heads checked after every batch: an uncorrected 95% interval calls
+    # roughly a fifth of them significant at some check, more the smaller the batches.
+    heads, records = 4000, 64
+    rng = np.random.default_rng(0)
+    effect_test = SequentialEffectTest(
+        heads, threshold=0.0, confidence=0.95, min_records=16, records=records, check_every=16
+    )
+    flagged = np.zeros(heads, dtype=bool)
+    for _ in range(records // batch_size):
+        effect_test.update(range(heads), rng.normal(size=(heads, batch_size)))
+        flagged |= effect_test.check()
+
+    assert effect_test.looks == 4  # at 16, 32, 48 and 64 records, whatever the batch size
+    assert flagged.mean() <= 0.05
+
+
+def test_negligible_heads_stop_before_the_record_budget(tmp_path, make_runner, make_spec):
+    dataset = tmp_path / "records.jsonl"
+    _write_dataset(dataset, records=64)
+
+    def _run(**early_stopping):
+        spec = make_spec(
+            "early_stopping_sweep",
+            "head_ablation",
+            dataset={"name": "synthetic", "path": str(dataset)},
+            layers="all",
+            heads="all",
+            **early_stopping,
+        )
+        return make_runner(batch_size=4).run(spec)
+
+    full = _run()
+    stopped = _run(early_stopping={"threshold": 10.0, "min_records": 8})
+    report = stopped.metadata["early_stopping"]
+
+    assert "early_stopping" not in full.metadata
+    assert report["correction"] == "bonferroni" and report["planned_looks"] == 5  # at 8, 24, 40, 56 and 64
+    assert set(report["decisions"].values()) == {"negligible"}
+    assert list(report["samples"]) == list(stopped.per_head_metrics) == list(full.per_head_metrics)
+    assert all(8 <= count < 64 for count in report["samples"].values())
+    assert report["records_evaluated"] == sum(report["samples"].values()) < report["records_budget"]
+    with np.load(stopped.artifact_paths["per_example"]) as data:
+        assert len(data["loss_delta"]) == report["records_evaluated"]
+        assert not np.isnan(data["loss_delta"]).any()
+
+    strict = _run(early_stopping={"threshold": 0.0, "min_records": 8})
+    decisions = strict.metadata["early_stopping"]["decisions"]
+    samples = strict.metadata["early_stopping"]["samples"]
+    assert "negligible" not in decisions.values()
+    for key, decision in decisions.items():
+        if decision == "undecided":
+            assert samples[key] == 64
+            assert strict.per_head_metrics[key]["loss_delta"] == pytest.approx(full.per_head_metrics[key]["loss_delta"])
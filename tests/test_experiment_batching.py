@@ -0,0 +1,45 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_experiments.batching import IGNORE_INDEX, build_batches, collate_encoded
+
+
+def _encoded(length: int) -> dict:
+    ids = torch.arange(1, length + 1).unsqueeze(0)
+    return {"input_ids": ids, "attention_mask": torch.ones_like(ids), "labels": ids.clone()}
+
+
+def test_collate_right_pads_and_masks():
+    batch = collate_encoded([_encoded(3), _encoded(5)], pad_token_id=0)
+    assert batch["input_ids"].shape == (2, 5)
+    assert batch["attention_mask"][0].tolist() == [1, 1, 1, 0, 0]
+    assert batch["labels"][0, 3:].tolist() == [IGNORE_INDEX, IGNORE_INDEX]
+
+    batches = build_batches([_encoded(4), _encoded(2), _encoded(3)], batch_size=2, pad_token_id=0)
+    assert [batch.record_indices for batch in batches] == [[1, 2], [0]]
+
+
+def test_batched_head_ablation_matches_unbatched(make_runner, make_spec):
+    spec = make_spec("batching_check", "head_ablation", layers=[0, 1], heads=[0, 1, 2, 3])
+    single = make_runner(batch_size=1).run(spec)
+    batched = make_runner(batch_size=4).run(spec)
+
+    assert batched.aggregated_metrics["baseline"]["loss"]["mean"] == pytest.approx(
+        single.aggregated_metrics["baseline"]["loss"]["mean"], rel=1e-5
+    )
+    assert batched.per_head_metrics.keys() == single.per_head_metrics.keys()
+    for key, metrics in single.per_head_metrics.items():
+        assert batched.per_head_metrics[key]["loss_delta"]["mean"] == pytest.approx(
+            metrics["loss_delta"]["mean"], rel=1e-4, abs=1e-6
+        )
+
+
+def test_head_mask_ablation_matches_per_head_path(make_runner, make_spec):
+    spec = make_spec("head_mask_check", "head_ablation", layers=[0, 1], heads="all")
+    per_head = make_runner(batch_size=3, multi_head_ablation=False).run(spec)
+    masked = make_runner(batch_size=3, multi_head_ablation=True).run(spec)
+    assert set(masked.per_head_metrics) == {f"layer{l}.head{h}" for l in (0, 1) for h in range(4)}
+    for key, metrics in per_head.per_head_metrics.items():
+        for name in ("loss_delta", "accuracy_delta", "importance"):
+            assert masked.per_head_metrics[key][name] == pytest.approx(metrics[name], rel=1e-6, abs=1e-9)
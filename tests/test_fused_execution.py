@@ -0,0 +1,43 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_experiments.runner import MANIFEST_KEY
+
+
+def test_fused_execution_matches_sequential_runs(monkeypatch, make_runner, make_spec):
+    specs = [
+        make_spec("fused_probe", "probe", hook_template={"layers": [0, 1]}),
+        make_spec("fused_geometry", "geometry", hook_template={"components": ["self_attn", "mlp"], "layers": [1]}),
+        make_spec("fused_ablation", "head_ablation", layers=[0], heads=[0]),
+    ]
+
+    def counting_runner():
+        runner, forwards = make_runner(), []
+        record = runner.model_manager.record_activations
+
+        def counting_record(inputs, hook_spec):
+            if hook_spec.record_points:
+                forwards.append(1)
+            return record(inputs, hook_spec)
+
+        monkeypatch.setattr(runner.model_manager, "record_activations", counting_record)
+        return runner, forwards
+
+    sequential_runner, sequential_forwards = counting_runner()
+    sequential = [sequential_runner.run(spec) for spec in specs]
+    fused_runner, fused_forwards = counting_runner()
+    fused = fused_runner.run_fused(specs)
+
+    records = sequential[0].metadata["records"]
+    assert len(sequential_forwards) == 2 * records
+    assert len(fused_forwards) == records
+    assert [result.spec.id for result in fused] == [spec.id for spec in specs]
+    for expected, actual in zip(sequential, fused):
+        assert actual.aggregated_metrics == expected.aggregated_metrics
+        assert actual.per_head_metrics == expected.per_head_metrics
+        assert {k: v for k, v in actual.metadata.items() if k != MANIFEST_KEY} == {
+            k: v for k, v in expected.metadata.items() if k != MANIFEST_KEY
+        }
+    assert fused[0].metadata[MANIFEST_KEY]["fused_with"] == ["fused_probe", "fused_geometry"]
+    assert "fused_with" not in fused[2].metadata[MANIFEST_KEY]
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from phi2_lab.phi2_experiments.geometry import IncrementalPCA, choose_algorithm, compute_pca, compute_svd
+
+
+def _low_rank_activations(records: int, dims: int, rank: int = 8, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    latent = rng.normal(size=(records, rank)) * np.linspace(20.0, 5.0, rank)
+    basis = np.linalg.qr(rng.normal(size=(dims, rank)))[0].T
+    return (latent @ basis + 0.5 * rng.normal(size=(records, dims)) + 3.0).astype(np.float32)
+
+
+def _subspace_cosines(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Cosines of the principal angles between the row spaces of ``a`` and ``b``."""
+
+    return np.linalg.svd(a @ b.T, compute_uv=False)
+
+
+@pytest.mark.parametrize("algorithm", ["randomized", "incremental"])
+@pytest.mark.parametrize("center", [True, False])
+def test_truncated_solvers_match_exact_subspace(algorithm, center):
+    activations = _low_rank_activations(1500, 300)
+    exact = compute_pca(activations, components=4, center=center)
+    approx = compute_pca(activations, components=4, center=center, algorithm=algorithm)
+
+    assert _subspace_cosines(exact.components, approx.components).min() > 0.999
+    np.testing.assert_allclose(approx.explained_variance, exact.explained_variance, rtol=1e-3)
+    np.testing.assert_allclose(approx.explained_variance_ratio, exact.explained_variance_ratio, rtol=1e-3)
+    np.testing.assert_allclose(approx.mean, activations.mean(axis=0, keepdims=True), rtol=1e-4, atol=1e-4)
+    exact_svd = compute_svd(activations, components=4, center=center)
+    approx_svd = compute_svd(activations, components=4, center=center, algorithm=algorithm)
+    np.testing.assert_allclose(approx_svd.singular_values, exact_svd.singular_values, rtol=1e-3)
+
+
+def test_incremental_pca_consumes_chunks_without_stacking():
+    activations = _low_rank_activations(900, 200, seed=1)
+    streamed = IncrementalPCA(components=3)
+    for start in range(0, len(activations), 70):
+        streamed.partial_fit(activations[start : start + 70])
+    exact = compute_pca(activations, components=3)
+
+    assert streamed.samples == len(activations)
+    assert _subspace_cosines(exact.components, streamed.pca_result().components).min() > 0.999
+    np.testing.assert_allclose(streamed.pca_result().explained_variance_ratio, exact.explained_variance_ratio, rtol=1e-3)
+
+
+def test_choose_algorithm_by_shape_and_rank():
+    assert choose_algorithm((12, 2560), 3) == "exact"
+    assert choose_algorithm((10_000, 2560), 3) == "randomized"
+    assert choose_algorithm((10_000, 2560), 800) == "exact"
+
+
+def test_geometry_run_reports_selected_algorithm(mock_runner, make_spec):
+    from phi2_lab.phi2_experiments.spec import ExperimentSpec
+
+    results = {}
+    for algorithm in ("auto", "incremental"):
+        spec = make_spec(
+            f"geometry_{algorithm}",
+            "geometry",
+            hook_template={"layers": [1]},
+            geometry={"components": 2, "algorithm": algorithm},
+        )
+        results[algorithm] = mock_runner.run(spec)
+
+    assert results["auto"].metadata["algorithms"] == {"layer1_mlp": "exact"}
+    assert results["incremental"].metadata["algorithms"] == {"layer1_mlp": "incremental"}
+    exact = results["auto"].aggregated_metrics["geometry"]["layer1_mlp"]["svd"]["singular_values"]
+    streamed = results["incremental"].aggregated_metrics["geometry"]["layer1_mlp"]["svd"]["singular_values"]
+    np.testing.assert_allclose(streamed, exact, rtol=1e-4)
+    with pytest.raises(ValueError):
+        ExperimentSpec.from_dict({"id": "bad", "type": "geometry", "geometry": {"algorithm": "lanczos"}})
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+SWEEP = {"layers": [0, 1], "heads": "all"}
+
+
+def test_attribution_tracks_exact_head_ablation(make_runner, make_spec):
+    exact = make_runner(batch_size=4).run(
+        make_spec("attribution_check", "head_ablation", **SWEEP, ablation_mode="zero")
+    )
+    estimated = make_runner(batch_size=4).run(
+        make_spec("attribution_check", "head_ablation", **SWEEP, ablation_mode="attribution")
+    )
+
+    assert estimated.metadata["estimator"] == "attribution"
+    assert estimated.metadata["forward_passes"] == estimated.metadata["backward_passes"] == 3
+    assert estimated.per_head_metrics.keys() == exact.per_head_metrics.keys()
+    assert estimated.aggregated_metrics["baseline"]["loss"]["mean"] == pytest.approx(
+        exact.aggregated_metrics["baseline"]["loss"]["mean"], rel=1e-5
+    )
+    keys = sorted(exact.per_head_metrics)
+    exact_deltas = [exact.per_head_metrics[key]["loss_delta"]["mean"] for key in keys]
+    estimated_deltas = [estimated.per_head_metrics[key]["loss_delta"]["mean"] for key in keys]
+    assert np.corrcoef(exact_deltas, estimated_deltas)[0, 1] > 0.99
+    assert estimated.metadata["importance_ranking"][0]["head"] == exact.metadata["importance_ranking"][0]["head"]
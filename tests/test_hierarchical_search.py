@@ -0,0 +1,50 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+
+PLANTED = {(1, 5), (3, 2)}
+
+
+def _planted_model(layers: int = 4, heads: int = 8, hidden_size: int = 64):
+    transformers = pytest.importorskip("transformers")
+    config = transformers.PhiConfig(
+        vocab_size=128,
+        hidden_size=hidden_size,
+        intermediate_size=2 * hidden_size,
+        num_hidden_layers=layers,
+        num_attention_heads=heads,
+        max_position_embeddings=64,
+    )
+    model = transformers.PhiForCausalLM(config)
+    head_dim = hidden_size // heads
+    with torch.no_grad():
+        for layer_idx, block in enumerate(model.model.layers):
+            for head in range(heads):
+                if (layer_idx, head) not in PLANTED:
+                    rows = slice(head * head_dim, (head + 1) * head_dim)
+                    block.self_attn.dense.weight[rows] *= 1e-3
+                    block.self_attn.dense.bias[rows] *= 1e-3
+    return model
+
+
+def test_hierarchical_search_finds_planted_heads_with_fewer_forwards(make_runner, make_spec):
+    search = {"strategy": "hierarchical", "threshold": 0.001, "branching": 2}
+    exhaustive = make_runner(model=_planted_model, batch_size=4).run(
+        make_spec("hierarchical_search", "head_ablation", layers="all", heads="all")
+    )
+    hierarchical = make_runner(model=_planted_model, batch_size=4).run(
+        make_spec("hierarchical_search", "head_ablation", layers="all", heads="all", search=search)
+    )
+    report = hierarchical.metadata["head_search"]
+
+    planted_keys = {f"layer{layer}.head{head}" for layer, head in PLANTED}
+    assert {item["head"] for item in exhaustive.metadata["importance_ranking"][:2]} == planted_keys
+    assert {item["head"] for item in hierarchical.metadata["importance_ranking"][:2]} == planted_keys
+    assert report["forwards_per_record"] < report["exhaustive_forwards_per_record"] == 32
+    assert planted_keys <= hierarchical.per_head_metrics.keys()
+    assert len(hierarchical.per_head_metrics) == report["heads_measured"] < 32
+    for key in planted_keys:
+        assert hierarchical.per_head_metrics[key]["loss_delta"] == pytest.approx(
+            exhaustive.per_head_metrics[key]["loss_delta"], rel=1e-5
+        )
+    assert [group["heads"] for group in report["groups"] if group["layer"] == 0] == [list(range(8))]
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_core.hooks import HookPoint, HookSpec
+from phi2_lab.phi2_experiments.spec import ExperimentSpec
+
+DELTA = [0.5, -0.25, 1.0, 0.0, 0.75]
+
+
+@pytest.fixture
+def spec(make_spec):
+    """Build the sweep spec with extra fields (``scale``/``scales``) on its one intervention."""
+
+    def _spec(**intervention) -> ExperimentSpec:
+        push = {"name": "push", "point": {"layer": 1, "component": "mlp"}, "delta": DELTA, **intervention}
+        return make_spec("intervention_sweep", "direction_intervention", interventions=[push])
+
+    return _spec
+
+
+@pytest.fixture
+def reference_losses(spec):
+    """Per-record losses from one unbatched forward per record with ``scale * DELTA`` added at layer1.mlp."""
+
+    def _reference_losses(runner, scale: float) -> np.ndarray:
+        resources = runner.model_manager.load()
+        losses = []
+        for record in runner._load_records(spec()):
+            inputs = resources.tokenizer(record.input_text, return_tensors="pt")
+            inputs["labels"] = inputs["input_ids"].clone()
+
+            def push(_module, tensor):
+                delta = torch.nn.functional.pad(torch.tensor(DELTA), (0, tensor.shape[-1] - len(DELTA)))
+                return tensor + scale * delta
+
+            with torch.no_grad():
+                outputs, _ = runner.model_manager.forward_with_hooks(
+                    inputs, HookSpec(interventions={HookPoint(1, "mlp"): push})
+                )
+            losses.append(runner._extract_metrics(outputs, inputs["labels"], inputs["attention_mask"])[0][0])
+        return np.array(losses)
+
+    return _reference_losses
+
+
+def test_scale_sweep_matches_separate_forwards(monkeypatch, make_runner, spec, reference_losses):
+    runner = make_runner(num_layers=3, batch_size=4)
+    forwards = []
+    execute = runner._execute_forward
+    monkeypatch.setattr(runner, "_execute_forward", lambda *args: forwards.append(1) or execute(*args))
+    scales = [-4.0, -2.0, 0.0, 2.0, 4.0]
+    result = runner.run(spec(scales=scales))
+
+    with np.load(result.artifact_paths["direction_intervention"]) as data:
+        arrays = {key: data[key] for key in data.files}
+    records = result.metadata["records"]
+    assert len(forwards) == -(-records // runner.batch_size)  # one forward per batch for all K + 1 rows
+    assert arrays["scales"].tolist() == [[scale] for scale in scales]
+    assert arrays["intervention_loss"].shape == (len(scales), records)
+    np.testing.assert_allclose(arrays["baseline_loss"], reference_losses(runner, 0.0), rtol=1e-5)
+    for row, scale in enumerate(scales):
+        np.testing.assert_allclose(arrays["intervention_loss"][row], reference_losses(runner, scale), rtol=1e-5)
+    np.testing.assert_allclose(arrays["intervention_loss"][2], arrays["baseline_loss"], rtol=1e-6)
+    sweep = result.aggregated_metrics["sweep"]
+    assert [row["scales"] for row in sweep] == [{"push": scale} for scale in scales]
+    assert "intervention" not in result.aggregated_metrics
+
+
+def test_single_scale_keeps_flat_layout(make_runner, spec, reference_losses):
+    runner = make_runner(num_layers=3, batch_size=4)
+    result = runner.run(spec(scale=2.0))
+
+    with np.load(result.artifact_paths["direction_intervention"]) as data:
+        assert data["intervention_loss"].shape == (result.metadata["records"],)
+        assert "scales" not in data.files
+        np.testing.assert_allclose(data["intervention_loss"], reference_losses(runner, 2.0), rtol=1e-5)
+    assert set(result.aggregated_metrics) == {"baseline", "intervention", "delta"}
+    assert isinstance(result.metadata["per_example_preview"][0]["loss_delta"], float)
+    # Specs without a sweep serialize (and hash) as they did before ``scales`` existed.
+    assert "scales" not in result.spec.to_dict()["interventions"][0]
+    assert spec(scales=[1.0, 2.0]).to_dict()["interventions"][0]["scales"] == [1.0, 2.0]
+
+
+def test_mismatched_sweep_lengths_are_rejected(spec):
+    payload = spec().to_dict()
+    payload["interventions"] = [
+        {**payload["interventions"][0], "scales": [1.0, 2.0]},
+        {**payload["interventions"][0], "name": "pull", "scales": [1.0, 2.0, 3.0]},
+    ]
+    with pytest.raises(ValueError, match="same length"):
+        ExperimentSpec.from_dict(payload)
@@ -0,0 +1,51 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_experiments.batching import IGNORE_INDEX
+from phi2_lab.phi2_experiments.runner import ExperimentRunner
+
+
+def test_position_metrics_match_full_logits():
+    torch.manual_seed(0)
+    logits = torch.randn(3, 6, 50)
+    labels = torch.randint(0, 50, (3, 6))
+    labels[1, 4:] = IGNORE_INDEX
+    attention_mask = torch.ones(3, 6, dtype=torch.long)
+    attention_mask[2, 3:] = 0
+    attention_mask[0, 1:] = 0  # a row with no scored position
+
+    rows, columns, _targets = ExperimentRunner._label_positions(labels, attention_mask)
+    gathered = ExperimentRunner._position_metrics(logits[rows, columns], labels, attention_mask)
+    full = ExperimentRunner._token_metrics(logits, labels, attention_mask)
+
+    for actual, expected in zip(gathered, full):
+        torch.testing.assert_close(actual, expected, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("residual_cache_mb", [0, 64])
+def test_head_ablation_with_label_logits_matches_full_logits(make_runner, make_spec, residual_cache_mb):
+    from transformers import PhiConfig, PhiForCausalLM
+
+    config = PhiConfig(
+        vocab_size=128,
+        hidden_size=32,
+        intermediate_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        max_position_embeddings=64,
+    )
+    spec = make_spec("label_logits", "head_ablation", layers="all", heads="all")
+    results = {}
+    for gather in (False, True):
+        runner = make_runner(
+            model=lambda: PhiForCausalLM(config),
+            batch_size=4,
+            residual_cache_mb=residual_cache_mb,
+            gather_label_logits=gather,
+        )
+        results[gather] = runner.run(spec)
+
+    for head, metrics in results[False].per_head_metrics.items():
+        for name, value in metrics.items():
+            assert results[True].per_head_metrics[head][name] == pytest.approx(value, rel=1e-4, abs=1e-6)
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_experiments.parallel import fork_map
+from phi2_lab.phi2_experiments.runner import MANIFEST_KEY
+
+
+def _npz(result) -> dict:
+    with np.load(result.artifact_paths["per_example"]) as data:
+        return {key: data[key] for key in data.files}
+
+
+def test_fork_map_returns_every_item():
+    offset = 10
+    results = dict(fork_map(lambda item: item + offset, list(range(5)), workers=2, threads_per_worker=1))
+    assert results == {item: item + offset for item in range(5)}
+
+
+@pytest.mark.parametrize("extra", [{}, {"early_stopping": {"threshold": 0.05, "min_records": 4}}])
+def test_worker_pool_matches_single_process(make_runner, make_spec, extra):
+    spec = make_spec("parallel_sweep", "head_ablation", layers="all", heads="all", **extra)
+    single = make_runner(num_layers=4, batch_size=3, workers=1, threads_per_worker=1).run(spec)
+    single_arrays = _npz(single)
+    pooled = make_runner(num_layers=4, batch_size=3, workers=2, threads_per_worker=1).run(spec)
+
+    assert pooled.metadata["importance_ranking"] == single.metadata["importance_ranking"]
+    assert pooled.metadata[MANIFEST_KEY]["workers"] == {"count": 2, "threads_per_worker": 1}
+    for key, values in _npz(pooled).items():
+        np.testing.assert_allclose(values, single_arrays[key], rtol=1e-6, equal_nan=True)
+    if extra:
+        assert pooled.metadata["early_stopping"]["decisions"] == single.metadata["early_stopping"]["decisions"]
+    else:
+        assert pooled.metadata["residual_cache"]["hits"] == single.metadata["residual_cache"]["hits"]
@@ -0,0 +1,107 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_core.hooks import AblationKind, AblationRequest, HookPoint, HookSpec
+
+
+def test_registry_matches_per_forward_hooks_and_merges_points(make_manager):
+    manager = make_manager()
+    inputs = {"input_ids": torch.tensor([[1, 2, 3, 4]])}
+    attn = HookPoint(1, "self_attn")
+    spec = HookSpec(
+        record_points=[attn, HookPoint(1, "self_attn", head_idx=2), HookPoint(0, "mlp")],
+        ablate_points=[AblationRequest(attn, AblationKind.ATTENTION_HEAD, [0])],
+        interventions={HookPoint(0, "mlp"): lambda _module, tensor: tensor + 1.0},
+    )
+    with torch.no_grad():
+        expected, expected_acts = manager.forward_with_hooks(inputs, spec)
+        with manager.persistent_hooks() as registry:
+            outputs, activations = manager.forward_with_hooks(inputs, spec)
+            assert registry.installed_count == 2
+            plain, plain_acts = manager.forward_with_hooks(inputs, HookSpec())
+            assert registry.installed_count == 2
+        assert registry.installed_count == 0
+        bare = manager.load().model(**inputs)
+
+    assert torch.equal(outputs.logits, expected.logits)
+    assert activations.keys() == expected_acts.keys()
+    for key, tensor in expected_acts.items():
+        assert torch.equal(activations[key], tensor)
+    assert plain_acts == {}
+    assert torch.equal(plain.logits, bare.logits)
+
+
+@pytest.mark.parametrize("persistent", [False, True])
+def test_in_hook_reductions_match_host_pooling(make_manager, persistent):
+    np = pytest.importorskip("numpy")
+    from phi2_lab.phi2_experiments.runner import ExperimentRunner
+
+    manager = make_manager()
+    inputs = {
+        "input_ids": torch.tensor([[5, 6, 7, 8, 9], [3, 4, 2, 0, 0]]),
+        "attention_mask": torch.tensor([[1, 1, 1, 1, 1], [1, 1, 1, 0, 0]]),
+    }
+    full = HookPoint(1, "mlp")
+    reduced = {name: HookPoint(1, "mlp", reduction=name) for name in ("mean", "last", "max")}
+    reduced["positions"] = HookPoint(1, "mlp", reduction="positions", positions=(0, 2))
+    spec = HookSpec(record_points=[full, *reduced.values()], attention_mask=inputs["attention_mask"])
+    with torch.no_grad():
+        if persistent:
+            with manager.persistent_hooks():
+                _outputs, activations = manager.forward_with_hooks(inputs, spec)
+        else:
+            _outputs, activations = manager.forward_with_hooks(inputs, spec)
+        _outputs, unpadded = manager.forward_with_hooks(
+            {"input_ids": inputs["input_ids"][1:, :3]}, HookSpec(record_points=[full, reduced["mean"]])
+        )
+
+    hidden = activations[full.key()].numpy()
+    mask = inputs["attention_mask"].numpy().astype(bool)
+    assert activations[reduced["mean"].key()].shape == (2, hidden.shape[-1])
+    for row in range(2):
+        tokens = hidden[row][mask[row]]
+        np.testing.assert_allclose(activations[reduced["mean"].key()][row], tokens.mean(axis=0), rtol=1e-5, atol=1e-6)
+        np.testing.assert_array_equal(activations[reduced["last"].key()][row], tokens[-1])
+        np.testing.assert_array_equal(activations[reduced["max"].key()][row], tokens.max(axis=0))
+    np.testing.assert_array_equal(activations[reduced["positions"].key()], hidden[:, [0, 2]])
+    # Same values the numpy pooling of an unpadded full recording produces.
+    runner = ExperimentRunner(manager)
+    np.testing.assert_allclose(
+        unpadded[reduced["mean"].key()].reshape(-1),
+        runner._flatten_activation(unpadded[full.key()]),
+        rtol=1e-5,
+        atol=1e-6,
+    )
+    with pytest.raises(ValueError):
+        HookPoint(1, "mlp", reduction="median")
+
+
+@pytest.mark.parametrize("compile_model", [False, True])
+def test_record_activations_stops_after_deepest_recorded_block(make_manager, compile_model):
+    manager = make_manager(compile=compile_model)
+    model = manager.load().model
+    inputs = {"input_ids": torch.tensor([[1, 2, 3, 4]])}
+    spec = HookSpec(
+        record_points=[HookPoint(0, "self_attn"), HookPoint(0, "mlp", reduction="mean")],
+        ablate_points=[AblationRequest(HookPoint(0, "self_attn"), AblationKind.ATTENTION_HEAD, [1])],
+    )
+    calls = []
+    handles = [
+        module.register_forward_hook(lambda *_args, name=name: calls.append(name))
+        for name, module in (("layer1", model.layers[1]), ("lm_head", model.lm_head))
+    ]
+    try:
+        with torch.no_grad():
+            _outputs, expected = manager.forward_with_hooks(inputs, spec)
+            calls.clear()
+            activations = manager.record_activations(inputs, spec)
+    finally:
+        for handle in handles:
+            handle.remove()
+
+    assert calls == []
+    assert activations.keys() == expected.keys()
+    for key, tensor in expected.items():
+        assert torch.equal(activations[key], tensor)
+    assert manager.record_activations(inputs, HookSpec()) == {}
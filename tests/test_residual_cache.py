@@ -0,0 +1,45 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_core.hooks import HookSpec
+
+
+def _phi_shaped_model():
+    transformers = pytest.importorskip("transformers")
+    config = transformers.PhiConfig(
+        vocab_size=128,
+        hidden_size=64,
+        intermediate_size=128,
+        num_hidden_layers=4,
+        num_attention_heads=4,
+        max_position_embeddings=64,
+    )
+    return transformers.PhiForCausalLM(config)
+
+
+@pytest.mark.parametrize("model_factory", [None, _phi_shaped_model], ids=["mock", "phi_shaped"])
+def test_resumed_forwards_match_full_forward(make_runner, make_spec, model_factory):
+    spec = make_spec("residual_cache_check", "head_ablation", layers="all", heads="all")
+    full = make_runner(model=model_factory, batch_size=3, residual_cache_mb=0).run(spec)
+    cached = make_runner(model=model_factory, batch_size=3, residual_cache_mb=64).run(spec)
+
+    stats = cached.metadata["residual_cache"]
+    assert stats["hits"] > 0 and stats["entries"] > 0
+    assert "residual_cache" not in full.metadata
+    assert cached.per_head_metrics.keys() == full.per_head_metrics.keys()
+    for key, metrics in full.per_head_metrics.items():
+        for name in ("loss_delta", "accuracy_delta"):
+            assert cached.per_head_metrics[key][name] == pytest.approx(metrics[name], rel=1e-5, abs=1e-7)
+
+
+def test_forward_from_layer_reproduces_logits(make_manager):
+    manager = make_manager(model=_phi_shaped_model)
+    inputs = {
+        "input_ids": torch.tensor([[5, 6, 7, 8], [9, 10, 0, 0]]),
+        "attention_mask": torch.tensor([[1, 1, 1, 1], [1, 1, 0, 0]]),
+    }
+    with torch.no_grad():
+        outputs, _, hidden = manager.capture_block_inputs(inputs, HookSpec(), [2])
+        resumed, _ = manager.forward_from_layer(inputs, 2, hidden[2], HookSpec())
+    assert torch.allclose(resumed.logits, outputs.logits, atol=1e-5)
@@ -0,0 +1,90 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_experiments.result_cache import ResultCache
+from phi2_lab.phi2_experiments.runner import ExperimentRunner, load_and_run
+
+
+def test_identical_run_reuses_cached_result(tmp_path, monkeypatch, make_manager, make_spec):
+    monkeypatch.chdir(tmp_path)
+    manager = make_manager()
+    cache = ResultCache(tmp_path / "index.json")
+    spec_path = tmp_path / "spec.yaml"
+    spec = make_spec("result_cache", "head_ablation", layers=[0], heads=[0, 1])
+    spec_path.write_text(json.dumps(spec.to_dict()), encoding="utf-8")  # JSON is valid YAML
+    cold = load_and_run(spec_path, manager, result_cache=cache, record_limit=6)
+    run_calls = []
+    original_run = ExperimentRunner.run
+
+    def _counted_run(runner, spec):
+        run_calls.append(spec.id)
+        return original_run(runner, spec)
+
+    monkeypatch.setattr(ExperimentRunner, "run", _counted_run)
+
+    warm = load_and_run(spec_path, manager, result_cache=cache, record_limit=6)
+    assert run_calls == []
+    assert cache.stats()["hits"] == 1
+    assert warm.artifact_paths == {name: str(Path(path).resolve()) for name, path in cold.artifact_paths.items()}
+    assert warm.aggregated_metrics == cold.aggregated_metrics
+    assert warm.per_head_metrics == cold.per_head_metrics
+
+    load_and_run(spec_path, manager, result_cache=cache, record_limit=4)  # different limits
+    assert len(run_calls) == 1
+
+    shutil.rmtree(Path(cold.artifact_paths["result_json"]).parent)
+    load_and_run(spec_path, manager, result_cache=cache, record_limit=6)  # artifacts gone: recompute
+    assert len(run_calls) == 2
+    assert cache.stats() == {"index": str(cache.index_path), "hits": 1, "misses": 3}
+
+
+def test_activation_store_settings_are_part_of_the_key(tmp_path, make_runner, make_spec):
+    from phi2_lab.phi2_experiments.activation_store import ActivationStore
+
+    spec = make_spec("result_cache", "probe", layers=[0])
+    cache = ResultCache(tmp_path / "index.json")
+    stores = [None] + [ActivationStore(tmp_path / "store", 2**20, dtype) for dtype in ("float16", "float32")]
+    keys = {cache.key(**make_runner(activation_store=store)._result_identity(spec)) for store in stores}
+    assert len(keys) == 3
+
+
+def _save_checkpoint(path: Path) -> None:
+    """A tiny ``PhiForCausalLM`` checkpoint with a word-level tokenizer, written without network access."""
+
+    pytest.importorskip("tokenizers")
+    from tokenizers import Tokenizer
+    from tokenizers.models import WordLevel
+    from tokenizers.pre_tokenizers import Whitespace
+    from transformers import PhiConfig, PhiForCausalLM, PreTrainedTokenizerFast
+
+    tokenizer = Tokenizer(WordLevel({"[UNK]": 0, "[PAD]": 1}, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = Whitespace()
+    PreTrainedTokenizerFast(tokenizer_object=tokenizer, unk_token="[UNK]", pad_token="[PAD]").save_pretrained(path)
+    config = PhiConfig(vocab_size=32, hidden_size=16, intermediate_size=64, num_hidden_layers=2, num_attention_heads=2)
+    PhiForCausalLM(config).save_pretrained(path)
+
+
+def test_hit_on_a_local_checkpoint_does_not_load_the_model(tmp_path, monkeypatch, make_spec):
+    from phi2_lab.phi2_core.config import ModelConfig
+    from phi2_lab.phi2_core.model_manager import Phi2ModelManager
+
+    monkeypatch.chdir(tmp_path)
+    _save_checkpoint(tmp_path / "checkpoint")
+    config = ModelConfig(use_mock=False, model_name_or_path=str(tmp_path / "checkpoint"), local_cache_dir=None)
+    cache = ResultCache(tmp_path / "index.json")
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text(json.dumps(make_spec("result_cache", "head_ablation", layers=[0]).to_dict()), encoding="utf-8")
+    cold_manager = Phi2ModelManager(config)
+    cold = load_and_run(spec_path, cold_manager, result_cache=cache, record_limit=4)
+    assert cold_manager.checkpoint_identity() is not None  # a real checkpoint load, not the mock fallback
+
+    warm_manager = Phi2ModelManager(config)
+    warm = load_and_run(spec_path, warm_manager, result_cache=cache, record_limit=4)
+    assert not warm_manager.loaded
+    assert cache.stats()["hits"] == 1
+    assert warm.aggregated_metrics == cold.aggregated_metrics
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from phi2_lab.phi2_experiments.probes import ridge_weights, train_linear_probe, train_linear_probe_cv
+PENALTIES = [0.01, 0.1, 1.0, 10.0, 100.0]
+
+
+@pytest.mark.parametrize("records, dims", [(30, 80), (80, 30)])
+def test_dual_and_primal_forms_agree(records, dims):
+    rng = np.random.default_rng(0)
+    activations = rng.normal(size=(records, dims))
+    labels = rng.normal(size=records)
+    primal = np.linalg.solve(activations.T @ activations + 2.0 * np.eye(dims), activations.T @ labels)
+    np.testing.assert_allclose(ridge_weights(activations, labels, 2.0), primal, rtol=1e-8, atol=1e-10)
+
+
+@pytest.mark.parametrize("records, dims", [(30, 80), (80, 30)])
+def test_closed_form_cv_matches_refitting_each_fold(records, dims):
+    rng = np.random.default_rng(1)
+    activations = rng.normal(size=(records, dims))
+    labels = (activations[:, 0] + 0.5 * rng.normal(size=records) > 0).astype(np.float64)
+    probe, path = train_linear_probe_cv(activations, labels, PENALTIES, folds=4)
+
+    expected = []
+    for penalty in PENALTIES:
+        squared = 0.0
+        for fold in range(4):
+            held_out = np.arange(fold, records, 4)
+            kept = np.setdiff1d(np.arange(records), held_out)
+            refit = train_linear_probe(activations[kept], labels[kept], penalty)
+            squared += float(np.sum((refit.predict(activations[held_out]) - labels[held_out]) ** 2))
+        expected.append(squared / records)
+    np.testing.assert_allclose(path.cv_mse, expected, rtol=1e-8)
+    assert path.best_penalty == PENALTIES[int(np.argmin(expected))]
+    np.testing.assert_allclose(
+        probe.weights, train_linear_probe(activations, labels, path.best_penalty).weights, rtol=1e-6, atol=1e-10
+    )
+
+
+def test_probe_task_reports_selected_penalty(mock_runner, make_spec):
+    spec = make_spec(
+        "ridge_probe",
+        "probe",
+        hook_template={"layers": [1]},
+        probe_tasks=[{"name": "all_labels", "penalties": PENALTIES, "cv_folds": 3}],
+    )
+    result = mock_runner.run(spec)
+
+    task = result.aggregated_metrics["tasks"]["all_labels"]["layer1_mlp"]
+    assert task["penalty"] in PENALTIES
+    assert task["ridge_path"]["penalties"] == PENALTIES
+    assert len(task["ridge_path"]["cv_mse"]) == len(PENALTIES)
+    assert "ridge_path" not in result.aggregated_metrics["probe"]["layer1_mlp"]
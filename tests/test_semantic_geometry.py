@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_core.hooks import HookPoint, HookSpec
+from phi2_lab.phi2_experiments.spec import ExperimentSpec
+
+PAIRS = [
+    ["dog", "animal"],
+    ["cat", "animal"],
+    ["oak tree", "tree"],
+    ["dog", "puppy"],
+    ["big old oak tree", "oak tree"],
+]
+
+
+def test_word_table_matches_per_word_forwards(monkeypatch, make_runner):
+    runner = make_runner(num_layers=2, batch_size=3)
+    manager = runner.model_manager
+    forwards = []
+    record = runner._record_with_spec
+    monkeypatch.setattr(runner, "_record_with_spec", lambda *args: forwards.append(1) or record(*args))
+    spec = ExperimentSpec.from_dict(
+        {
+            "id": "semantic_pairs",
+            "type": "semantic_geometry",
+            "relation": "hypernym",
+            "word_pairs": PAIRS,
+            "hooks": [
+                {"name": "layer0_self_attn", "point": {"layer": 0, "component": "self_attn"}},
+                {"name": "layer1_mlp", "point": {"layer": 1, "component": "mlp"}},
+            ],
+        }
+    )
+    result = runner.run(spec)
+
+    vocab = list(dict.fromkeys(word for pair in PAIRS for word in pair))
+    assert result.metadata["unique_words"] == len(vocab) == 7
+    assert len(forwards) == -(-len(vocab) // runner.batch_size)
+
+    tokenizer = manager.load().tokenizer
+    for pair in PAIRS:
+        vectors = []
+        for word in pair:
+            _, activations = manager.forward_with_hooks(
+                tokenizer(word, return_tensors="pt"), HookSpec(record_points=[HookPoint(1, "mlp")])
+            )
+            vectors.append(activations["layer1.mlp"].detach().mean(dim=1).reshape(-1).numpy())
+        metrics = result.aggregated_metrics["semantic_geometry"][f"{pair[0]}_{pair[1]}"]["layer1_mlp"]
+        expected_cosine = vectors[0] @ vectors[1] / (np.linalg.norm(vectors[0]) * np.linalg.norm(vectors[1]) + 1e-8)
+        assert metrics["cosine_similarity"] == pytest.approx(float(expected_cosine), abs=1e-5)
+        assert metrics["euclidean_distance"] == pytest.approx(float(np.linalg.norm(vectors[0] - vectors[1])), rel=1e-5)
+        assert metrics["norm_word1"] == pytest.approx(float(np.linalg.norm(vectors[0])), rel=1e-5)
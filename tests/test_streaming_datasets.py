@@ -0,0 +1,56 @@
+import json
+import tracemalloc
+from itertools import islice
+
+import pytest
+
+from phi2_lab.phi2_experiments.datasets import iter_dataset, load_dataset_with_limit
+from phi2_lab.phi2_experiments.spec import DatasetSpec
+
+
+def _write_jsonl(path, rows: int, padding: int = 0) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        for idx in range(rows):
+            handle.write(json.dumps({"input": f"record {idx} " + "x" * padding, "label": idx % 2}) + "\n")
+
+
+@pytest.mark.parametrize("num_shards", [1, 2, 3, 7])
+def test_shards_partition_jsonl_and_csv_in_order(tmp_path, num_shards):
+    jsonl = tmp_path / "data.jsonl"
+    _write_jsonl(jsonl, rows=50, padding=7)
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("input,label\n" + "".join(f"row {idx},{idx}\n" for idx in range(23)), encoding="utf-8")
+
+    for path, fmt in ((jsonl, "jsonl"), (csv_path, "csv")):
+        spec = DatasetSpec(name="sharded", path=str(path), format=fmt)
+        full = load_dataset_with_limit(spec)
+        shards = [load_dataset_with_limit(spec, shard_index=idx, num_shards=num_shards) for idx in range(num_shards)]
+        assert [record for shard in shards for record in shard] == full
+    assert load_dataset_with_limit(DatasetSpec(name="csv", path=str(csv_path), format="csv"))[0].input_text == "row 0"
+
+
+def test_streaming_large_jsonl_uses_constant_memory(tmp_path):
+    path = tmp_path / "large.jsonl"
+    line = json.dumps({"input": "token " * 170, "label": 1}) + "\n"
+    chunk = line * 1024
+    with path.open("w", encoding="utf-8") as handle:
+        for _ in range(256 * 2**20 // len(chunk)):
+            handle.write(chunk)
+    assert path.stat().st_size > 250 * 2**20
+    spec = DatasetSpec(name="large", path=str(path))
+
+    tracemalloc.start()
+    try:
+        head = load_dataset_with_limit(spec, max_records=10)
+        _, limited_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        count = sum(1 for _ in iter_dataset(spec, shard_index=3, num_shards=8))
+        _, streaming_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(head) == 10
+    assert count == pytest.approx(path.stat().st_size / len(line) / 8, abs=1)
+    assert limited_peak < 2**20
+    assert streaming_peak < 2**20
+    assert next(islice(iter_dataset(spec, shard_index=7, num_shards=8), 0, None)).label == 1
@@ -0,0 +1,77 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_experiments.checkpoint import CHECKPOINT_FILE
+from phi2_lab.phi2_experiments.runner import MANIFEST_KEY
+
+RUNNER = {"num_layers": 4, "batch_size": 3}
+
+
+@pytest.fixture
+def spec(make_spec):
+    return make_spec("checkpoint_sweep", "head_ablation", layers="all", heads="all")
+
+
+def _npz(result) -> dict:
+    with np.load(result.artifact_paths["per_example"]) as data:
+        return {key: data[key] for key in data.files}
+
+
+def test_resumed_sweep_matches_uninterrupted_run(tmp_path, monkeypatch, make_runner, spec):
+    (tmp_path / "full").mkdir()
+    monkeypatch.chdir(tmp_path / "full")
+    full = make_runner(**RUNNER).run(spec)
+    full_arrays = _npz(full)
+
+    (tmp_path / "resumed").mkdir()
+    monkeypatch.chdir(tmp_path / "resumed")
+    interrupted = make_runner(**RUNNER)
+    layer_forward = interrupted._execute_layer_forward
+
+    def killed_partway(inputs, hook_spec, layer_idx, residual_cache, batch_idx, **kwargs):
+        if layer_idx == 2 and batch_idx == 1:
+            raise KeyboardInterrupt
+        return layer_forward(inputs, hook_spec, layer_idx, residual_cache, batch_idx, **kwargs)
+
+    monkeypatch.setattr(interrupted, "_execute_layer_forward", killed_partway)
+    with pytest.raises(KeyboardInterrupt):
+        interrupted.run(spec)
+    (run_dir,) = (Path("results") / "experiments" / spec.id).iterdir()
+    with (run_dir / CHECKPOINT_FILE).open("a", encoding="utf-8") as handle:
+        handle.write('{"kind": "block", "layer": 2, "losses": [[0.1')  # torn write at the moment of the kill
+
+    resumed_runner = make_runner(**RUNNER, resume_dir=run_dir)
+    forwarded_layers = []
+    layer_forward = resumed_runner._execute_layer_forward
+
+    def counting(inputs, hook_spec, layer_idx, *args, **kwargs):
+        forwarded_layers.append(layer_idx)
+        return layer_forward(inputs, hook_spec, layer_idx, *args, **kwargs)
+
+    monkeypatch.setattr(resumed_runner, "_execute_layer_forward", counting)
+    resumed = resumed_runner.run(spec)
+
+    assert set(forwarded_layers) == {2, 3}
+    assert Path(resumed.artifact_paths["result_json"]).parent == run_dir
+    assert resumed.metadata[MANIFEST_KEY]["resumed_from"] == str(run_dir)
+    assert resumed.aggregated_metrics == full.aggregated_metrics
+    assert resumed.per_head_metrics == full.per_head_metrics
+    assert resumed.metadata["importance_ranking"] == full.metadata["importance_ranking"]
+    assert resumed.metadata["per_example_preview"] == full.metadata["per_example_preview"]
+    resumed_arrays = _npz(resumed)
+    assert resumed_arrays.keys() == full_arrays.keys()
+    for key in full_arrays:
+        np.testing.assert_array_equal(resumed_arrays[key], full_arrays[key])
+
+
+def test_resume_rejects_changed_sweep(make_runner, spec):
+    make_runner(**RUNNER).run(spec)
+    (run_dir,) = (Path("results") / "experiments" / spec.id).iterdir()
+
+    runner = make_runner(**RUNNER, resume_dir=run_dir, record_limit=4)
+    with pytest.raises(ValueError, match="records"):
+        runner.run(spec)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_experiments.runner import MANIFEST_KEY
+from phi2_lab.phi2_experiments.token_cache import TokenizedDatasetCache
+
+
+def test_repeat_runs_are_served_from_tokenized_cache(tmp_path, make_runner, make_spec):
+    spec = make_spec("token_cache_head_ablation", "head_ablation", layers=[0], heads=[0, 1])
+    runner = make_runner(batch_size=4)
+    assert runner.token_cache is None
+    runner.token_cache = TokenizedDatasetCache(tmp_path / "tokenized", max_bytes=2**20)
+
+    first = runner.run(spec)
+    second = runner.run(spec)
+
+    assert first.metadata[MANIFEST_KEY]["tokenized_cache"]["misses"] == 1
+    assert first.metadata[MANIFEST_KEY]["tokenized_cache"]["hits"] == 0
+    assert second.metadata[MANIFEST_KEY]["tokenized_cache"]["hits"] == 1
+    assert second.metadata[MANIFEST_KEY]["tokenized_cache"]["misses"] == 0
+    assert second.aggregated_metrics == first.aggregated_metrics
+    assert second.per_head_metrics == first.per_head_metrics
+
+    fresh = make_runner(token_cache=TokenizedDatasetCache(tmp_path / "tokenized", max_bytes=2**20), record_limit=4)
+    fresh.run(spec)
+    assert fresh.token_cache.stats()["hits"] == 1
+
+    fresh.max_length = 4
+    fresh.run(spec)
+    assert fresh.token_cache.stats()["misses"] == 1
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    rows = [(np.arange(64, dtype=np.int32), 64)] * 4  # 1 KiB of tokens plus the index per entry
+    cache = TokenizedDatasetCache(tmp_path, max_bytes=3 * 1024)
+    cache.store("a", rows)
+    cache.store("b", rows)
+    assert cache.load("a", 4) is not None  # refreshes "a", leaving "b" least recently used
+    cache.store("c", rows)
+
+    assert cache.load("b", 4) is None
+    assert cache.load("a", 4) is not None and cache.load("c", 4) is not None
+    assert cache.evictions == 1
+    assert cache.size_bytes() <= 3 * 1024
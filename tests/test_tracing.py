@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from phi2_lab.phi2_experiments.runner import MANIFEST_KEY
+from phi2_lab.utils.tracing import Tracer, active_tracer, span, tracing
+
+HOOKS = {"components": ["mlp"], "layers": [0]}
+
+
+@pytest.mark.parametrize(
+    "experiment_type, fields, stages",
+    [
+        (
+            "head_ablation",
+            {"layers": [0, 1], "heads": [0, 1]},
+            {"tokenize", "baseline", "sweep.layer", "forward", "hooks.register", "metrics", "aggregate"},
+        ),
+        ("probe", {"hook_template": HOOKS}, {"forward", "probe.fit"}),
+        ("geometry", {"hook_template": HOOKS}, {"forward", "geometry.pca"}),
+    ],
+)
+def test_run_records_stage_spans(tmp_path, make_runner, make_spec, experiment_type, fields, stages):
+    spec = make_spec(f"tracing_{experiment_type}", experiment_type, **fields)
+    runner = make_runner(tracer=Tracer())
+    result = runner.run(spec)
+
+    summary = result.metadata[MANIFEST_KEY]["trace"]
+    assert stages <= set(summary)
+    assert all(row["calls"] >= 1 and row["total_ms"] >= row["max_ms"] >= row["mean_ms"] for row in summary.values())
+    trace = runner.tracer.write_chrome_trace(tmp_path / "trace.json")
+    events = json.loads(trace.read_text(encoding="utf-8"))["traceEvents"]
+    run = next(event for event in events if event["name"] == "run")
+    assert run["args"] == {"spec": spec.id, "type": spec.type.value}
+    assert {"log_result", *stages} <= {event["name"] for event in events}
+    for event in events:
+        assert event["ph"] == "X"
+        assert run["ts"] <= event["ts"] and event["ts"] + event["dur"] <= run["ts"] + run["dur"] + 1e-3
+    assert active_tracer() is None
+
+
+def test_spans_are_shared_no_ops_without_active_tracer():
+    assert span("forward") is span("metrics", layer=3)
+    tracer = Tracer()
+    with tracing(tracer):
+        with span("outer"), span("inner", layer=1):
+            pass
+        with tracing(None):
+            with span("still_active"):
+                pass
+    with span("ignored"):
+        pass
+    assert [event["name"] for event in tracer.events] == ["inner", "outer", "still_active"]
+    assert tracer.events[0]["args"] == {"layer": 1}
+    assert list(tracer.summary(since=2)) == ["still_active"]